@@ -6,8 +6,6 @@ import numpy as np
 from typing import List, Tuple, Dict, Optional, Set
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
 import docx2txt
 import PyPDF2
 import re
@@ -15,9 +13,12 @@ import pandas as pd
 import json
 import logging
 from datetime import datetime
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 import networkx as nx
 import spacy
+from skill_clusters import SkillClusterIndex, load_skill_vocabulary
+from artifact_bundle import get_bundle
+from skill_demand_cube import get_demand_cube
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,6 +30,7 @@ class IndustrySkillDatabase:
         self.db_path = db_path
         self.skill_taxonomy = self._load_skill_taxonomy()
         self.industry_mappings = self._load_industry_mappings()
+        self.demand_cube = get_demand_cube()
         self.skill_evolution_trends = self._load_skill_trends()
         self.job_market_data = self._load_job_market_data()
 
@@ -76,7 +78,16 @@ class IndustrySkillDatabase:
         }
 
     def _load_skill_trends(self) -> Dict:
-        """Updated trends with Indian market focus"""
+        """Trends from the demand cube (emerging vs. established skills), with the Indian market defaults as fallback"""
+        if self.demand_cube is not None and self.demand_cube.skills:
+            cube, tiers = self.demand_cube, self.demand_cube.demand_tiers()
+            emerging = cube.emerging_skills()
+            trend = lambda skill: {"growth_rate": cube.growth_rate(skill), "market_demand": tiers.get(skill, "low"),
+                                   "postings": cube.skill_count(skill)}
+            return {
+                "trending_up": {skill: trend(skill) for skill in emerging},
+                "stable": {skill: trend(skill) for skill, tier in tiers.items() if tier == "high" and skill not in emerging}
+            }
         return {
             "trending_up": {
                 "artificial intelligence": {"growth_rate": 0.40, "market_demand": "very_high"},
@@ -87,8 +98,8 @@ class IndustrySkillDatabase:
         }
 
     def _load_job_market_data(self) -> Dict:
-        """India-specific salary and demand data"""
-        return {
+        """India-specific salary data; demand tiers come from the demand cube when it is available"""
+        market_data = {
             "salary_ranges": {
                 "artificial intelligence": {"entry": 600000, "mid": 1200000, "senior": 2000000},
                 "cloud computing": {"entry": 500000, "mid": 1000000, "senior": 1800000}
@@ -99,6 +110,12 @@ class IndustrySkillDatabase:
                 "low_demand": ["perl", "fortran"]
             }
         }
+        if self.demand_cube is not None and self.demand_cube.skills:
+            tiers = self.demand_cube.demand_tiers()
+            market_data["job_availability"] = {f"{tier}_demand": [s for s, t in tiers.items() if t == tier]
+                                               for tier in ("high", "medium", "low")}
+            market_data["emerging_skills"] = self.demand_cube.emerging_skills()
+        return market_data
 
 class AdvancedSkillSpanDataset(Dataset):
     """Enhanced dataset with contextual embeddings"""
@@ -125,6 +142,63 @@ class AdvancedSkillSpanDataset(Dataset):
             "labels": torch.tensor(label_ids)
         }
 
+class HeadNounPhraseDetector:
+    """Linear-time skill phrase detector.
+
+    Scans tokens once, keeping a bounded window of modifier tokens since the last
+    stopword or punctuation mark, and emits ``window + head`` whenever a head noun
+    (e.g. "framework") appears. Candidates never exceed ``max_tokens`` tokens.
+    """
+    # Dots inside a token are kept ("react.js", "asp.net"); a trailing dot is punctuation
+    TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9+#]+)*|[^\sa-z0-9+#]")
+    DEFAULT_HEADS = ("programming", "framework", "frameworks", "tool", "tools")
+    STOPWORDS = frozenset({
+        "a", "an", "and", "or", "the", "of", "in", "on", "at", "to", "for", "with", "by", "from", "as", "is", "are",
+        "was", "were", "be", "been", "using", "used", "use", "like", "such", "including", "via", "into", "my", "our",
+        "i", "we", "also", "plus", "etc", "experience", "experienced", "knowledge", "skilled", "proficient", "familiar", "worked", "working"
+    })
+
+    def __init__(self, head_nouns=DEFAULT_HEADS, max_tokens: int = 4, max_chars: int = 200_000):
+        self.head_nouns = frozenset(h.lower() for h in head_nouns)
+        self.max_tokens = max_tokens
+        self.max_chars = max_chars
+
+    def detect(self, text: str) -> List[str]:
+        phrases = []
+        window = deque(maxlen=self.max_tokens - 1)
+        for match in self.TOKEN_PATTERN.finditer(text[:self.max_chars].lower()):
+            token = match.group()
+            if token in self.head_nouns:
+                if window:
+                    phrases.append(" ".join(window) + " " + token)
+                window.clear()
+            elif token in self.STOPWORDS or not (token[0].isalnum() or token[0] in "+#"):
+                window.clear()
+            else:
+                window.append(token)
+        return list(dict.fromkeys(phrases))
+
+def flatten_taxonomy(taxonomy: Dict) -> List[str]:
+    """Every skill in the nested taxonomy, deduplicated in first-seen order"""
+    all_skills = []
+    for category in taxonomy.values():
+        if isinstance(category, dict):
+            for subcategory in category.values():
+                if isinstance(subcategory, dict):
+                    for skill_list in subcategory.values():
+                        all_skills.extend(skill_list)
+                elif isinstance(subcategory, list):
+                    all_skills.extend(subcategory)
+    return list(dict.fromkeys(all_skills))
+
+def similarity_edges(embeddings: np.ndarray, threshold: float = 0.7) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairs (i < j) whose cosine similarity exceeds ``threshold``, with their similarities"""
+    if len(embeddings) == 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.float32)
+    similarities = cosine_similarity(embeddings)
+    i, j = np.nonzero(np.triu(similarities > threshold, k=1))
+    return np.stack([i, j], axis=1).astype(np.int64), similarities[i, j].astype(np.float32)
+
 class IndustrySkillExtractor:
     """Advanced skill extraction with industry-level analysis"""
     def __init__(self, model_name="dslim/bert-base-NER", sentence_model='all-MiniLM-L6-v2', spacy_model="en_core_web_sm"):
@@ -133,28 +207,41 @@ class IndustrySkillExtractor:
         self.bi_encoder = SentenceTransformer(sentence_model)
         self.skill_db = IndustrySkillDatabase()
         self.skill_embeddings_cache = {}
-        self._build_skill_embeddings()
+        self.phrase_detector = HeadNounPhraseDetector()
         try:
             self.nlp = spacy.load(spacy_model)
         except OSError:
             logger.warning(f"Spacy model {spacy_model} not found. Install with: python -m spacy download {spacy_model}")
             self.nlp = None
-        self.skill_graph = self._build_skill_graph()
+        # Warm start from the artifact bundle when it was built with the same encoder
+        bundle = get_bundle()
+        if bundle is not None and bundle.manifest.get("encoder") != sentence_model:
+            bundle = None
+        if bundle is not None and bundle.has("taxonomy_embeddings"):
+            self.skill_embeddings_cache = dict(zip(bundle.json("taxonomy_skills"), bundle.array("taxonomy_embeddings")))
+            self.skill_graph = self._build_skill_graph(bundle.array("taxonomy_edges"), bundle.array("taxonomy_edge_weights"))
+        else:
+            self._build_skill_embeddings()
+            self.skill_graph = self._build_skill_graph()
+        self.cluster_index = self._load_cluster_index(bundle)
+
+    def _load_cluster_index(self, bundle) -> Optional[SkillClusterIndex]:
+        """Prebuilt skill clusters for the current vocabulary (bundle, else Models/); clustering is skipped rather than fitted here"""
+        vocabulary = load_skill_vocabulary(self.skill_db.skill_taxonomy)
+        index = None
+        if bundle is not None and bundle.has("skill_clusters"):
+            index = SkillClusterIndex.load(bundle.path_of("skill_clusters"), bundle.path_of("skill_cluster_assignments"), vocabulary)
+        index = index or SkillClusterIndex.load(vocabulary=vocabulary)
+        if index is None:
+            logger.warning("No skill cluster index for the current vocabulary; run build_artifacts.py or skill_clusters.py to enable clustering")
+        return index
 
     def _build_skill_embeddings(self):
-        all_skills = []
-        for category in self.skill_db.skill_taxonomy.values():
-            if isinstance(category, dict):
-                for subcategory in category.values():
-                    if isinstance(subcategory, dict):
-                        for skill_list in subcategory.values():
-                            all_skills.extend(skill_list)
-                    elif isinstance(subcategory, list):
-                        all_skills.extend(subcategory)
+        all_skills = flatten_taxonomy(self.skill_db.skill_taxonomy)
         embeddings = self.bi_encoder.encode(all_skills)
         self.skill_embeddings_cache = dict(zip(all_skills, embeddings))
 
-    def _build_skill_graph(self) -> nx.Graph:
+    def _build_skill_graph(self, edges: Optional[np.ndarray] = None, weights: Optional[np.ndarray] = None) -> nx.Graph:
         G = nx.Graph()
         for category_name, category in self.skill_db.skill_taxonomy.items():
             if isinstance(category, dict):
@@ -166,15 +253,11 @@ class IndustrySkillExtractor:
                     elif isinstance(subcategory, list):
                         for skill in subcategory:
                             G.add_node(skill, category=category_name, subcategory=subcategory_name)
-        skills = list(G.nodes())
-        for i, skill1 in enumerate(skills):
-            for skill2 in skills[i+1:]:
-                if skill1 in self.skill_embeddings_cache and skill2 in self.skill_embeddings_cache:
-                    similarity = cosine_similarity(
-                        [self.skill_embeddings_cache[skill1]], [self.skill_embeddings_cache[skill2]]
-                    )[0][0]
-                    if similarity > 0.7:
-                        G.add_edge(skill1, skill2, weight=similarity)
+        skills = [s for s in self.skill_embeddings_cache if s in G]
+        if edges is None:
+            edges, weights = similarity_edges(np.array([self.skill_embeddings_cache[s] for s in skills]))
+        for (i, j), weight in zip(np.asarray(edges), np.asarray(weights)):
+            G.add_edge(skills[i], skills[j], weight=float(weight))
         return G
 
     def _extract_ner_skills(self, text: str) -> List[str]:
@@ -198,9 +281,8 @@ class IndustrySkillExtractor:
         return []
 
     def _extract_pattern_skills(self, text: str) -> List[str]:
-        """Extract skills using regex patterns"""
-        patterns = [r"\b\w+(?:\s+\w+)*(?:programming|framework|tool)\b"]
-        return [match.group() for pattern in patterns for match in re.finditer(pattern, text.lower())]
+        """Extract skill phrases ending in head nouns like "framework" or "tool" """
+        return self.phrase_detector.detect(text)
 
     def _score_skills(self, skills: List[str], text: str, industry: Optional[str] = None) -> Dict[str, float]:
         """Score skills based on context and demand"""
@@ -216,15 +298,10 @@ class IndustrySkillExtractor:
         return scores
 
     def _analyze_skill_clusters(self, skills: List[str]) -> Dict:
-        """Cluster skills for advanced analysis"""
-        if not skills:
+        """Group skills by their precomputed vocabulary cluster (stable ids across resumes)"""
+        if not skills or self.cluster_index is None:
             return {}
-        embeddings = self.bi_encoder.encode(skills)
-        scaler = StandardScaler()
-        scaled_embs = scaler.fit_transform(embeddings)
-        kmeans = KMeans(n_clusters=min(3, len(skills)), random_state=42)
-        clusters = kmeans.fit_predict(scaled_embs)
-        return {i: [skills[j] for j in range(len(skills)) if clusters[j] == i] for i in range(kmeans.n_clusters)}
+        return self.cluster_index.assign(skills, self.bi_encoder, self.skill_embeddings_cache)
 
     def _analyze_industry_fit(self, skills: List[str], industry: Optional[str] = None) -> Dict:
         """Analyze industry fit with weights"""
@@ -236,9 +313,20 @@ class IndustrySkillExtractor:
         return {"fit_score": min(fit_score * 100, 100), "industry": industry}
 
     def _analyze_market_value(self, skills: List[str]) -> Dict:
-        """Analyze market value based on trends"""
+        """Analyze market value from posting demand (demand cube tiers, else the static lists)"""
+        value = {"high_demand": [], "medium_demand": [], "low_demand": [], "emerging": []}
+        cube = self.skill_db.demand_cube
+        if cube is not None and cube.skills:
+            tiers = cube.demand_tiers()
+            emerging = set(self.skill_db.job_market_data.get("emerging_skills", []))
+            for skill in skills:
+                tier = tiers.get(skill.lower())
+                if tier is not None:
+                    value[f"{tier}_demand"].append(skill)
+                if skill.lower() in emerging:
+                    value["emerging"].append(skill)
+            return value
         market_data = self.skill_db.job_market_data
-        value = {"high_demand": [], "medium_demand": [], "low_demand": []}
         for skill in skills:
             if skill in market_data["job_availability"]["high_demand"]:
                 value["high_demand"].append(skill)
@@ -262,6 +350,36 @@ class IndustrySkillExtractor:
         gaps = self._identify_skill_gaps(skills, industry)
         return [{"skill": gap, "priority": 80, "resource": f"Learn {gap} on Coursera"} for gap in gaps[:3]]
 
+    def extract_section_features(self, sections: List[str], industry: Optional[str] = None) -> List[Dict]:
+        """Model outputs for each resume section on its own: the cacheable part of extract_skills_advanced.
+
+        Sections are encoded and parsed in one batch; entity spans are relative to each section.
+        """
+        if not sections:
+            return []
+        embeddings = self.bi_encoder.encode(sections)
+        skills = list(self.skill_embeddings_cache.keys())
+        similarities = cosine_similarity(embeddings, np.array(list(self.skill_embeddings_cache.values())))
+        nlp = self.nlp if self.nlp else spacy.load("en_core_web_sm")
+        features = []
+        for text, embedding, row, doc in zip(sections, embeddings, similarities, nlp.pipe(sections)):
+            features.append({
+                "ner_skills": [ent.text for ent in doc.ents if ent.label_ in ["SKILL", "TECH"]],
+                "semantic_skills": [skills[i] for i in np.where(row > 0.7)[0]],
+                "contextual_skills": self._extract_contextual_skills(text, industry),
+                "pattern_skills": self._extract_pattern_skills(text),
+                "entities": [(ent.start_char, ent.end_char, ent.label_) for ent in doc.ents],
+                "embedding": embedding,
+            })
+        return features
+
+    def merge_section_features(self, features: List[Dict], text: str, industry: Optional[str] = None) -> Dict:
+        """Combine per-section outputs into the extract_skills_advanced report for the whole resume"""
+        all_skills = list(set(skill for f in features
+                              for key in ("ner_skills", "semantic_skills", "contextual_skills", "pattern_skills")
+                              for skill in f[key]))
+        return self._skill_report(all_skills, text, industry)
+
     def extract_skills_advanced(self, text: str, industry: Optional[str] = None) -> Dict:
         """Advanced skill extraction pipeline"""
         basic_skills = self._extract_ner_skills(text)
@@ -269,6 +387,9 @@ class IndustrySkillExtractor:
         contextual_skills = self._extract_contextual_skills(text, industry)
         pattern_skills = self._extract_pattern_skills(text)
         all_skills = list(set(basic_skills + semantic_skills + contextual_skills + pattern_skills))
+        return self._skill_report(all_skills, text, industry)
+
+    def _skill_report(self, all_skills: List[str], text: str, industry: Optional[str] = None) -> Dict:
         return {
             "extracted_skills": all_skills,
             "skill_scores": self._score_skills(all_skills, text, industry),
@@ -4,29 +4,20 @@ import numpy as np
 import re
 import time
 from datetime import datetime
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 import io
 import base64
+import hashlib
 import json
+from role_model import ROLE_MODEL
+from resume_features import RESUME_FEATURES
+from stage_executor import StageGraph
+from ml_runtime import MLRuntime
+from report_builder import REPORT_WRITERS, get_report_queue, render_report
+from result_store import get_result_store
 
-# Initialize ML_AVAILABLE globally
-ML_AVAILABLE = False
-
-# Import ML modules
-try:
-    from advanced_skill_extractor import IndustrySkillExtractor
-    from gnn_skill_predictor import GINXMLC, predict_missing_skills, graph_dict_to_data
-    from enhanced_placement_forecaster import forecast_placement
-    from data_synthesizer import load_pre_generated_data, load_skills_from_dataset
-    from placement_predictor import predict_placement
-    ML_AVAILABLE = True
-    print("ML modules loaded successfully in terminal")
-except ImportError as e:
-    st.warning(f"ML modules not fully loaded: {e}. Running in basic mode.")
-    print(f"ML modules failed to load: {e}")
+# Plotly and the ML modules are imported on first use so the first frame renders quickly;
+# profile with `python src/startup_profiler.py app_enhanced`
 
 # ==================== CONFIGURATION ====================
 st.set_page_config(
@@ -44,8 +35,8 @@ st.set_page_config(
 # ==================== SESSION STATE MANAGEMENT ====================
 if 'analysis_complete' not in st.session_state:
     st.session_state.analysis_complete = False
-if 'analysis_results' not in st.session_state:
-    st.session_state.analysis_results = None
+if 'analysis_handle' not in st.session_state:
+    st.session_state.analysis_handle = None
 if 'target_role' not in st.session_state:
     st.session_state.target_role = "Software Engineer"
 
@@ -64,17 +55,22 @@ def load_datasets():
     except FileNotFoundError:
         datasets['courses'] = create_fallback_courses_data()
     
-    # Load pre-generated data if ML is available
-    if ML_AVAILABLE:
-        try:
-            datasets['skills_data'] = load_skills_from_dataset()
-            datasets['pre_generated'] = load_pre_generated_data()
-        except Exception as e:
-            datasets['skills_data'] = []
-            datasets['pre_generated'] = {}
+    # Load pre-generated data for the ML path
+    try:
+        from data_synthesizer import load_pre_generated_data, load_skills_from_dataset
+        datasets['skills_data'] = load_skills_from_dataset()
+        datasets['pre_generated'] = load_pre_generated_data()
+    except Exception as e:
+        datasets['skills_data'] = []
+        datasets['pre_generated'] = {}
     
     return datasets
 
+@st.cache_resource
+def get_ml_runtime():
+    """Start loading the extractor and int8 GNN in the background once per server process"""
+    return MLRuntime().start()
+
 def create_fallback_courses_data():
     """Create fallback course data"""
     return pd.DataFrame({
@@ -870,138 +866,29 @@ CERTIFICATIONS
     except Exception as e:
         return f"Error extracting text: {str(e)}"
 
-def get_role_requirements():
-    """Enhanced role requirements with comprehensive skill mapping"""
-    return {
-        "Software Engineer": {
-            "core_skills": ["python", "java", "javascript", "git", "data structures", "algorithms", "oop", "problem solving"],
-            "frameworks": ["react", "node.js", "django", "spring boot", "express", "flask"],
-            "databases": ["sql", "mysql", "mongodb", "postgresql", "redis"],
-            "tools": ["docker", "aws", "linux", "postman", "jenkins", "kubernetes"],
-            "concepts": ["rest api", "microservices", "testing", "version control", "ci/cd", "agile"]
-        },
-        "Data Scientist": {
-            "core_skills": ["python", "r", "sql", "statistics", "machine learning", "data analysis", "mathematics"],
-            "libraries": ["pandas", "numpy", "matplotlib", "seaborn", "scikit-learn", "tensorflow", "pytorch"],
-            "tools": ["jupyter", "tableau", "power bi", "excel", "git", "spark"],
-            "databases": ["sql", "mongodb", "hadoop", "hive"],
-            "concepts": ["data mining", "deep learning", "nlp", "computer vision", "big data", "feature engineering"]
-        },
-        "Frontend Developer": {
-            "core_skills": ["html", "css", "javascript", "typescript", "react", "responsive design"],
-            "frameworks": ["vue.js", "angular", "next.js", "bootstrap", "tailwind", "sass"],
-            "tools": ["git", "webpack", "npm", "yarn", "figma", "vscode"],
-            "concepts": ["spa", "pwa", "accessibility", "performance optimization", "seo", "ux/ui"],
-            "testing": ["jest", "cypress", "testing library", "unit testing"]
-        },
-        "Full Stack Developer": {
-            "frontend": ["html", "css", "javascript", "react", "vue.js", "angular"],
-            "backend": ["node.js", "python", "java", "express", "django", "spring"],
-            "databases": ["mysql", "mongodb", "postgresql", "redis"],
-            "tools": ["git", "docker", "aws", "heroku", "nginx"],
-            "concepts": ["rest api", "graphql", "authentication", "deployment", "testing", "devops"]
-        },
-        "Mobile App Developer": {
-            "platforms": ["android", "ios", "react native", "flutter", "kotlin"],
-            "languages": ["java", "kotlin", "swift", "dart", "javascript"],
-            "tools": ["android studio", "xcode", "firebase", "git", "figma"],
-            "concepts": ["ui/ux", "api integration", "local storage", "push notifications", "app store"],
-            "testing": ["unit testing", "ui testing", "device testing", "integration testing"]
-        },
-        "Artificial Intelligence": {
-            "core_skills": ["python", "machine learning", "deep learning", "neural networks", "mathematics"],
-            "frameworks": ["tensorflow", "pytorch", "keras", "scikit-learn", "opencv"],
-            "concepts": ["nlp", "computer vision", "reinforcement learning", "gans", "transformers"],
-            "tools": ["jupyter", "git", "docker", "cuda", "colab"],
-            "applications": ["image recognition", "text generation", "speech processing", "recommendation systems"]
-        },
-        "Blockchain": {
-            "platforms": ["ethereum", "hyperledger", "binance smart chain", "solana", "polygon"],
-            "languages": ["solidity", "javascript", "go", "rust", "python"],
-            "tools": ["truffle", "remix", "metamask", "ganache", "git", "hardhat"],
-            "concepts": ["smart contracts", "defi", "consensus algorithms", "tokenization", "cryptography"],
-            "testing": ["smart contract auditing", "security testing", "unit testing"]
-        },
-        "VR & AR": {
-            "platforms": ["oculus", "hololens", "unity", "unreal engine", "vuforia"],
-            "languages": ["c#", "c++", "javascript", "python"],
-            "tools": ["unity", "unreal engine", "blender", "git", "ar foundation", "arkit"],
-            "concepts": ["3d modeling", "spatial computing", "gesture recognition", "immersive design"],
-            "testing": ["usability testing", "performance testing", "device compatibility"]
-        },
-        "Big Data": {
-            "platforms": ["hadoop", "spark", "kafka", "aws", "azure"],
-            "languages": ["python", "scala", "java", "sql", "r"],
-            "tools": ["apache spark", "hadoop", "hive", "pig", "tableau", "jupyter"],
-            "concepts": ["data lakes", "etl", "real-time processing", "data warehousing", "distributed computing"],
-            "testing": ["data validation", "performance testing", "scalability testing"]
-        },
-        "Data Science": {
-            "core_skills": ["python", "r", "sql", "statistics", "machine learning", "data visualization"],
-            "libraries": ["pandas", "numpy", "matplotlib", "seaborn", "scikit-learn", "tensorflow"],
-            "tools": ["jupyter", "tableau", "power bi", "git", "excel"],
-            "concepts": ["statistical modeling", "predictive analytics", "feature engineering", "a/b testing"],
-            "testing": ["model evaluation", "cross-validation", "hypothesis testing"]
-        },
-        "Cyber Security": {
-            "core_skills": ["network security", "ethical hacking", "cryptography", "penetration testing"],
-            "languages": ["python", "c", "javascript", "bash", "powershell"],
-            "tools": ["wireshark", "metasploit", "burp suite", "nmap", "kali linux", "splunk"],
-            "concepts": ["vulnerability assessment", "incident response", "malware analysis", "security compliance"],
-            "testing": ["vulnerability scanning", "penetration testing", "security auditing"]
-        }
-    }
-
-def analyze_resume_content(text: str, target_role: str, datasets: Dict) -> Dict:
+def analyze_resume_content(text: str, target_role: str, datasets: Dict, on_stage: Optional[Callable[[str, object], None]] = None) -> Dict:
     """Comprehensive student resume analysis with enhanced metrics"""
-    role_requirements = get_role_requirements()
-    text_lower = text.lower()
-    
-    # Get all required skills for the role
-    role_data = role_requirements.get(target_role, role_requirements["Software Engineer"])
-    all_required_skills = []
-    for category_skills in role_data.values():
-        if isinstance(category_skills, list):
-            all_required_skills.extend(category_skills)
-    all_required_skills = list(set(all_required_skills))
-    
-    # Extract skills present in resume with fuzzy matching
-    found_skills = []
-    for skill in all_required_skills:
-        skill_variants = [
-            skill,
-            skill.replace(" ", ""),
-            skill.replace("-", ""),
-            skill.replace(".", ""),
-            skill.replace("/", "")
-        ]
-        if any(variant in text_lower.replace(" ", "").replace("-", "").replace(".", "").replace("/", "") 
-               for variant in skill_variants):
-            found_skills.append(skill)
-    
-    found_skills = list(set(found_skills))
-    missing_skills = [skill for skill in all_required_skills if skill not in found_skills]
+    # Match the compiled role model against the resume in one pass
+    role = ROLE_MODEL.get(target_role)
+    role_match = role.match_text(text)
+    all_required_skills = role.skills
+    found_skills = role_match.found_skills
+    missing_skills = role_match.missing_skills
     
     # Calculate skill match score
     skill_match_score = (len(found_skills) / len(all_required_skills)) * 100 if all_required_skills else 0
     
-    # Enhanced student-specific analysis
-    word_count = len(text.split())
-    has_contact_info = any(keyword in text_lower for keyword in ['email', 'phone', '@', '.com', 'linkedin', 'github'])
-    has_education = any(keyword in text_lower for keyword in ['education', 'university', 'college', 'degree', 'bachelor', 'master', 'cgpa', 'gpa', 'b.tech', 'm.tech'])
-    has_projects = any(keyword in text_lower for keyword in ['project', 'github', 'repository', 'built', 'developed', 'created', 'implemented'])
-    has_internship = any(keyword in text_lower for keyword in ['intern', 'training', 'apprentice', 'work experience', 'summer training'])
-    has_achievements = any(keyword in text_lower for keyword in ['achievement', 'award', 'winner', 'certificate', 'hackathon', 'competition', 'recognition'])
-    has_leadership = any(keyword in text_lower for keyword in ['lead', 'president', 'head', 'coordinator', 'captain', 'volunteer', 'organizer'])
-    has_certifications = any(keyword in text_lower for keyword in ['certification', 'certified', 'certificate', 'course completion'])
-    
-    # Count project indicators
-    project_count = sum([
-        text_lower.count('project'),
-        text_lower.count('github.com'),
-        text_lower.count('developed'),
-        text_lower.count('built')
-    ])
+    # Enhanced student-specific analysis: every keyword flag, count and section in one scan
+    features = RESUME_FEATURES.extract(text)
+    word_count = features.word_count
+    has_contact_info = features.flags['has_contact_info']
+    has_education = features.flags['has_education']
+    has_projects = features.flags['has_projects']
+    has_internship = features.flags['has_internship']
+    has_achievements = features.flags['has_achievements']
+    has_leadership = features.flags['has_leadership']
+    has_certifications = features.flags['has_certifications']
+    project_count = features.counts['project_count']
     
     # Content quality scoring (0-100)
     content_quality_score = 0
@@ -1037,22 +924,20 @@ def analyze_resume_content(text: str, target_role: str, datasets: Dict) -> Dict:
     # Readiness level
     readiness_level = get_student_readiness_level(overall_score)
     
-    # Course recommendations with priority
-    course_recommendations = generate_course_recommendations(missing_skills, datasets)
-    
-    # Salary information based on role and skills
-    salary_info = calculate_salary_estimates(target_role, len(found_skills), overall_score)
-    
-    # Job matches with detailed scoring
-    job_matches = generate_job_matches(target_role, skill_match_score, overall_score)
-    
-    # Emerging tech analysis
-    emerging_tech_analysis = analyze_emerging_tech(found_skills, missing_skills, target_role)
-    
-    # Placement forecast
-    placement_forecast = generate_placement_forecast(skill_match_score, overall_score, has_projects, has_internship)
-    
-    return {
+    # Report sections only depend on the scores above; they are cheap lookups and arithmetic, so they
+    # run inline on this thread (analyze_resume_with_ml keeps the pool for the encoder and GNN)
+    sections = StageGraph()
+    sections.add('course_recommendations', lambda: generate_course_recommendations(missing_skills, datasets), inline=True)
+    sections.add('salary_info', lambda: calculate_salary_estimates(target_role, len(found_skills), overall_score), inline=True)
+    sections.add('job_matches', lambda: generate_job_matches(target_role, skill_match_score, overall_score), inline=True)
+    sections.add('emerging_tech_analysis', lambda: analyze_emerging_tech(found_skills, missing_skills, target_role), inline=True)
+    sections.add('placement_forecast', lambda: generate_placement_forecast(skill_match_score, overall_score, has_projects, has_internship), inline=True)
+    sections.add('career_suggestions', lambda: get_career_suggestions(found_skills, target_role, overall_score), inline=True)
+    sections.add('strengths', lambda: identify_student_strengths(found_skills, content_quality_score, experience_score, has_projects, has_internship, project_count), inline=True)
+    sections.add('weaknesses', lambda: identify_student_weaknesses(missing_skills, content_quality_score, has_projects, project_count), inline=True)
+    sections.add('recommendations', lambda: generate_student_recommendations(missing_skills, overall_score, has_projects, has_internship, target_role, project_count), inline=True)
+    
+    results = {
         'overall_score': round(overall_score, 1),
         'skill_match_score': round(skill_match_score, 1),
         'content_quality_score': content_quality_score,
@@ -1070,33 +955,44 @@ def analyze_resume_content(text: str, target_role: str, datasets: Dict) -> Dict:
         'has_leadership': has_leadership,
         'has_certifications': has_certifications,
         'readiness_level': readiness_level,
-        'course_recommendations': course_recommendations,
-        'career_suggestions': get_career_suggestions(found_skills, target_role, overall_score),
-        'strengths': identify_student_strengths(found_skills, content_quality_score, experience_score, has_projects, has_internship, project_count),
-        'weaknesses': identify_student_weaknesses(missing_skills, content_quality_score, has_projects, project_count),
-        'recommendations': generate_student_recommendations(missing_skills, overall_score, has_projects, has_internship, target_role, project_count),
-        'salary_info': salary_info,
-        'job_matches': job_matches,
-        'emerging_tech_analysis': emerging_tech_analysis,
-        'placement_forecast': placement_forecast,
-        'skill_distribution': calculate_skill_distribution(found_skills, role_data)
+        'skill_distribution': role_match.distribution,
+        'sections': features.sections
     }
+    results.update(sections.run(on_result=on_stage))
+    return results
 
-def analyze_resume_with_ml(text: str, target_role: str, extractor, gnn_model, graph_data: Dict, datasets: Dict) -> Dict:
+def analyze_resume_with_ml(text: str, target_role: str, extractor, gnn_model, graph_data: Dict, datasets: Dict,
+                           on_stage: Optional[Callable[[str, object], None]] = None) -> Dict:
     """Enhanced resume analysis using ML modules"""
-    # Use basic analysis as fallback
-    return analyze_resume_content(text, target_role, datasets)
+    def predict_gnn_skills(analysis, ml_skills):
+        from gnn_skill_predictor import predict_for_student
+        known = list(dict.fromkeys(analysis['found_skills'] + ml_skills.get('extracted_skills', [])))
+        return predict_for_student(gnn_model, known)
+    
+    # Keyword analysis and the ML extractor are independent; skill prediction needs both skill lists
+    # and is skipped without a trained predictor. Only the encoder and GNN stages use the pool;
+    # the keyword analysis runs here meanwhile
+    stages = StageGraph()
+    stages.add('analysis', lambda: analyze_resume_content(text, target_role, datasets), inline=True)
+    stages.add('ml_skills', lambda: extractor.extract_skills_advanced(text))
+    if gnn_model is not None:
+        stages.add('gnn_skills', predict_gnn_skills, ['analysis', 'ml_skills'])
+    outputs = stages.run(on_result=on_stage)
+    
+    results = outputs['analysis']
+    results['ml_extracted_skills'] = outputs['ml_skills'].get('extracted_skills', [])
+    results['ml_predicted_skills'] = outputs.get('gnn_skills', [])
+    return results
 
 def generate_course_recommendations(missing_skills: List[str], datasets: Dict) -> List[Dict]:
     """Generate prioritized course recommendations"""
     course_recommendations = []
     if 'courses' in datasets and not datasets['courses'].empty:
+        from course_search import get_course_search
         priority_skills = missing_skills[:5]
-        for skill in priority_skills:
-            matching_courses = datasets['courses'][
-                datasets['courses']['skills'].str.lower().str.contains(skill.lower(), na=False)
-            ]
-            for _, course in matching_courses.head(2).iterrows():
+        matches = get_course_search(datasets['courses']).search_batch(priority_skills, k=2)
+        for skill, courses in zip(priority_skills, matches):
+            for course in courses:
                 course_recommendations.append({
                     'course': course['course_name'],
                     'skill': skill.title(),
@@ -1106,8 +1002,24 @@ def generate_course_recommendations(missing_skills: List[str], datasets: Dict) -
                 })
     return course_recommendations[:8]
 
-def calculate_salary_estimates(target_role: str, skills_count: int, overall_score: float) -> Dict:
+def calculate_salary_estimates(target_role: str, skills_count: int, overall_score: float, location: Optional[str] = None) -> Dict:
     """Calculate realistic salary estimates based on role and skills"""
+    # Ingested posting salaries: place the student inside each band's interquartile range by score
+    from salary_sketches import BANDS, get_salary_index
+    salary_index = get_salary_index()
+    if salary_index is not None:
+        percentiles = {band: salary_index.quantiles(target_role, band, location) for band in BANDS}
+        if all(percentiles.values()):
+            position = min(max(overall_score, 0), 100) / 100
+            estimate = lambda p: int(p['p25'] + (p['p75'] - p['p25']) * position)
+            return {
+                'entry_level': estimate(percentiles['entry']),
+                'mid_level': estimate(percentiles['mid']),
+                'senior_level': estimate(percentiles['senior']),
+                'percentiles': percentiles,
+                'source': 'postings'
+            }
+    
     base_salaries = {
         "Software Engineer": (450000, 1200000, 2500000),
         "Data Scientist": (500000, 1400000, 2800000),
@@ -1131,7 +1043,8 @@ def calculate_salary_estimates(target_role: str, skills_count: int, overall_scor
     return {
         'entry_level': int(entry * skill_multiplier * score_multiplier),
         'mid_level': int(mid * skill_multiplier * score_multiplier),
-        'senior_level': int(senior * skill_multiplier * score_multiplier)
+        'senior_level': int(senior * skill_multiplier * score_multiplier),
+        'source': 'defaults'
     }
 
 def generate_job_matches(target_role: str, skill_match: float, overall_score: float) -> List[Dict]:
@@ -1166,29 +1079,20 @@ def generate_job_matches(target_role: str, skill_match: float, overall_score: fl
 
 def analyze_emerging_tech(found_skills: List[str], missing_skills: List[str], target_role: str) -> Dict:
     """Analyze emerging technologies relevant to role"""
-    emerging_tech_by_role = {
-        "Software Engineer": ['generative ai', 'cloud native', 'edge computing', 'webassembly'],
-        "Data Scientist": ['large language models', 'mlops', 'automl', 'explainable ai'],
-        "Frontend Developer": ['web3', 'micro frontends', 'progressive web apps', 'jamstack'],
-        "Full Stack Developer": ['serverless', 'graphql', 'kubernetes', 'microservices'],
-        "Mobile App Developer": ['flutter', 'swiftui', 'jetpack compose', 'cross-platform'],
-        "Artificial Intelligence": ['transformers', 'diffusion models', 'federated learning', 'neuromorphic'],
-        "Blockchain": ['layer 2', 'zk-proofs', 'defi 2.0', 'web3'],
-        "VR & AR": ['metaverse', 'spatial computing', 'haptic feedback', 'digital twins'],
-        "Big Data": ['real-time analytics', 'data mesh', 'lakehouse', 'streaming'],
-        "Data Science": ['causal inference', 'synthetic data', 'edge analytics', 'automl'],
-        "Cyber Security": ['zero trust', 'ai security', 'quantum cryptography', 'devsecops']
-    }
-    
-    trending = emerging_tech_by_role.get(target_role, ['ai', 'cloud', 'automation', 'apis'])
-    recommendations = [skill for skill in trending if skill in missing_skills][:3]
-    if not recommendations:
-        recommendations = trending[:3]
+    from emerging_tech_index import get_emerging_tech_index
+    index = get_emerging_tech_index()
+    if index is None:
+        return {'trending': [], 'recommendations': [], 'growth_rate': 'Medium'}
+    
+    # Trending: the role's most relevant technologies; recommendations also weigh the student's gaps
+    trending = [tech for tech, _ in index.top_k(target_role, k=4)]
+    ranked = index.top_k(target_role, missing_skills, found_skills, k=3)
+    recommendations = [tech for tech, _ in ranked]
     
     return {
         'trending': trending,
         'recommendations': recommendations,
-        'growth_rate': 'High' if len(recommendations) > 0 else 'Medium'
+        'growth_rate': 'High' if ranked and ranked[0][1] >= 0.3 else 'Medium'
     }
 
 def generate_placement_forecast(skill_match: float, overall_score: float, has_projects: bool, has_internship: bool) -> Dict:
@@ -1217,20 +1121,6 @@ def generate_placement_forecast(skill_match: float, overall_score: float, has_pr
         ]
     }
 
-def calculate_skill_distribution(found_skills: List[str], role_data: Dict) -> Dict:
-    """Calculate skill distribution across categories"""
-    distribution = {}
-    for category, skills in role_data.items():
-        if isinstance(skills, list):
-            category_found = len([s for s in skills if s in found_skills])
-            category_total = len(skills)
-            distribution[category.replace('_', ' ').title()] = {
-                'found': category_found,
-                'total': category_total,
-                'percentage': round((category_found / category_total) * 100, 1) if category_total > 0 else 0
-            }
-    return distribution
-
 def get_student_readiness_level(score: float) -> Dict:
     """Determine student's job readiness level with actionable insights"""
     if score >= 85:
@@ -1516,6 +1406,7 @@ def create_enhanced_loading_screen(step: str, progress: float, elapsed_time: flo
 
 def create_readiness_gauge(score: float, readiness_data: Dict):
     """Create student job readiness gauge with enhanced visuals"""
+    import plotly.graph_objects as go
     color = readiness_data['color']
     
     fig = go.Figure(go.Indicator(
@@ -1564,20 +1455,10 @@ def create_readiness_gauge(score: float, readiness_data: Dict):
 
 def create_skills_radar_chart(found_skills: List[str], missing_skills: List[str], target_role: str):
     """Create enhanced radar chart showing skill coverage by category"""
-    role_requirements = get_role_requirements()
-    role_data = role_requirements.get(target_role, role_requirements["Software Engineer"])
-    
-    categories = []
-    scores = []
-    
-    if isinstance(role_data, dict):
-        for category, skills in role_data.items():
-            if isinstance(skills, list):
-                category_found = len([s for s in skills if s in found_skills])
-                category_total = len(skills)
-                category_score = (category_found / category_total) * 100 if category_total > 0 else 0
-                categories.append(category.replace('_', ' ').title())
-                scores.append(category_score)
+    import plotly.graph_objects as go
+    distribution = ROLE_MODEL.get(target_role).match_skills(found_skills).distribution
+    categories = list(distribution)
+    scores = [data['found'] / data['total'] * 100 if data['total'] > 0 else 0 for data in distribution.values()]
     
     if not categories:
         categories = ['Technical Skills', 'Frameworks', 'Databases', 'Tools', 'Concepts']
@@ -1624,6 +1505,7 @@ def create_skills_radar_chart(found_skills: List[str], missing_skills: List[str]
 
 def create_skill_distribution_chart(skill_distribution: Dict):
     """Create horizontal bar chart for skill distribution"""
+    import plotly.graph_objects as go
     categories = list(skill_distribution.keys())
     percentages = [data['percentage'] for data in skill_distribution.values()]
     found_counts = [data['found'] for data in skill_distribution.values()]
@@ -1660,6 +1542,7 @@ def create_skill_distribution_chart(skill_distribution: Dict):
 
 def create_salary_chart(salary_info: Dict):
     """Create enhanced salary expectations chart"""
+    import plotly.graph_objects as go
     levels = ['Entry Level<br>(0-2 years)', 'Mid Level<br>(2-5 years)', 'Senior Level<br>(5+ years)']
     salaries = [
         salary_info['entry_level'],
@@ -1701,277 +1584,439 @@ def create_salary_chart(salary_info: Dict):
     
     return fig
 
+def results_hash(results: Dict, target_role: str) -> str:
+    """Stable key for a set of results, used to memoize their figures"""
+    payload = json.dumps({'role': target_role, 'results': results}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+def compact_figure_json(fig, digits: int = 2) -> str:
+    """Figure JSON without the default template (Streamlit applies its own theme) and with trace values rounded"""
+    from plotly.utils import PlotlyJSONEncoder
+    def round_floats(value):
+        if isinstance(value, float):
+            return round(value, digits)
+        if isinstance(value, (list, tuple)):
+            return [round_floats(v) for v in value]
+        if isinstance(value, dict):
+            return {k: round_floats(v) for k, v in value.items()}
+        return value
+    fig.layout.template = {}
+    figure = json.loads(json.dumps(fig.to_plotly_json(), cls=PlotlyJSONEncoder))
+    figure['data'] = round_floats(figure['data'])
+    return json.dumps(figure, separators=(',', ':'))
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_figure_json(kind: str, results_key: str, _build: Callable) -> str:
+    """Figure JSON memoized per (figure, results hash); ``_build`` is not part of the cache key"""
+    return compact_figure_json(_build())
+
+def render_figure(kind: str, results_key: str, build: Callable, lazy_label: Optional[str] = None):
+    """Plot a memoized figure; with ``lazy_label`` it is only built and sent once the user opens it"""
+    if lazy_label is not None and not st.toggle(lazy_label, key=f"show_{kind}"):
+        return
+    st.plotly_chart(json.loads(cached_figure_json(kind, results_key, build)), use_container_width=True)
+
 def generate_txt_report(results: Dict, target_role: str, resume_text: str) -> str:
     """Generate comprehensive TXT report with perfect formatting"""
+    return render_report(results, target_role, "txt").decode("utf-8")
+
+def report_handle(results: Dict, target_role: str, results_key: str, fmt: str):
+    """Background render of one report format, submitted once per analysis and kept in the session"""
+    handles = st.session_state.setdefault('report_handles', {})
+    if (results_key, fmt) not in handles:
+        # Only the current analysis' reports stay in the session
+        for key in [key for key in handles if key[0] != results_key]:
+            del handles[key]
+        handles[(results_key, fmt)] = get_report_queue().submit(results, target_role, fmt)
+    return handles[(results_key, fmt)]
+
+# ==================== MAIN APPLICATION ====================
+
+def render_results(results: Dict, target_role: str, results_key: str):
+    """Render the analysis view from stored results (runs on every rerun, so figures come from the cache)"""
+    # The report renders on a worker thread while the page draws; the download section picks it up
+    report_format = st.session_state.get('report_format', 'txt')
+    report_handle(results, target_role, results_key, report_format)
+    # Job Readiness Score Section with perfect alignment
+    readiness_data = results['readiness_level']
+    
+    col1, col2 = st.columns([1, 2])
     
-    report_lines = []
-    report_lines.append("=" * 100)
-    report_lines.append("JOB BRIDGE - CAREER INTELLIGENCE REPORT".center(100))
-    report_lines.append("ML-Powered Resume Analysis & Career Roadmap".center(100))
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    
-    # Report metadata
-    report_lines.append(f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
-    report_lines.append(f"Target Role: {target_role}")
-    report_lines.append(f"Analysis Type: Comprehensive Career Assessment")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Executive Summary
-    report_lines.append("EXECUTIVE SUMMARY")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    readiness = results['readiness_level']
-    report_lines.append(f"Job Readiness Level: {readiness['level']} {readiness['icon']}")
-    report_lines.append(f"Overall Score: {results['overall_score']}/100")
-    report_lines.append(f"Assessment: {readiness['description']}")
-    report_lines.append(f"Next Step: {readiness['next_step']}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Detailed Score Breakdown
-    report_lines.append("DETAILED SCORE BREAKDOWN")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append(f"  1. Technical Skills Match:    {results['skill_match_score']:.1f}%  {'█' * int(results['skill_match_score']/5)}")
-    report_lines.append(f"     - Skills Found: {len(results['found_skills'])}")
-    report_lines.append(f"     - Skills to Learn: {len(results['missing_skills'])}")
-    report_lines.append("")
-    report_lines.append(f"  2. Content Quality:          {results['content_quality_score']:.1f}%  {'█' * int(results['content_quality_score']/5)}")
-    report_lines.append(f"     - Word Count: {results['word_count']}")
-    report_lines.append(f"     - Contact Info: {'✓ Present' if results['has_contact_info'] else '✗ Missing'}")
-    report_lines.append(f"     - Education Details: {'✓ Present' if results['has_education'] else '✗ Missing'}")
-    report_lines.append("")
-    report_lines.append(f"  3. Project Experience:       {results['experience_score']:.1f}%  {'█' * int(results['experience_score']/5)}")
-    report_lines.append(f"     - Projects: {'✓ Present' if results['has_projects'] else '✗ Missing'} (Count: {results['project_count']})")
-    report_lines.append(f"     - Internships: {'✓ Present' if results['has_internship'] else '✗ Missing'}")
-    report_lines.append(f"     - Achievements: {'✓ Present' if results['has_achievements'] else '✗ Missing'}")
-    report_lines.append("")
-    report_lines.append(f"  4. Presentation Quality:     {results['presentation_score']:.1f}%  {'█' * int(results['presentation_score']/5)}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Technical Skills Analysis
-    report_lines.append("TECHNICAL SKILLS ANALYSIS")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append("Skills You Have:")
-    report_lines.append("-" * 50)
-    for i, skill in enumerate(results['found_skills'], 1):
-        report_lines.append(f"  {i:2d}. ✓ {skill.title()}")
-    report_lines.append("")
-    
-    report_lines.append("Skills to Learn (Priority Order):")
-    report_lines.append("-" * 50)
-    for i, skill in enumerate(results['missing_skills'], 1):
-        priority = "HIGH" if i <= 3 else "MEDIUM" if i <= 6 else "LOW"
-        report_lines.append(f"  {i:2d}. ✗ {skill.title()} [{priority} PRIORITY]")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Skill Distribution by Category
+    with col1:
+        st.markdown(f"""
+        <div class="score-card">
+            <div class="score-label">Job Readiness Score</div>
+            <div class="score-display">{results['overall_score']}/100</div>
+            <div class="score-status" style="background: {readiness_data['color']}; color: white;">
+                {readiness_data['icon']} {readiness_data['level']}
+            </div>
+            <div style="color: #94a3b8; margin-top: 1rem; font-size: 1rem; line-height: 1.6;">
+                {readiness_data['description']}
+            </div>
+            <div style="color: #64748b; margin-top: 0.75rem; font-size: 0.9rem; font-weight: 600;">
+                Next Step: {readiness_data['next_step']}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        render_figure('readiness_gauge', results_key, lambda: create_readiness_gauge(results['overall_score'], readiness_data))
+    
+    # Detailed Breakdown with perfect grid alignment
+    st.markdown('<h2 class="section-header">Detailed Assessment Breakdown</h2>', unsafe_allow_html=True)
+    
+    score_cols = st.columns(4)
+    scores = [
+        ("Technical Skills", results['skill_match_score'], "#3b82f6"),
+        ("Content Quality", results['content_quality_score'], "#10b981"),
+        ("Project Experience", results['experience_score'], "#8b5cf6"),
+        ("Presentation", results['presentation_score'], "#06b6d4")
+    ]
+    
+    for col, (label, score, color) in zip(score_cols, scores):
+        with col:
+            st.markdown(f"""
+            <div class="analysis-card">
+                <div class="card-title">{label}</div>
+                <div class="card-content">
+                    <div style="font-size: 2.5rem; font-weight: 800; color: {color}; margin-bottom: 0.75rem;">{score:.0f}%</div>
+                    <div class="progress-container">
+                        <div class="progress-bar" style="width: {score}%;"></div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Skills Visualization Section
+    st.markdown('<h2 class="section-header">Skills Coverage Analysis</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([3, 2])
+    
+    with col1:
+        render_figure('skills_radar', results_key, lambda: create_skills_radar_chart(results['found_skills'], results['missing_skills'], target_role))
+    
+    with col2:
+        st.markdown(f"""
+        <div class="analysis-card" style="height: 400px; display: flex; flex-direction: column; justify-content: center;">
+            <div class="card-title">Coverage Summary</div>
+            <div class="card-content" style="text-align: center;">
+                <div style="margin-bottom: 1.5rem;">
+                    <div style="font-size: 2.5rem; font-weight: 800; color: #10b981;">{len(results['found_skills'])}</div>
+                    <div style="color: #94a3b8; font-size: 1rem;">Skills Found</div>
+                </div>
+                <div style="margin-bottom: 1.5rem;">
+                    <div style="font-size: 2.5rem; font-weight: 800; color: #ef4444;">{len(results['missing_skills'])}</div>
+                    <div style="color: #94a3b8; font-size: 1rem;">Skills to Learn</div>
+                </div>
+                <div>
+                    <div style="font-size: 2.5rem; font-weight: 800; color: #3b82f6;">{results['skill_match_score']:.0f}%</div>
+                    <div style="color: #94a3b8; font-size: 1rem;">Skill Match</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Skill Distribution Chart
     if 'skill_distribution' in results:
-        report_lines.append("SKILL COVERAGE BY CATEGORY")
-        report_lines.append("=" * 100)
-        report_lines.append("")
-        for category, data in results['skill_distribution'].items():
-            bar_length = int(data['percentage'] / 5)
-            report_lines.append(f"  {category:25s} : {data['found']:2d}/{data['total']:2d} ({data['percentage']:5.1f}%) {'█' * bar_length}")
-        report_lines.append("")
-        report_lines.append("-" * 100)
-        report_lines.append("")
-    
-    # Resume Content Assessment
-    report_lines.append("RESUME CONTENT ASSESSMENT")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    content_items = [
-        ("Contact Information", results['has_contact_info']),
-        ("Education Details", results['has_education']),
-        ("Project Portfolio", results['has_projects']),
-        ("Internship Experience", results['has_internship']),
-        ("Achievements & Awards", results['has_achievements']),
-        ("Leadership Roles", results['has_leadership']),
-        ("Certifications", results['has_certifications'])
+        render_figure('skill_distribution', results_key, lambda: create_skill_distribution_chart(results['skill_distribution']),
+                      lazy_label="Show skill coverage by category")
+    
+    # Technical Skills Section with two-column layout
+    st.markdown('<h2 class="section-header">Technical Skills Analysis</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="analysis-card">
+            <div class="card-title">Skills You Have</div>
+            <div class="card-content">
+        """, unsafe_allow_html=True)
+        for skill in results['found_skills']:
+            st.markdown(f'<span class="skill-tag present">{skill.title()}</span>', unsafe_allow_html=True)
+        st.markdown("</div></div>", unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="analysis-card">
+            <div class="card-title">Priority Skills to Learn</div>
+            <div class="card-content">
+        """, unsafe_allow_html=True)
+        for skill in results['missing_skills']:
+            st.markdown(f'<span class="skill-tag missing">{skill.title()}</span>', unsafe_allow_html=True)
+        st.markdown("</div></div>", unsafe_allow_html=True)
+    
+    # Resume Content Analysis
+    st.markdown('<h2 class="section-header">Resume Content Assessment</h2>', unsafe_allow_html=True)
+    
+    content_cols = st.columns(3)
+    content_checks = [
+        ("Contact Information", results['has_contact_info'], "Include email, phone, LinkedIn"),
+        ("Education Details", results['has_education'], "Add degree, university, CGPA"),
+        ("Projects", results['has_projects'], "Showcase 2-3 strong projects"),
+        ("Internship Experience", results['has_internship'], "Highlight internships"),
+        ("Achievements", results['has_achievements'], "List hackathons, awards"),
+        ("Leadership Roles", results['has_leadership'], "Mention club activities")
     ]
     
-    for item, present in content_items:
-        status = "✓ PRESENT" if present else "✗ MISSING"
-        report_lines.append(f"  {item:30s} : {status}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Strengths
-    report_lines.append("YOUR STRENGTHS")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    for i, strength in enumerate(results['strengths'], 1):
-        report_lines.append(f"  {i}. {strength}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Areas for Improvement
-    report_lines.append("AREAS FOR IMPROVEMENT")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    for i, weakness in enumerate(results['weaknesses'], 1):
-        report_lines.append(f"  {i}. {weakness}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Actionable Recommendations
-    report_lines.append("ACTIONABLE CAREER ROADMAP")
-    report_lines.append("=" * 100)
-    report_lines.append("")
+    for i, (check_name, check_status, tip) in enumerate(content_checks):
+        with content_cols[i % 3]:
+            status_icon = "" if check_status else ""
+            status_color = "#10b981" if check_status else "#ef4444"
+            status_text = "Present" if check_status else "Missing"
+            st.markdown(f"""
+            <div class="analysis-card">
+                <div class="card-title">{status_icon} {check_name}</div>
+                <div class="card-content">
+                    <span style="color: {status_color}; font-weight: 700; font-size: 1.1rem;">
+                        {status_text}
+                    </span>
+                    <div style="color: #94a3b8; margin-top: 0.75rem; font-size: 0.9rem;">{tip}</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Strengths and Weaknesses with perfect two-column layout
+    st.markdown('<h2 class="section-header">Strengths & Areas for Improvement</h2>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div class="analysis-card">
+            <div class="card-title">Your Strengths</div>
+            <div class="card-content">
+        """, unsafe_allow_html=True)
+        for i, strength in enumerate(results['strengths'], 1):
+            st.markdown(f'<div style="margin: 0.75rem 0; color: #10b981; font-size: 0.95rem;"><strong>{i}.</strong> {strength}</div>', unsafe_allow_html=True)
+        st.markdown("</div></div>", unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="analysis-card">
+            <div class="card-title">Areas to Improve</div>
+            <div class="card-content">
+        """, unsafe_allow_html=True)
+        for i, weakness in enumerate(results['weaknesses'], 1):
+            st.markdown(f'<div style="margin: 0.75rem 0; color: #ef4444; font-size: 0.95rem;"><strong>{i}.</strong> {weakness}</div>', unsafe_allow_html=True)
+        st.markdown("</div></div>", unsafe_allow_html=True)
+    
+    # Personalized Recommendations
+    st.markdown('<h2 class="section-header">Your Personalized Career Roadmap</h2>', unsafe_allow_html=True)
+    
     for i, rec in enumerate(results['recommendations'], 1):
-        report_lines.append(f"{i}. [{rec['priority'].upper()} PRIORITY] {rec['text']}")
-        report_lines.append(f"   Action Required: {rec['action']}")
-        report_lines.append(f"   Timeline: {rec['timeline']}")
-        report_lines.append(f"   Expected Impact: {rec['impact']}")
-        report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
+        priority_class = {
+            'high': 'priority-high',
+            'medium': 'priority-medium',
+            'low': 'priority-low'
+        }[rec['priority']]
+        st.markdown(f"""
+        <div class="recommendation-item">
+            <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.75rem;">
+                <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; flex: 1;">{i}. {rec['text']}</div>
+                <div class="recommendation-priority {priority_class}">{rec['priority'].upper()}</div>
+            </div>
+            <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
+                <strong style="color: #cbd5e1;">Action:</strong> {rec['action']} &nbsp;|&nbsp;
+                <strong style="color: #cbd5e1;">Timeline:</strong> {rec['timeline']}<br>
+                <strong style="color: #cbd5e1;">Impact:</strong> {rec['impact']}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
     
     # Course Recommendations
     if results['course_recommendations']:
-        report_lines.append("RECOMMENDED COURSES")
-        report_lines.append("=" * 100)
-        report_lines.append("")
-        for i, course in enumerate(results['course_recommendations'], 1):
-            report_lines.append(f"{i}. {course['course']}")
-            report_lines.append(f"   Skill Focus: {course['skill']}")
-            report_lines.append(f"   Provider: {course['provider']}")
-            report_lines.append(f"   Duration: {course['duration']}")
-            report_lines.append(f"   Priority: {course.get('priority', 'Medium')}")
-            report_lines.append("")
-        report_lines.append("-" * 100)
-        report_lines.append("")
+        st.markdown('<h2 class="section-header">Recommended Courses</h2>', unsafe_allow_html=True)
+        
+        course_cols = st.columns(2)
+        for i, course in enumerate(results['course_recommendations']):
+            with course_cols[i % 2]:
+                priority_class = 'priority-high' if course.get('priority') == 'High' else 'priority-medium'
+                st.markdown(f"""
+                <div class="recommendation-item">
+                    <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; margin-bottom: 0.75rem;">{course['course']}</div>
+                    <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
+                        <strong>Skill:</strong> {course['skill']}<br>
+                        <strong>Provider:</strong> {course['provider']}<br>
+                        <strong>Duration:</strong> {course['duration']}
+                    </div>
+                    <div class="recommendation-priority {priority_class}" style="margin-top: 0.75rem;">{course.get('priority', 'Medium')} Priority</div>
+                </div>
+                """, unsafe_allow_html=True)
     
     # Career Path Suggestions
-    report_lines.append("CAREER PATH SUGGESTIONS")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    for i, suggestion in enumerate(results['career_suggestions'], 1):
-        report_lines.append(f"{i}. {suggestion['role']}")
-        report_lines.append(f"   Match Percentage: {suggestion['match']}")
-        report_lines.append(f"   Reason: {suggestion['reason']}")
-        report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
+    st.markdown('<h2 class="section-header">Career Path Suggestions</h2>', unsafe_allow_html=True)
+    
+    career_cols = st.columns(2)
+    for i, suggestion in enumerate(results['career_suggestions']):
+        with career_cols[i % 2]:
+            match_percentage = float(suggestion['match'].strip('%'))
+            match_color = "#10b981" if match_percentage >= 80 else "#f59e0b" if match_percentage >= 65 else "#ef4444"
+            st.markdown(f"""
+            <div class="recommendation-item">
+                <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; margin-bottom: 0.75rem;">{suggestion['role']}</div>
+                <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
+                    <strong>Match:</strong> <span style="color: {match_color}; font-weight: 700; font-size: 1.1rem;">{suggestion['match']}</span><br>
+                    <strong>Reason:</strong> {suggestion['reason']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
     
     # Job Matches
-    report_lines.append("POTENTIAL JOB OPPORTUNITIES")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    for i, job in enumerate(results['job_matches'], 1):
-        report_lines.append(f"{i}. {job['title']}")
-        report_lines.append(f"   Match Score: {job['match_percentage']}%")
-        report_lines.append(f"   Description: {job['description']}")
-        report_lines.append(f"   Target Companies: {job['companies']}")
-        report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
+    st.markdown('<h2 class="section-header">Potential Job Opportunities</h2>', unsafe_allow_html=True)
+    
+    job_cols = st.columns(2)
+    for i, job in enumerate(results['job_matches']):
+        with job_cols[i % 2]:
+            match_color = "#10b981" if job['match_percentage'] >= 80 else "#f59e0b" if job['match_percentage'] >= 60 else "#ef4444"
+            st.markdown(f"""
+            <div class="recommendation-item">
+                <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; margin-bottom: 0.75rem;">{job['title']}</div>
+                <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
+                    <strong>Match:</strong> <span style="color: {match_color}; font-weight: 700;">{job['match_percentage']}%</span><br>
+                    <strong>Description:</strong> {job['description']}<br>
+                    <strong>Companies:</strong> {job['companies']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
     
     # Salary Expectations
-    report_lines.append("SALARY EXPECTATIONS (Annual CTC in INR)")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append(f"  Entry Level (0-2 years):   ₹{results['salary_info']['entry_level']:,}")
-    report_lines.append(f"  Mid Level (2-5 years):     ₹{results['salary_info']['mid_level']:,}")
-    report_lines.append(f"  Senior Level (5+ years):   ₹{results['salary_info']['senior_level']:,}")
-    report_lines.append("")
-    report_lines.append("Note: These are estimated ranges based on your skills and target role.")
-    report_lines.append("Actual salaries may vary based on company, location, and negotiation.")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
+    st.markdown('<h2 class="section-header">Salary Expectations</h2>', unsafe_allow_html=True)
+    
+    render_figure('salary', results_key, lambda: create_salary_chart(results['salary_info']), lazy_label="Show salary chart")
+    
+    st.markdown("""
+    <div class="info-box">
+        <strong>Note:</strong> These are estimated salary ranges based on your skills, target role, and current market trends.
+        Actual salaries may vary based on company size, location, specific role requirements, and your negotiation skills.
+        Focus on building strong skills and a solid portfolio to maximize your earning potential.
+    </div>
+    """, unsafe_allow_html=True)
     
     # Emerging Technologies
-    report_lines.append("EMERGING TECHNOLOGIES TO WATCH")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append("Trending Technologies in Your Field:")
-    for tech in results['emerging_tech_analysis']['trending']:
-        report_lines.append(f"  • {tech.title()}")
-    report_lines.append("")
-    report_lines.append("Recommended Focus Areas:")
-    for tech in results['emerging_tech_analysis']['recommendations']:
-        report_lines.append(f"  → {tech.title()}")
-    report_lines.append("")
-    report_lines.append(f"Growth Outlook: {results['emerging_tech_analysis']['growth_rate']}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
+    st.markdown('<h2 class="section-header">Emerging Technologies to Watch</h2>', unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div class="analysis-card">
+        <div class="card-title">Trending in {target_role}</div>
+        <div class="card-content">
+            <div style="margin-bottom: 1.5rem;">
+                {"".join([f'<span class="skill-tag present">{tech.title()}</span>' for tech in results['emerging_tech_analysis']['trending']])}
+            </div>
+            <div style="color: #cbd5e1; margin-top: 1rem;">
+                <strong style="color: #3b82f6;">Recommended Focus:</strong> {', '.join([tech.title() for tech in results['emerging_tech_analysis']['recommendations']])}
+            </div>
+            <div style="color: #94a3b8; margin-top: 0.75rem; font-size: 0.9rem;">
+                Growth Outlook: <span style="color: #10b981; font-weight: 600;">{results['emerging_tech_analysis']['growth_rate']}</span>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
     
     # Placement Forecast
+    st.markdown('<h2 class="section-header">Placement Forecast</h2>', unsafe_allow_html=True)
+    
     forecast = results['placement_forecast']
-    report_lines.append("PLACEMENT FORECAST")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append(f"Placement Probability: {forecast['probability']}%")
-    report_lines.append(f"Expected Timeframe: {forecast['timeframe']} months")
-    report_lines.append(f"Confidence Level: {forecast['confidence']}")
-    report_lines.append("")
-    report_lines.append("Key Contributing Factors:")
-    for factor in forecast['key_factors']:
-        report_lines.append(f"  • {factor}")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Action Plan Summary
-    report_lines.append("30-DAY ACTION PLAN")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append("Week 1-2: Foundation")
-    report_lines.append("  - Update resume with quantifiable achievements")
-    report_lines.append("  - Optimize LinkedIn profile with projects and skills")
-    report_lines.append("  - Set up GitHub portfolio with existing projects")
-    report_lines.append("")
-    report_lines.append("Week 3-4: Skill Development")
-    if results['missing_skills']:
-        report_lines.append(f"  - Start learning {results['missing_skills'][0].title()}")
-        if len(results['missing_skills']) > 1:
-            report_lines.append(f"  - Begin online course for {results['missing_skills'][1].title()}")
-    report_lines.append("  - Work on one new project showcasing learned skills")
-    report_lines.append("")
-    report_lines.append("Next Steps (Month 2-3):")
-    report_lines.append("  - Complete 2-3 substantial projects")
-    report_lines.append("  - Apply for internships or entry-level positions")
-    report_lines.append("  - Participate in hackathons or coding competitions")
-    report_lines.append("  - Network with professionals in your target field")
-    report_lines.append("")
-    report_lines.append("-" * 100)
-    report_lines.append("")
-    
-    # Footer
-    report_lines.append("CONCLUSION")
-    report_lines.append("=" * 100)
-    report_lines.append("")
-    report_lines.append(f"Your current job readiness score of {results['overall_score']:.1f}/100 indicates that you are ")
-    report_lines.append(f"{readiness['level'].lower()} for the job market. By following the recommendations outlined")
-    report_lines.append("in this report, you can systematically improve your profile and increase your chances")
-    report_lines.append("of landing your dream job.")
-    report_lines.append("")
-    report_lines.append("Remember: Career development is a journey, not a destination. Stay consistent,")
-    report_lines.append("keep learning, and don't hesitate to seek guidance from mentors and industry professionals.")
-    report_lines.append("")
-    report_lines.append("=" * 100)
-    report_lines.append("Report Generated by Job Bridge - ML-Powered Career Intelligence Platform".center(100))
-    report_lines.append("For questions or support, visit our website or contact your career counselor".center(100))
-    report_lines.append("=" * 100)
-    
-    return "\n".join(report_lines)
-
-# ==================== MAIN APPLICATION ====================
+    forecast_color = "#10b981" if forecast['probability'] >= 80 else "#3b82f6" if forecast['probability'] >= 65 else "#f59e0b"
+    
+    st.markdown(f"""
+    <div class="analysis-card">
+        <div class="card-title">Job Placement Outlook</div>
+        <div class="card-content">
+            <div style="text-align: center; margin: 1.5rem 0;">
+                <div style="font-size: 3.5rem; font-weight: 900; color: {forecast_color};">{forecast['probability']}%</div>
+                <div style="color: #94a3b8; font-size: 1.1rem; margin-top: 0.5rem;">
+                    Placement Probability within <strong style="color: #e2e8f0;">{forecast['timeframe']} Months</strong>
+                </div>
+                <div style="margin-top: 1rem;">
+                    <span style="background: {forecast_color}; color: white; padding: 0.5rem 1.5rem; border-radius: 50px; font-weight: 600;">
+                        {forecast['confidence']} Confidence
+                    </span>
+                </div>
+            </div>
+            <div style="color: #cbd5e1; margin-top: 1.5rem;">
+                <strong>Key Contributing Factors:</strong>
+                <ul style="color: #94a3b8; margin-top: 0.75rem; line-height: 1.8;">
+                    {"".join([f'<li>{factor}</li>' for factor in forecast['key_factors']])}
+                </ul>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Achievements Section
+    st.markdown('<h2 class="section-header">Your Achievements</h2>', unsafe_allow_html=True)
+    
+    achievements = []
+    if results['has_projects']:
+        achievements.append("Completed Notable Projects")
+    if results['has_internship']:
+        achievements.append("Gained Industry Experience")
+    if results['has_achievements']:
+        achievements.append("Recognized in Competitions/Certifications")
+    if results['has_leadership']:
+        achievements.append("Demonstrated Leadership")
+    if results['has_certifications']:
+        achievements.append("Earned Professional Certifications")
+    
+    if achievements:
+        st.markdown("""
+        <div class="analysis-card">
+            <div class="card-title">Your Milestones</div>
+            <div class="card-content" style="text-align: center;">
+        """, unsafe_allow_html=True)
+        for achievement in achievements:
+            st.markdown(f'<span class="achievement-badge">{achievement}</span>', unsafe_allow_html=True)
+        st.markdown("</div></div>", unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="analysis-card">
+            <div class="card-content" style="text-align: center; color: #94a3b8;">
+                Start building your achievements by working on projects, internships, or competitions!
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Download Report Section
+    st.markdown('<h2 class="section-header">Download Your Report</h2>', unsafe_allow_html=True)
+    
+    report_format = st.radio("Report format", list(REPORT_WRITERS), format_func=str.upper, horizontal=True, key='report_format')
+    handle = report_handle(results, target_role, results_key, report_format)
+    if handle.ready:
+        st.download_button(
+            label=f"Download Complete Analysis Report ({report_format.upper()})",
+            data=handle.data(),
+            file_name=handle.filename,
+            mime=handle.mime,
+            use_container_width=True
+        )
+    else:
+        st.info("Your report is being prepared...")
+        st.button("Refresh", key='report_refresh')
+    
+    st.markdown("""
+    <div class="info-box" style="margin-top: 2rem;">
+        <h3 style="color: #3b82f6; margin-bottom: 1rem;">What's Included in Your Report:</h3>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem; color: #cbd5e1;">
+            <div>✓ Executive Summary & Job Readiness Score</div>
+            <div>✓ Detailed Score Breakdown</div>
+            <div>✓ Technical Skills Analysis</div>
+            <div>✓ Skill Coverage by Category</div>
+            <div>✓ Resume Content Assessment</div>
+            <div>✓ Strengths & Improvement Areas</div>
+            <div>✓ Actionable Career Roadmap</div>
+            <div>✓ Course Recommendations</div>
+            <div>✓ Career Path Suggestions</div>
+            <div>✓ Job Opportunities</div>
+            <div>✓ Salary Expectations</div>
+            <div>✓ Placement Forecast</div>
+            <div>✓ Emerging Technologies</div>
+            <div>✓ 30-Day Action Plan</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Final Call to Action
 
 def main():
     # Inject premium CSS
@@ -1980,17 +2025,9 @@ def main():
     # Load datasets
     datasets = load_datasets()
     
-    # Initialize ML components if available
-    extractor = None
-    gnn_model = None
-    graph_data = None
-    if ML_AVAILABLE:
-        try:
-            extractor = IndustrySkillExtractor()
-            gnn_model = GINXMLC()
-            graph_data = datasets.get('pre_generated', {})
-        except Exception as e:
-            print(f"Failed to initialize ML components: {e}. Falling back to basic analysis.")
+    # ML components load in the background; basic analysis is available until they are ready
+    ml_runtime = get_ml_runtime()
+    graph_data = datasets.get('pre_generated', {})
     
     # Header Section
     st.markdown("""
@@ -2000,6 +2037,11 @@ def main():
         <div class="header-badge">Designed for Pre-final & Final Year Students</div>
     </div>
     """, unsafe_allow_html=True)
+
+    if not ml_runtime.ready:
+        st.caption("ML models are loading in the background; basic analysis is available right away.")
+    elif ml_runtime.error is not None:
+        st.caption(f"ML modules not fully loaded ({ml_runtime.error}). Running in basic mode.")
     
     # Career Journey Section
     st.markdown("""
@@ -2087,8 +2129,7 @@ def main():
     
     target_role = st.selectbox(
         "Choose the role you're targeting",
-        ["Software Engineer", "Data Scientist", "Frontend Developer", "Full Stack Developer", "Mobile App Developer", 
-         "Artificial Intelligence", "Blockchain", "VR & AR", "Big Data", "Data Science", "Cyber Security"],
+        ROLE_MODEL.role_names(),
         help="This helps provide role-specific skill gap analysis and recommendations",
         label_visibility="collapsed",
         index=0
@@ -2122,404 +2163,41 @@ def main():
             ("Generating Personalized Career Roadmap...", 100)
         ]
         
-        for step_text, progress in steps:
-            elapsed = time.time() - start_time
+        completed_stages = []
+        
+        def show_progress(stage_name=None, _value=None):
+            if stage_name:
+                completed_stages.append(stage_name)
+            progress = min(95, 20 + 8 * len(completed_stages))
+            step_text = steps[min(progress // 20, len(steps)) - 1][0]
             with loading_placeholder.container():
-                st.markdown(create_enhanced_loading_screen(step_text, progress, elapsed), unsafe_allow_html=True)
-            time.sleep(1.2)
+                st.markdown(create_enhanced_loading_screen(step_text, progress, time.time() - start_time), unsafe_allow_html=True)
         
-        loading_placeholder.empty()
+        show_progress()
         
-        # Perform analysis
-        if ML_AVAILABLE and extractor and gnn_model and graph_data:
-            results = analyze_resume_with_ml(resume_content, target_role, extractor, gnn_model, graph_data, datasets)
+        # Perform analysis; the loading screen advances as each stage completes
+        if ml_runtime.available:
+            results = analyze_resume_with_ml(resume_content, target_role, ml_runtime.section_extractor, ml_runtime.skill_predictor, graph_data, datasets, on_stage=show_progress)
         else:
-            results = analyze_resume_content(resume_content, target_role, datasets)
+            results = analyze_resume_content(resume_content, target_role, datasets, on_stage=show_progress)
         
+        loading_placeholder.empty()
+        
+        # Results live in the server-side store; the session only keeps their handle
         st.session_state.analysis_complete = True
-        st.session_state.analysis_results = results
+        st.session_state.analysis_handle = get_result_store().put(results_hash(results, target_role), results, target_role)
         
         st.success("Analysis Complete! Here's your comprehensive career assessment:")
-        
-        # Job Readiness Score Section with perfect alignment
-        readiness_data = results['readiness_level']
-        
-        col1, col2 = st.columns([1, 2])
-        
-        with col1:
-            st.markdown(f"""
-            <div class="score-card">
-                <div class="score-label">Job Readiness Score</div>
-                <div class="score-display">{results['overall_score']}/100</div>
-                <div class="score-status" style="background: {readiness_data['color']}; color: white;">
-                    {readiness_data['icon']} {readiness_data['level']}
-                </div>
-                <div style="color: #94a3b8; margin-top: 1rem; font-size: 1rem; line-height: 1.6;">
-                    {readiness_data['description']}
-                </div>
-                <div style="color: #64748b; margin-top: 0.75rem; font-size: 0.9rem; font-weight: 600;">
-                    Next Step: {readiness_data['next_step']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            fig = create_readiness_gauge(results['overall_score'], readiness_data)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        # Detailed Breakdown with perfect grid alignment
-        st.markdown('<h2 class="section-header">Detailed Assessment Breakdown</h2>', unsafe_allow_html=True)
-        
-        score_cols = st.columns(4)
-        scores = [
-            ("Technical Skills", results['skill_match_score'], "#3b82f6"),
-            ("Content Quality", results['content_quality_score'], "#10b981"),
-            ("Project Experience", results['experience_score'], "#8b5cf6"),
-            ("Presentation", results['presentation_score'], "#06b6d4")
-        ]
-        
-        for col, (label, score, color) in zip(score_cols, scores):
-            with col:
-                st.markdown(f"""
-                <div class="analysis-card">
-                    <div class="card-title">{label}</div>
-                    <div class="card-content">
-                        <div style="font-size: 2.5rem; font-weight: 800; color: {color}; margin-bottom: 0.75rem;">{score:.0f}%</div>
-                        <div class="progress-container">
-                            <div class="progress-bar" style="width: {score}%;"></div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Skills Visualization Section
-        st.markdown('<h2 class="section-header">Skills Coverage Analysis</h2>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([3, 2])
-        
-        with col1:
-            radar_fig = create_skills_radar_chart(results['found_skills'], results['missing_skills'], target_role)
-            st.plotly_chart(radar_fig, use_container_width=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="analysis-card" style="height: 400px; display: flex; flex-direction: column; justify-content: center;">
-                <div class="card-title">Coverage Summary</div>
-                <div class="card-content" style="text-align: center;">
-                    <div style="margin-bottom: 1.5rem;">
-                        <div style="font-size: 2.5rem; font-weight: 800; color: #10b981;">{len(results['found_skills'])}</div>
-                        <div style="color: #94a3b8; font-size: 1rem;">Skills Found</div>
-                    </div>
-                    <div style="margin-bottom: 1.5rem;">
-                        <div style="font-size: 2.5rem; font-weight: 800; color: #ef4444;">{len(results['missing_skills'])}</div>
-                        <div style="color: #94a3b8; font-size: 1rem;">Skills to Learn</div>
-                    </div>
-                    <div>
-                        <div style="font-size: 2.5rem; font-weight: 800; color: #3b82f6;">{results['skill_match_score']:.0f}%</div>
-                        <div style="color: #94a3b8; font-size: 1rem;">Skill Match</div>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Skill Distribution Chart
-        if 'skill_distribution' in results:
-            st.plotly_chart(create_skill_distribution_chart(results['skill_distribution']), use_container_width=True)
-        
-        # Technical Skills Section with two-column layout
-        st.markdown('<h2 class="section-header">Technical Skills Analysis</h2>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            <div class="analysis-card">
-                <div class="card-title">Skills You Have</div>
-                <div class="card-content">
-            """, unsafe_allow_html=True)
-            for skill in results['found_skills']:
-                st.markdown(f'<span class="skill-tag present">{skill.title()}</span>', unsafe_allow_html=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class="analysis-card">
-                <div class="card-title">Priority Skills to Learn</div>
-                <div class="card-content">
-            """, unsafe_allow_html=True)
-            for skill in results['missing_skills']:
-                st.markdown(f'<span class="skill-tag missing">{skill.title()}</span>', unsafe_allow_html=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
-        
-        # Resume Content Analysis
-        st.markdown('<h2 class="section-header">Resume Content Assessment</h2>', unsafe_allow_html=True)
-        
-        content_cols = st.columns(3)
-        content_checks = [
-            ("Contact Information", results['has_contact_info'], "Include email, phone, LinkedIn"),
-            ("Education Details", results['has_education'], "Add degree, university, CGPA"),
-            ("Projects", results['has_projects'], "Showcase 2-3 strong projects"),
-            ("Internship Experience", results['has_internship'], "Highlight internships"),
-            ("Achievements", results['has_achievements'], "List hackathons, awards"),
-            ("Leadership Roles", results['has_leadership'], "Mention club activities")
-        ]
-        
-        for i, (check_name, check_status, tip) in enumerate(content_checks):
-            with content_cols[i % 3]:
-                status_icon = "" if check_status else ""
-                status_color = "#10b981" if check_status else "#ef4444"
-                status_text = "Present" if check_status else "Missing"
-                st.markdown(f"""
-                <div class="analysis-card">
-                    <div class="card-title">{status_icon} {check_name}</div>
-                    <div class="card-content">
-                        <span style="color: {status_color}; font-weight: 700; font-size: 1.1rem;">
-                            {status_text}
-                        </span>
-                        <div style="color: #94a3b8; margin-top: 0.75rem; font-size: 0.9rem;">{tip}</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Strengths and Weaknesses with perfect two-column layout
-        st.markdown('<h2 class="section-header">Strengths & Areas for Improvement</h2>', unsafe_allow_html=True)
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("""
-            <div class="analysis-card">
-                <div class="card-title">Your Strengths</div>
-                <div class="card-content">
-            """, unsafe_allow_html=True)
-            for i, strength in enumerate(results['strengths'], 1):
-                st.markdown(f'<div style="margin: 0.75rem 0; color: #10b981; font-size: 0.95rem;"><strong>{i}.</strong> {strength}</div>', unsafe_allow_html=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div class="analysis-card">
-                <div class="card-title">Areas to Improve</div>
-                <div class="card-content">
-            """, unsafe_allow_html=True)
-            for i, weakness in enumerate(results['weaknesses'], 1):
-                st.markdown(f'<div style="margin: 0.75rem 0; color: #ef4444; font-size: 0.95rem;"><strong>{i}.</strong> {weakness}</div>', unsafe_allow_html=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
-        
-        # Personalized Recommendations
-        st.markdown('<h2 class="section-header">Your Personalized Career Roadmap</h2>', unsafe_allow_html=True)
-        
-        for i, rec in enumerate(results['recommendations'], 1):
-            priority_class = {
-                'high': 'priority-high',
-                'medium': 'priority-medium',
-                'low': 'priority-low'
-            }[rec['priority']]
-            st.markdown(f"""
-            <div class="recommendation-item">
-                <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 0.75rem;">
-                    <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; flex: 1;">{i}. {rec['text']}</div>
-                    <div class="recommendation-priority {priority_class}">{rec['priority'].upper()}</div>
-                </div>
-                <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
-                    <strong style="color: #cbd5e1;">Action:</strong> {rec['action']} &nbsp;|&nbsp;
-                    <strong style="color: #cbd5e1;">Timeline:</strong> {rec['timeline']}<br>
-                    <strong style="color: #cbd5e1;">Impact:</strong> {rec['impact']}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Course Recommendations
-        if results['course_recommendations']:
-            st.markdown('<h2 class="section-header">Recommended Courses</h2>', unsafe_allow_html=True)
-            
-            course_cols = st.columns(2)
-            for i, course in enumerate(results['course_recommendations']):
-                with course_cols[i % 2]:
-                    priority_class = 'priority-high' if course.get('priority') == 'High' else 'priority-medium'
-                    st.markdown(f"""
-                    <div class="recommendation-item">
-                        <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; margin-bottom: 0.75rem;">{course['course']}</div>
-                        <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
-                            <strong>Skill:</strong> {course['skill']}<br>
-                            <strong>Provider:</strong> {course['provider']}<br>
-                            <strong>Duration:</strong> {course['duration']}
-                        </div>
-                        <div class="recommendation-priority {priority_class}" style="margin-top: 0.75rem;">{course.get('priority', 'Medium')} Priority</div>
-                    </div>
-                    """, unsafe_allow_html=True)
-        
-        # Career Path Suggestions
-        st.markdown('<h2 class="section-header">Career Path Suggestions</h2>', unsafe_allow_html=True)
-        
-        career_cols = st.columns(2)
-        for i, suggestion in enumerate(results['career_suggestions']):
-            with career_cols[i % 2]:
-                match_percentage = float(suggestion['match'].strip('%'))
-                match_color = "#10b981" if match_percentage >= 80 else "#f59e0b" if match_percentage >= 65 else "#ef4444"
-                st.markdown(f"""
-                <div class="recommendation-item">
-                    <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; margin-bottom: 0.75rem;">{suggestion['role']}</div>
-                    <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
-                        <strong>Match:</strong> <span style="color: {match_color}; font-weight: 700; font-size: 1.1rem;">{suggestion['match']}</span><br>
-                        <strong>Reason:</strong> {suggestion['reason']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Job Matches
-        st.markdown('<h2 class="section-header">Potential Job Opportunities</h2>', unsafe_allow_html=True)
-        
-        job_cols = st.columns(2)
-        for i, job in enumerate(results['job_matches']):
-            with job_cols[i % 2]:
-                match_color = "#10b981" if job['match_percentage'] >= 80 else "#f59e0b" if job['match_percentage'] >= 60 else "#ef4444"
-                st.markdown(f"""
-                <div class="recommendation-item">
-                    <div style="font-weight: 700; color: #e2e8f0; font-size: 1.05rem; margin-bottom: 0.75rem;">{job['title']}</div>
-                    <div style="color: #94a3b8; font-size: 0.9rem; line-height: 1.6;">
-                        <strong>Match:</strong> <span style="color: {match_color}; font-weight: 700;">{job['match_percentage']}%</span><br>
-                        <strong>Description:</strong> {job['description']}<br>
-                        <strong>Companies:</strong> {job['companies']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Salary Expectations
-        st.markdown('<h2 class="section-header">Salary Expectations</h2>', unsafe_allow_html=True)
-        
-        salary_fig = create_salary_chart(results['salary_info'])
-        st.plotly_chart(salary_fig, use_container_width=True)
-        
-        st.markdown("""
-        <div class="info-box">
-            <strong>Note:</strong> These are estimated salary ranges based on your skills, target role, and current market trends.
-            Actual salaries may vary based on company size, location, specific role requirements, and your negotiation skills.
-            Focus on building strong skills and a solid portfolio to maximize your earning potential.
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Emerging Technologies
-        st.markdown('<h2 class="section-header">Emerging Technologies to Watch</h2>', unsafe_allow_html=True)
-        
-        st.markdown(f"""
-        <div class="analysis-card">
-            <div class="card-title">Trending in {target_role}</div>
-            <div class="card-content">
-                <div style="margin-bottom: 1.5rem;">
-                    {"".join([f'<span class="skill-tag present">{tech.title()}</span>' for tech in results['emerging_tech_analysis']['trending']])}
-                </div>
-                <div style="color: #cbd5e1; margin-top: 1rem;">
-                    <strong style="color: #3b82f6;">Recommended Focus:</strong> {', '.join([tech.title() for tech in results['emerging_tech_analysis']['recommendations']])}
-                </div>
-                <div style="color: #94a3b8; margin-top: 0.75rem; font-size: 0.9rem;">
-                    Growth Outlook: <span style="color: #10b981; font-weight: 600;">{results['emerging_tech_analysis']['growth_rate']}</span>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Placement Forecast
-        st.markdown('<h2 class="section-header">Placement Forecast</h2>', unsafe_allow_html=True)
-        
-        forecast = results['placement_forecast']
-        forecast_color = "#10b981" if forecast['probability'] >= 80 else "#3b82f6" if forecast['probability'] >= 65 else "#f59e0b"
-        
-        st.markdown(f"""
-        <div class="analysis-card">
-            <div class="card-title">Job Placement Outlook</div>
-            <div class="card-content">
-                <div style="text-align: center; margin: 1.5rem 0;">
-                    <div style="font-size: 3.5rem; font-weight: 900; color: {forecast_color};">{forecast['probability']}%</div>
-                    <div style="color: #94a3b8; font-size: 1.1rem; margin-top: 0.5rem;">
-                        Placement Probability within <strong style="color: #e2e8f0;">{forecast['timeframe']} Months</strong>
-                    </div>
-                    <div style="margin-top: 1rem;">
-                        <span style="background: {forecast_color}; color: white; padding: 0.5rem 1.5rem; border-radius: 50px; font-weight: 600;">
-                            {forecast['confidence']} Confidence
-                        </span>
-                    </div>
-                </div>
-                <div style="color: #cbd5e1; margin-top: 1.5rem;">
-                    <strong>Key Contributing Factors:</strong>
-                    <ul style="color: #94a3b8; margin-top: 0.75rem; line-height: 1.8;">
-                        {"".join([f'<li>{factor}</li>' for factor in forecast['key_factors']])}
-                    </ul>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Achievements Section
-        st.markdown('<h2 class="section-header">Your Achievements</h2>', unsafe_allow_html=True)
-        
-        achievements = []
-        if results['has_projects']:
-            achievements.append("Completed Notable Projects")
-        if results['has_internship']:
-            achievements.append("Gained Industry Experience")
-        if results['has_achievements']:
-            achievements.append("Recognized in Competitions/Certifications")
-        if results['has_leadership']:
-            achievements.append("Demonstrated Leadership")
-        if results['has_certifications']:
-            achievements.append("Earned Professional Certifications")
-        
-        if achievements:
-            st.markdown("""
-            <div class="analysis-card">
-                <div class="card-title">Your Milestones</div>
-                <div class="card-content" style="text-align: center;">
-            """, unsafe_allow_html=True)
-            for achievement in achievements:
-                st.markdown(f'<span class="achievement-badge">{achievement}</span>', unsafe_allow_html=True)
-            st.markdown("</div></div>", unsafe_allow_html=True)
+    
+    # Results persist across reruns (widget clicks, downloads) without re-running the analysis
+    if st.session_state.analysis_complete:
+        stored = get_result_store().get(st.session_state.analysis_handle)
+        if stored is None:
+            st.session_state.analysis_complete = False
+            st.info("Your previous analysis has expired. Please analyze your resume again.")
         else:
-            st.markdown("""
-            <div class="analysis-card">
-                <div class="card-content" style="text-align: center; color: #94a3b8;">
-                    Start building your achievements by working on projects, internships, or competitions!
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Download Report Section
-        st.markdown('<h2 class="section-header">Download Your Report</h2>', unsafe_allow_html=True)
-        
-        report_content = generate_txt_report(results, target_role, resume_content)
-        
-        st.download_button(
-            label="Download Complete Analysis Report (TXT)",
-            data=report_content,
-            file_name=f"Job_Bridge_Analysis_{target_role.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-            mime="text/plain",
-            use_container_width=True
-        )
-        
-        st.markdown("""
-        <div class="info-box" style="margin-top: 2rem;">
-            <h3 style="color: #3b82f6; margin-bottom: 1rem;">What's Included in Your Report:</h3>
-            <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem; color: #cbd5e1;">
-                <div>✓ Executive Summary & Job Readiness Score</div>
-                <div>✓ Detailed Score Breakdown</div>
-                <div>✓ Technical Skills Analysis</div>
-                <div>✓ Skill Coverage by Category</div>
-                <div>✓ Resume Content Assessment</div>
-                <div>✓ Strengths & Improvement Areas</div>
-                <div>✓ Actionable Career Roadmap</div>
-                <div>✓ Course Recommendations</div>
-                <div>✓ Career Path Suggestions</div>
-                <div>✓ Job Opportunities</div>
-                <div>✓ Salary Expectations</div>
-                <div>✓ Placement Forecast</div>
-                <div>✓ Emerging Technologies</div>
-                <div>✓ 30-Day Action Plan</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Final Call to Action
-      
+            render_results(*stored, st.session_state.analysis_handle)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..")
+MODELS_DIR = os.path.join(REPO_ROOT, "Models")
+BUNDLES_DIR = os.path.join(MODELS_DIR, "bundles")
+BUNDLE_PREFIX = "bundle"
+MANIFEST_NAME = "manifest.json"
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ArtifactBundle:
+    """Read-only view of a built artifact bundle (see build_artifacts.py).
+
+    Arrays are memory-mapped, so opening a bundle is cheap and every process
+    on a host shares the same page-cache copy of the embeddings and indexes.
+    """
+    def __init__(self, path: str):
+        self.path = os.path.abspath(path)
+        with open(os.path.join(self.path, MANIFEST_NAME)) as f:
+            self.manifest: Dict = json.load(f)
+        self.artifacts: Dict[str, Dict] = self.manifest["artifacts"]
+        self._cache: Dict[str, Any] = {}
+
+    @property
+    def version(self) -> int:
+        return self.manifest["version"]
+
+    def has(self, name: str) -> bool:
+        return name in self.artifacts
+
+    def path_of(self, name: str) -> str:
+        return os.path.join(self.path, self.artifacts[name]["path"])
+
+    def array(self, name: str) -> np.ndarray:
+        if name not in self._cache:
+            self._cache[name] = np.load(self.path_of(name), mmap_mode="r")
+        return self._cache[name]
+
+    def json(self, name: str) -> Any:
+        if name not in self._cache:
+            with open(self.path_of(name)) as f:
+                self._cache[name] = json.load(f)
+        return self._cache[name]
+
+    def pickle(self, name: str) -> Any:
+        if name not in self._cache:
+            with open(self.path_of(name), "rb") as f:
+                self._cache[name] = pickle.load(f)
+        return self._cache[name]
+
+    def models_dir(self, name: str, default: str) -> str:
+        """Directory holding a bundled checkpoint artifact (with its LATEST pointer), or ``default``"""
+        return os.path.dirname(self.path_of(name)) if self.has(name) else default
+
+    def verify(self) -> List[str]:
+        """Names of artifacts whose content no longer matches the manifest hash"""
+        return [name for name, meta in self.artifacts.items()
+                if not os.path.exists(self.path_of(name)) or file_sha256(self.path_of(name)) != meta["sha256"]]
+
+    def stale_sources(self) -> List[str]:
+        """Source data files (relative to the repo root) that changed since the bundle was built"""
+        stale = []
+        for path, digest in self.manifest.get("sources", {}).items():
+            full_path = os.path.join(REPO_ROOT, path)
+            if not os.path.exists(full_path) or file_sha256(full_path) != digest:
+                stale.append(path)
+        return stale
+
+    @classmethod
+    def open(cls, path: Optional[str] = None, bundles_dir: str = BUNDLES_DIR) -> Optional["ArtifactBundle"]:
+        """Open ``path`` or the bundle named in CURRENT; None when no bundle has been built"""
+        if path is None:
+            current = os.path.join(bundles_dir, "CURRENT")
+            if not os.path.exists(current):
+                return None
+            with open(current) as f:
+                path = os.path.join(bundles_dir, f.read().strip())
+        if not os.path.exists(os.path.join(path, MANIFEST_NAME)):
+            return None
+        return cls(path)
+
+_bundle = None
+_bundle_loaded = False
+_bundle_lock = threading.Lock()
+
+def get_bundle() -> Optional[ArtifactBundle]:
+    """Process-wide current bundle; JOBBRIDGE_BUNDLE overrides the CURRENT pointer.
+    A bundle built from older source data is still served, with a warning to rebuild it."""
+    global _bundle, _bundle_loaded
+    if not _bundle_loaded:
+        with _bundle_lock:
+            if not _bundle_loaded:
+                _bundle = ArtifactBundle.open(os.environ.get("JOBBRIDGE_BUNDLE") or None)
+                stale = _bundle.stale_sources() if _bundle is not None else []
+                if stale:
+                    logger.warning(f"Bundle v{_bundle.version} is stale ({', '.join(stale)} changed since it was built); "
+                                   f"run build_artifacts.py to rebuild it")
+                _bundle_loaded = True
+    return _bundle
@@ -0,0 +1,163 @@
+import argparse
+import json
+import logging
+import os
+import pickle
+import shutil
+from datetime import datetime
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from artifact_bundle import (BUNDLE_PREFIX, BUNDLES_DIR, MANIFEST_NAME, MODELS_DIR, REPO_ROOT, ArtifactBundle,
+                             file_sha256)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(REPO_ROOT, "Data")
+SOURCE_FILES = ["Data/skills_dataset.csv", "Data/courses.csv", "Data/role_requirements.json"]
+
+class BundleWriter:
+    """Writes artifacts into a staging directory and records their hashes in the manifest"""
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.artifacts: Dict[str, Dict] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def record(self, name: str, relative_path: str):
+        path = os.path.join(self.directory, relative_path)
+        self.artifacts[name] = {"path": relative_path, "sha256": file_sha256(path), "bytes": os.path.getsize(path)}
+
+    def array(self, name: str, array: np.ndarray):
+        np.save(os.path.join(self.directory, f"{name}.npy"), np.ascontiguousarray(array))
+        self.record(name, f"{name}.npy")
+
+    def json(self, name: str, data):
+        with open(os.path.join(self.directory, f"{name}.json"), "w") as f:
+            json.dump(data, f)
+        self.record(name, f"{name}.json")
+
+    def pickle(self, name: str, obj):
+        with open(os.path.join(self.directory, f"{name}.pkl"), "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.record(name, f"{name}.pkl")
+
+    def file(self, name: str, source: str, relative_path: str):
+        os.makedirs(os.path.dirname(os.path.join(self.directory, relative_path)), exist_ok=True)
+        shutil.copyfile(source, os.path.join(self.directory, relative_path))
+        self.record(name, relative_path)
+
+def next_version(bundles_dir: str) -> int:
+    versions = [int(name.rsplit("-v", 1)[1]) for name in os.listdir(bundles_dir)
+                if name.startswith(f"{BUNDLE_PREFIX}-v") and name.rsplit("-v", 1)[1].isdigit()] if os.path.isdir(bundles_dir) else []
+    return max(versions, default=0) + 1
+
+def build_artifacts(bundles_dir: str = BUNDLES_DIR, models_dir: str = MODELS_DIR) -> str:
+    """Compute every derived artifact once into a new versioned bundle and point CURRENT at it"""
+    import sklearn
+    import torch
+    from advanced_skill_extractor import IndustrySkillDatabase, flatten_taxonomy, similarity_edges
+    from cooccurrence_recommender import train_recommender
+    from data_synthesizer import build_skill_graph
+    from course_search import CourseSearchEngine
+    from enhanced_placement_forecaster import fit_duration_model
+    from gnn_skill_predictor import ENCODER_NAME, get_bi_encoder
+    from skill_clusters import SkillClusterIndex, load_skill_vocabulary
+    from skill_demand_cube import SkillDemandCube
+
+    version = next_version(bundles_dir)
+    name = f"{BUNDLE_PREFIX}-v{version}"
+    staging = os.path.join(bundles_dir, f".{name}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    writer = BundleWriter(staging)
+    encoder = get_bi_encoder()
+
+    # Taxonomy embeddings and the similarity graph used by the skill extractor
+    taxonomy = IndustrySkillDatabase().skill_taxonomy
+    taxonomy_skills = flatten_taxonomy(taxonomy)
+    taxonomy_embeddings = np.asarray(encoder.encode(taxonomy_skills), dtype=np.float32)
+    edges, weights = similarity_edges(taxonomy_embeddings)
+    writer.json("taxonomy_skills", taxonomy_skills)
+    writer.array("taxonomy_embeddings", taxonomy_embeddings)
+    writer.array("taxonomy_edges", edges)
+    writer.array("taxonomy_edge_weights", weights)
+
+    # Job/skill graph for the data synthesizer; the GNN's ontology, adjacency and
+    # node features travel inside its checkpoint
+    jobs_df = pd.read_csv(os.path.join(DATA_DIR, "skills_dataset.csv"))
+    jobs_df["skills"] = jobs_df["skills"].apply(lambda s: [x.strip() for x in s.split(",")] if isinstance(s, str) else [])
+    graph = build_skill_graph(jobs_df)
+    writer.json("skill_graph", graph)
+
+    # Skill demand cube (posting counts by year, location, category, role and demand level)
+    SkillDemandCube.from_csv(os.path.join(DATA_DIR, "skills_dataset.csv")).save(
+        os.path.join(staging, "demand_cube.npz"), os.path.join(staging, "demand_cube.json"))
+    writer.record("demand_cube", "demand_cube.npz")
+    writer.record("demand_cube_labels", "demand_cube.json")
+
+    # Sparse co-occurrence recommender (the cheap missing-skill predictor)
+    recommender = train_recommender()
+    recommender.save(os.path.join(staging, "cooccurrence.npz"), os.path.join(staging, "cooccurrence.json"))
+    writer.record("cooccurrence", "cooccurrence.npz")
+    writer.record("cooccurrence_meta", "cooccurrence.json")
+
+    # Course search embeddings and the placement duration regressor
+    course_search = CourseSearchEngine(pd.read_csv(os.path.join(DATA_DIR, "courses.csv"))).attach_encoder(encoder)
+    writer.array("course_embeddings", course_search.embeddings)
+    writer.pickle("forecaster", fit_duration_model())
+
+    # Skill cluster centroids over the whole vocabulary
+    clusters = SkillClusterIndex.build(load_skill_vocabulary(taxonomy), encoder)
+    clusters.save(os.path.join(staging, "skill_clusters.npz"), os.path.join(staging, "skill_clusters.json"))
+    writer.record("skill_clusters", "skill_clusters.npz")
+    writer.record("skill_cluster_assignments", "skill_clusters.json")
+
+    # Trained GNN checkpoint, when one exists
+    models = {"encoder": ENCODER_NAME, "torch": torch.__version__, "sklearn": sklearn.__version__, "gnn_checkpoint": None}
+    latest = os.path.join(models_dir, "LATEST")
+    if os.path.exists(latest):
+        with open(latest) as f:
+            checkpoint_name = f.read().strip()
+        writer.file("gnn_checkpoint", os.path.join(models_dir, checkpoint_name), os.path.join("gnn", checkpoint_name))
+        with open(os.path.join(staging, "gnn", "LATEST"), "w") as f:
+            f.write(checkpoint_name)
+        models["gnn_checkpoint"] = checkpoint_name
+
+    manifest = {
+        "version": version,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "encoder": ENCODER_NAME,
+        "course_fingerprint": course_search.fingerprint,
+        "models": models,
+        "sources": {path: file_sha256(os.path.join(REPO_ROOT, path)) for path in SOURCE_FILES
+                    if os.path.exists(os.path.join(REPO_ROOT, path))},
+        "artifacts": writer.artifacts,
+    }
+    with open(os.path.join(staging, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    final = os.path.join(bundles_dir, name)
+    os.replace(staging, final)
+    current_tmp = os.path.join(bundles_dir, "CURRENT.tmp")
+    with open(current_tmp, "w") as f:
+        f.write(name)
+    os.replace(current_tmp, os.path.join(bundles_dir, "CURRENT"))
+    logger.info(f"Built {name} with {len(writer.artifacts)} artifacts in {final}")
+    return final
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="build-artifacts: precompute embeddings, indexes and models into a versioned bundle")
+    parser.add_argument("--bundles-dir", default=BUNDLES_DIR)
+    parser.add_argument("--verify", action="store_true", help="Check the current bundle's hashes and sources instead of building")
+    args = parser.parse_args()
+    if args.verify:
+        bundle = ArtifactBundle.open(bundles_dir=args.bundles_dir)
+        if bundle is None:
+            raise SystemExit("No bundle has been built yet")
+        corrupt, stale = bundle.verify(), bundle.stale_sources()
+        print(f"{os.path.basename(bundle.path)}: {len(bundle.artifacts)} artifacts, corrupt={corrupt}, stale sources={stale}")
+        raise SystemExit(1 if corrupt or stale else 0)
+    print(build_artifacts(args.bundles_dir))
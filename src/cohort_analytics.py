@@ -0,0 +1,242 @@
+import argparse
+import json
+import os
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from role_model import ROLE_MODEL, RoleModel
+from skill_vocabulary import SkillVocabulary, get_skill_vocabulary
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+COURSES_CSV_PATH = os.path.join(DATA_DIR, "courses.csv")
+
+# Mirrors the thresholds of get_student_readiness_level in app_enhanced.py
+READINESS_BANDS = [(85, "Job Ready"), (70, "Almost Ready"), (55, "Developing"), (0, "Beginning")]
+SCORE_BINS = np.arange(0, 101, 10)
+
+def readiness_band(scores: np.ndarray) -> np.ndarray:
+    """Index into READINESS_BANDS for each score"""
+    scores = np.asarray(scores, dtype=float)
+    band = np.full(scores.shape, len(READINESS_BANDS) - 1, dtype=np.int64)
+    for i, (threshold, _) in reversed(list(enumerate(READINESS_BANDS[:-1]))):
+        band[scores >= threshold] = i
+    return band
+
+class _RoleAggregate:
+    """Running per-role sums that make up the materialized cohort summary"""
+    def __init__(self, skills: List[str], skill_ids: np.ndarray):
+        self.skills = skills
+        self.skill_ids = skill_ids
+        self.students = 0
+        self.found_counts = np.zeros(len(skills), dtype=np.int64)
+        self.readiness = np.zeros(len(READINESS_BANDS), dtype=np.int64)
+        self.score_hist = np.zeros(len(SCORE_BINS) - 1, dtype=np.int64)
+        self.score_sum = 0.0
+
+    def apply(self, found: np.ndarray, scores: np.ndarray, sign: int = 1):
+        self.students += sign * len(scores)
+        self.found_counts += sign * found.sum(axis=0)
+        self.readiness += sign * np.bincount(readiness_band(scores), minlength=len(READINESS_BANDS))
+        self.score_hist += sign * np.histogram(np.clip(scores, 0, 100), bins=SCORE_BINS)[0]
+        self.score_sum += sign * float(scores.sum())
+
+class CohortAnalytics:
+    """Incrementally maintained cohort aggregates for placement officers.
+
+    Students are added as analyzed results (``student_id``, ``target_role``,
+    ``found_skills``, ``overall_score``) or raw resume text. Each batch is folded
+    into per-role sums in one vectorized pass over skill bitsets; re-submitting a
+    student replaces their previous contribution. ``summary()`` is cached until
+    the next change.
+    """
+    def __init__(self, role_model: RoleModel = ROLE_MODEL, vocabulary: Optional[SkillVocabulary] = None,
+                 courses: Optional[pd.DataFrame] = None):
+        self.role_model = role_model
+        self.vocabulary = vocabulary or get_skill_vocabulary()
+        self._roles: Dict[str, _RoleAggregate] = {}
+        self._students: Dict[str, Tuple[str, np.ndarray, float]] = {}
+        self._summary: Dict[Tuple[int, float], Dict] = {}
+        self._next_default_id = 0
+        if courses is None and os.path.exists(COURSES_CSV_PATH):
+            courses = pd.read_csv(COURSES_CSV_PATH)
+        self._course_index = self._index_courses(courses)
+
+    @staticmethod
+    def _index_courses(courses: Optional[pd.DataFrame]) -> Dict[str, Tuple[int, float]]:
+        if courses is None or courses.empty or 'skills' not in courses.columns:
+            return {}
+        weeks = pd.to_numeric(courses.get('duration_weeks'), errors='coerce') if 'duration_weeks' in courses.columns else None
+        frame = pd.DataFrame({'skill': courses['skills'].astype(str).str.strip().str.lower(),
+                              'weeks': weeks if weeks is not None else np.nan})
+        grouped = frame.groupby('skill')['weeks'].agg(['count', 'mean'])
+        return {skill: (int(row['count']), float(row['mean'])) for skill, row in grouped.iterrows()}
+
+    def _aggregate(self, role_name: str) -> _RoleAggregate:
+        if role_name not in self._roles:
+            role = self.role_model.get(role_name)
+            ids = np.array([self.vocabulary.intern(s) for s in role.skills], dtype=np.int64)
+            self._roles[role_name] = _RoleAggregate(role.skills, ids)
+        return self._roles[role_name]
+
+    def _found_matrix(self, aggregate: _RoleAggregate, skill_sets: List[Iterable[str]]) -> np.ndarray:
+        bits = self.vocabulary.bitset_matrix(skill_sets, add=False)
+        ids = aggregate.skill_ids
+        if ids.size and bits.shape[1] <= int(ids.max() >> 6):
+            bits = np.pad(bits, ((0, 0), (0, int(ids.max() >> 6) + 1 - bits.shape[1])))
+        return ((bits[:, ids >> 6] >> (ids & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+    def add_results(self, records: Iterable[Dict]):
+        """Fold analyzed results into the summary; a repeated student_id replaces the earlier record"""
+        # Within a batch the last record per student wins
+        latest: Dict[str, Dict] = {}
+        for record in records:
+            record = dict(record)
+            if record.get('student_id') is None:
+                record['student_id'] = self._default_id()
+            latest.pop(str(record['student_id']), None)
+            latest[str(record['student_id'])] = record
+        by_role: Dict[str, List[Dict]] = {}
+        for student_id, record in latest.items():
+            self.remove(student_id)
+            by_role.setdefault(self.role_model.get(record.get('target_role')).name, []).append(record)
+        for role_name, group in by_role.items():
+            aggregate = self._aggregate(role_name)
+            found = self._found_matrix(aggregate, [r.get('found_skills', []) for r in group])
+            coverage = found.mean(axis=1) * 100 if found.shape[1] else np.zeros(len(group))
+            scores = np.array([r['overall_score'] if r.get('overall_score') is not None else c
+                               for r, c in zip(group, coverage)], dtype=float)
+            aggregate.apply(found, scores)
+            for record, row, score in zip(group, found, scores):
+                self._students[str(record['student_id'])] = (role_name, row, float(score))
+        self._summary = {}
+
+    def _default_id(self) -> str:
+        # Monotonic, so ids stay unique after students are removed
+        while True:
+            student_id = f"student_{self._next_default_id}"
+            self._next_default_id += 1
+            if student_id not in self._students:
+                return student_id
+
+    def add_resumes(self, resumes: Iterable[Tuple[str, str, str]]):
+        """Add raw ``(student_id, resume_text, target_role)`` triples using the compiled role matcher.
+
+        Without a full analysis the readiness band falls back to the skill match percentage.
+        """
+        self.add_results({
+            'student_id': student_id,
+            'target_role': role,
+            'found_skills': self.role_model.get(role).match_text(text).found_skills,
+            'overall_score': None,
+        } for student_id, text, role in resumes)
+
+    def remove(self, student_id: str) -> bool:
+        previous = self._students.pop(student_id, None)
+        if previous is None:
+            return False
+        role_name, row, score = previous
+        self._roles[role_name].apply(row[None, :], np.array([score]), sign=-1)
+        self._summary = {}
+        return True
+
+    def __len__(self) -> int:
+        return len(self._students)
+
+    def coverage_heatmap(self) -> Tuple[List[str], List[str], np.ndarray]:
+        """Role x skill coverage percentages; NaN where a skill is not required by the role"""
+        roles = [r for r, agg in self._roles.items() if agg.students > 0]
+        skills = list(dict.fromkeys(s for r in roles for s in self._roles[r].skills))
+        column = {s: i for i, s in enumerate(skills)}
+        matrix = np.full((len(roles), len(skills)), np.nan)
+        for row, role_name in enumerate(roles):
+            agg = self._roles[role_name]
+            matrix[row, [column[s] for s in agg.skills]] = agg.found_counts / agg.students * 100
+        return roles, skills, matrix
+
+    def summary(self, top_n: int = 10, uptake: float = 1.0) -> Dict:
+        """Materialized cohort summary: per-role coverage and gaps, readiness and course demand"""
+        if (top_n, uptake) in self._summary:
+            return self._summary[(top_n, uptake)]
+        roles = {}
+        gap_totals: Counter = Counter()
+        readiness_total = np.zeros(len(READINESS_BANDS), dtype=np.int64)
+        score_hist_total = np.zeros(len(SCORE_BINS) - 1, dtype=np.int64)
+        for role_name, agg in self._roles.items():
+            if agg.students <= 0:
+                continue
+            gaps = agg.students - agg.found_counts
+            order = np.argsort(-gaps, kind="stable")[:top_n]
+            gap_totals.update(dict(zip(agg.skills, gaps.tolist())))
+            readiness_total += agg.readiness
+            score_hist_total += agg.score_hist
+            roles[role_name] = {
+                'students': int(agg.students),
+                'average_score': round(agg.score_sum / agg.students, 1),
+                'coverage': {s: round(float(c) / agg.students * 100, 1) for s, c in zip(agg.skills, agg.found_counts)},
+                'top_gaps': [{'skill': agg.skills[i], 'students': int(gaps[i]), 'percentage': round(float(gaps[i]) / agg.students * 100, 1)}
+                             for i in order if gaps[i] > 0],
+                'readiness': {label: int(n) for (_, label), n in zip(READINESS_BANDS, agg.readiness)},
+            }
+        course_demand = []
+        for skill, students in gap_totals.most_common():
+            if students <= 0 or skill not in self._course_index:
+                continue
+            n_courses, avg_weeks = self._course_index[skill]
+            course_demand.append({
+                'skill': skill,
+                'students_needing': int(students),
+                'courses_available': n_courses,
+                'expected_enrollments': int(round(students * uptake)),
+                'seat_weeks': round(students * uptake * avg_weeks, 1) if not np.isnan(avg_weeks) else None,
+            })
+        self._summary[(top_n, uptake)] = summary = {
+            'students': len(self._students),
+            'roles': roles,
+            'top_gaps': [{'skill': s, 'students': int(n)} for s, n in gap_totals.most_common(top_n) if n > 0],
+            'readiness': {label: int(n) for (_, label), n in zip(READINESS_BANDS, readiness_total)},
+            'score_histogram': {f"{lo}-{hi}": int(n) for lo, hi, n in zip(SCORE_BINS[:-1], SCORE_BINS[1:], score_hist_total)},
+            'course_demand': course_demand,
+        }
+        return summary
+
+    def save(self, path: str):
+        """Persist per-student records; aggregates are rebuilt on load in one batch pass"""
+        records = [{'student_id': sid, 'target_role': role, 'found_skills': [s for s, hit in zip(self._roles[role].skills, row) if hit],
+                    'overall_score': score} for sid, (role, row, score) in self._students.items()]
+        with open(path, "w") as f:
+            json.dump(records, f)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "CohortAnalytics":
+        cohort = cls(**kwargs)
+        with open(path) as f:
+            cohort.add_results(json.load(f))
+        return cohort
+
+def summarize_cohort(records: Iterable[Dict], **kwargs) -> Dict:
+    """One-shot API: aggregate analyzed results and return the summary"""
+    cohort = CohortAnalytics(**kwargs)
+    cohort.add_results(records)
+    return cohort.summary()
+
+def read_records(path: str) -> List[Dict]:
+    """Load analyzed results from .json (list) or .jsonl (one record per line)"""
+    with open(path) as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize a cohort of analyzed resumes")
+    parser.add_argument("records", help="JSON or JSONL file of {student_id, target_role, found_skills, overall_score}")
+    parser.add_argument("--out", help="Write the summary JSON here instead of stdout")
+    args = parser.parse_args()
+    summary = summarize_cohort(read_records(args.records))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(summary, f, indent=2)
+    else:
+        print(json.dumps(summary, indent=2))
@@ -0,0 +1,160 @@
+import argparse
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import scipy.sparse as sp
+
+from skill_postings import load_postings, split_observed
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "Models")
+MATRIX_PATH = os.path.join(MODELS_DIR, "cooccurrence.npz")
+META_PATH = os.path.join(MODELS_DIR, "cooccurrence.json")
+
+def incidence_matrix(postings: Sequence[np.ndarray], n_skills: int) -> sp.csr_matrix:
+    """Binary job x skill matrix from each posting's skill ids"""
+    rows = np.repeat(np.arange(len(postings)), [len(p) for p in postings])
+    cols = np.concatenate(postings) if len(postings) else np.empty(0, dtype=np.int64)
+    return sp.csr_matrix((np.ones(len(cols), dtype=np.float32), (rows, cols)), shape=(len(postings), n_skills))
+
+def ppmi_matrix(incidence: sp.csr_matrix) -> sp.csr_matrix:
+    """Positive pointwise mutual information between skills that co-occur in a posting"""
+    n_jobs = incidence.shape[0]
+    counts = (incidence.T @ incidence).tocoo()
+    skill_counts = np.asarray(incidence.sum(axis=0)).ravel()
+    off_diagonal = counts.row != counts.col
+    rows, cols, joint = counts.row[off_diagonal], counts.col[off_diagonal], counts.data[off_diagonal]
+    pmi = np.log(joint * n_jobs / (skill_counts[rows] * skill_counts[cols]))
+    keep = pmi > 0
+    return sp.csr_matrix((pmi[keep].astype(np.float32), (rows[keep], cols[keep])), shape=counts.shape)
+
+def prune_top_k(matrix: sp.csr_matrix, k: int) -> sp.csr_matrix:
+    """Keep the k strongest neighbours in each row"""
+    matrix = matrix.tocsr()
+    indptr, indices, data = [0], [], []
+    for row in range(matrix.shape[0]):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        row_data, row_indices = matrix.data[start:end], matrix.indices[start:end]
+        if len(row_data) > k:
+            top = np.argpartition(-row_data, k)[:k]
+            row_data, row_indices = row_data[top], row_indices[top]
+        indices.append(row_indices)
+        data.append(row_data)
+        indptr.append(indptr[-1] + len(row_data))
+    return sp.csr_matrix((np.concatenate(data) if data else [], np.concatenate(indices) if indices else [], indptr),
+                         shape=matrix.shape)
+
+class CooccurrenceRecommender:
+    """Missing-skill predictor from pruned skill-skill PPMI over job postings.
+
+    PPMI picks each skill's neighbours; an edge's weight is the conditional
+    probability P(neighbour | skill) observed in the postings, and a student's
+    score for a skill is the noisy-OR over their known skills. The matrix stores log(1 - w) so scoring is a single
+    sparse vector-matrix product: ``1 - exp(q @ L)``.
+    """
+    def __init__(self, ontology: List[str], log_complement: sp.csr_matrix, metrics: Optional[Dict] = None):
+        self.ontology = ontology
+        self.skill_to_idx = {skill: i for i, skill in enumerate(ontology)}
+        self.log_complement = log_complement.tocsr()
+        self.metrics = metrics or {}
+
+    @classmethod
+    def build(cls, ontology: List[str], postings: Sequence[np.ndarray], top_k: int = 20, max_weight: float = 0.95) -> "CooccurrenceRecommender":
+        incidence = incidence_matrix(postings, len(ontology))
+        ppmi = prune_top_k(ppmi_matrix(incidence), top_k).tocoo()
+        joint = np.asarray((incidence.T @ incidence).tocsr()[ppmi.row, ppmi.col]).ravel()
+        skill_counts = np.asarray(incidence.sum(axis=0)).ravel()
+        conditional = np.minimum(joint / np.maximum(skill_counts[ppmi.row], 1), max_weight).astype(np.float32)
+        weights = sp.csr_matrix((conditional, (ppmi.row, ppmi.col)), shape=ppmi.shape)
+        weights.data = np.log1p(-weights.data)
+        logger.info(f"Built co-occurrence recommender over {len(ontology)} skills with {weights.nnz} edges")
+        return cls(ontology, weights)
+
+    def score_ids(self, ids: Sequence[int]) -> np.ndarray:
+        query = np.zeros(len(self.ontology), dtype=np.float32)
+        query[list(ids)] = 1.0
+        return 1.0 - np.exp(self.log_complement.T @ query)
+
+    def score(self, known_skills: Sequence[str]) -> np.ndarray:
+        """Noisy-OR confidence in [0, 1] for every ontology skill"""
+        return self.score_ids([self.skill_to_idx[s.lower()] for s in known_skills if s.lower() in self.skill_to_idx])
+
+    def recommend(self, known_skills: Sequence[str], k: int = 10) -> List[str]:
+        scores = self.score(known_skills)
+        scores[[self.skill_to_idx[s.lower()] for s in known_skills if s.lower() in self.skill_to_idx]] = -1.0
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [self.ontology[i] for i in top if scores[i] > 0]
+
+    def save(self, matrix_path: str = MATRIX_PATH, meta_path: str = META_PATH):
+        os.makedirs(os.path.dirname(matrix_path), exist_ok=True)
+        sp.save_npz(matrix_path, self.log_complement)
+        with open(meta_path, "w") as f:
+            json.dump({"ontology": self.ontology, "metrics": self.metrics}, f)
+
+    @classmethod
+    def load(cls, matrix_path: str = MATRIX_PATH, meta_path: str = META_PATH) -> Optional["CooccurrenceRecommender"]:
+        """Load the bundled or saved recommender; None when neither exists"""
+        from artifact_bundle import get_bundle
+        bundle = get_bundle()
+        if bundle is not None and bundle.has("cooccurrence"):
+            matrix_path, meta_path = bundle.path_of("cooccurrence"), bundle.path_of("cooccurrence_meta")
+        if not (os.path.exists(matrix_path) and os.path.exists(meta_path)):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return cls(meta["ontology"], sp.load_npz(matrix_path), meta.get("metrics"))
+
+def precision_at_k(recommender: CooccurrenceRecommender, postings: Sequence[np.ndarray], k: int,
+                   observed_fraction: float, seed: int) -> float:
+    """Same masked-posting protocol as gnn_trainer.precision_at_k, so the two predictors are comparable"""
+    rng = np.random.default_rng(seed)
+    precisions = []
+    for observed, hidden in (split_observed(ids, rng, observed_fraction) for ids in postings if len(ids) > 1):
+        scores = recommender.score_ids(observed)
+        scores[observed] = -1.0
+        top = set(np.argsort(-scores, kind="stable")[:k].tolist())
+        precisions.append(len(top & set(hidden.tolist())) / min(k, len(hidden)))
+    return float(np.mean(precisions)) if precisions else 0.0
+
+def train_recommender(top_k: int = 20, k: int = 5, observed_fraction: float = 0.5, val_fraction: float = 0.2,
+                      seed: int = 42) -> CooccurrenceRecommender:
+    """Fit on the training split used by gnn_trainer, record validation precision@k, then refit on all postings"""
+    ontology, postings = load_postings()
+    order = np.random.default_rng(seed).permutation(len(postings))
+    n_val = max(1, int(len(postings) * val_fraction))
+    val = [postings[i] for i in order[:n_val]]
+    train = [postings[i] for i in order[n_val:]]
+    precision = precision_at_k(CooccurrenceRecommender.build(ontology, train, top_k), val, k, observed_fraction, seed)
+    recommender = CooccurrenceRecommender.build(ontology, postings, top_k)
+    recommender.metrics = {f"precision_at_{k}": precision, "top_k": top_k, "val_postings": len(val)}
+    logger.info(f"Co-occurrence recommender precision@{k}={precision:.3f}")
+    return recommender
+
+def choose_skill_predictor(gnn_model, recommender: Optional[CooccurrenceRecommender], metric: str = "precision_at_5",
+                           margin: float = 0.02):
+    """Serve the GNN only when its validation metric beats the recommender's by ``margin``"""
+    if recommender is None:
+        return gnn_model
+    if gnn_model is None:
+        return recommender
+    gnn_score = (getattr(gnn_model, "checkpoint_info", None) or {}).get("metadata", {}).get(metric)
+    recommender_score = recommender.metrics.get(metric)
+    if gnn_score is None or recommender_score is None:
+        return recommender
+    return gnn_model if gnn_score > recommender_score + margin else recommender
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the sparse co-occurrence (PPMI) missing-skill recommender")
+    parser.add_argument("--top-k", type=int, default=20, help="Neighbours kept per skill")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    recommender = train_recommender(top_k=args.top_k, k=args.k, seed=args.seed)
+    recommender.save()
+    print("Saved co-occurrence recommender:", recommender.metrics)
@@ -0,0 +1,228 @@
+import argparse
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+from skill_vocabulary import SKILL_ALIASES
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+COURSES_CSV_PATH = os.path.join(DATA_DIR, "courses.csv")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+(?:\.[a-z0-9]+)*")
+
+def course_fingerprint(courses: pd.DataFrame) -> str:
+    """Content hash of a courses frame, ignoring its index"""
+    return hashlib.sha256(pd.util.hash_pandas_object(courses, index=False).values.tobytes()).hexdigest()
+
+def words(text: str) -> List[str]:
+    """Lowercase word tokens with aliases expanded; "node.js" also yields "node" and "js" """
+    expanded = []
+    for token in TOKEN_PATTERN.findall(str(text).lower()):
+        if token.isdigit():
+            continue
+        expanded.extend(SKILL_ALIASES.get(token, token).split())
+        if "." in token:
+            for part in token.split("."):
+                expanded.extend(SKILL_ALIASES.get(part, part).split())
+    return expanded
+
+def tokenize(text: str) -> List[str]:
+    """words() plus adjacent pairs joined, both as written and alias-expanded, so "ml ops" also matches "mlops" """
+    raw = [token for token in TOKEN_PATTERN.findall(str(text).lower()) if not token.isdigit()]
+    expanded = words(text)
+    joined = [a + b for a, b in zip(raw, raw[1:])] + [a + b for a, b in zip(expanded, expanded[1:])]
+    return expanded + list(dict.fromkeys(joined))
+
+class CourseSearchEngine:
+    """Hybrid course search over courses.csv.
+
+    BM25 scores come from a precomputed sparse (term x course) weight matrix,
+    so a batch of queries is one sparse product. Optional course embeddings
+    add semantic recall for gaps that share no words with a course. The two
+    rankings are fused with reciprocal rank fusion and nudged towards preferred
+    providers; course length only breaks ties between equally fused courses.
+    """
+    def __init__(self, courses: pd.DataFrame, k1: float = 1.2, b: float = 0.75, skills_boost: int = 2):
+        self.courses = courses.reset_index(drop=True)
+        self.records = self.courses[['course_name', 'skills', 'provider', 'duration_weeks']].to_dict('records')
+        self.weeks = pd.to_numeric(self.courses['duration_weeks'], errors='coerce').fillna(0).to_numpy(dtype=np.float32)
+        self.providers = self.courses['provider'].astype(str).to_numpy()
+        self.fingerprint = course_fingerprint(self.courses)
+        self.vocabulary: Dict[str, int] = {}
+        self.term_weights = self._build_bm25(k1, b, skills_boost)
+        self.embeddings: Optional[np.ndarray] = None
+        self.encoder = None
+
+    def _build_bm25(self, k1: float, b: float, skills_boost: int) -> sp.csr_matrix:
+        rows, cols = [], []
+        for doc, (name, skills) in enumerate(zip(self.courses['course_name'], self.courses['skills'])):
+            # The skills field counts skills_boost times, a simple BM25F field weight
+            for token in tokenize(name) + tokenize(skills) * skills_boost:
+                rows.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                cols.append(doc)
+        n_docs = len(self.courses)
+        tf = sp.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(len(self.vocabulary), n_docs))
+        tf.sum_duplicates()
+        doc_len = np.asarray(tf.sum(axis=0)).ravel()
+        avg_len = doc_len.mean() if n_docs else 1.0
+        df = np.diff(tf.indptr)
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        tf = tf.tocoo()
+        norm = k1 * (1 - b + b * doc_len[tf.col] / avg_len)
+        weights = idf[tf.row] * tf.data * (k1 + 1) / (tf.data + norm)
+        return sp.csr_matrix((weights.astype(np.float32), (tf.row, tf.col)), shape=tf.shape)
+
+    def attach_encoder(self, encoder, embeddings: Optional[np.ndarray] = None) -> "CourseSearchEngine":
+        """Enable semantic recall; course embeddings are encoded here unless precomputed ones are passed"""
+        if embeddings is None:
+            texts = (self.courses['skills'].astype(str) + ": " + self.courses['course_name'].astype(str)).tolist()
+            embeddings = np.asarray(encoder.encode(texts), dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        self.embeddings = embeddings / np.where(norms > 0, norms, 1)
+        self.encoder = encoder
+        return self
+
+    def _query_matrix(self, queries: Sequence[str]) -> sp.csr_matrix:
+        rows, cols = [], []
+        for row, query in enumerate(queries):
+            for token in set(tokenize(query)):
+                if token in self.vocabulary:
+                    rows.append(row)
+                    cols.append(self.vocabulary[token])
+        return sp.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(len(queries), len(self.vocabulary)))
+
+    def bm25_scores(self, queries: Sequence[str]) -> np.ndarray:
+        return (self._query_matrix(queries) @ self.term_weights).toarray()
+
+    def semantic_scores(self, queries: Sequence[str]) -> Optional[np.ndarray]:
+        if self.embeddings is None:
+            return None
+        query_embeddings = np.asarray(self.encoder.encode(list(queries)), dtype=np.float32)
+        query_embeddings /= np.maximum(np.linalg.norm(query_embeddings, axis=1, keepdims=True), 1e-12)
+        return query_embeddings @ self.embeddings.T
+
+    @staticmethod
+    def _top(scores: np.ndarray, n: int) -> np.ndarray:
+        n = min(n, len(scores))
+        candidates = np.argpartition(-scores, n - 1)[:n] if n < len(scores) else np.arange(len(scores))
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+    def search_batch(self, queries: Sequence[str], k: int = 2, candidates: int = 50, min_similarity: float = 0.4,
+                     duration_weight: float = 1e-5, preferred_providers: Sequence[str] = (),
+                     provider_boost: float = 0.005, diversify: bool = True) -> List[List[Dict]]:
+        """Top-k courses for every query, ranked by fused BM25 and embedding relevance.
+
+        ``duration_weight`` stays below the smallest gap between adjacent RRF ranks
+        among ``candidates`` (about 1 / (60 + candidates)^2), so shorter courses
+        only win ties and never outrank a better match.
+        """
+        if not len(queries) or not self.records:
+            return [[] for _ in queries]
+        lexical = self.bm25_scores(queries)
+        semantic = self.semantic_scores(queries)
+        max_weeks = max(float(self.weeks.max()), 1.0)
+        preferred = {p.lower() for p in preferred_providers}
+        results = []
+        for row in range(len(queries)):
+            fused: Dict[int, float] = {}
+            lexical_top = [i for i in self._top(lexical[row], candidates) if lexical[row, i] > 0]
+            for rank, doc in enumerate(lexical_top):
+                fused[doc] = fused.get(doc, 0.0) + 1.0 / (60 + rank)
+            if semantic is not None:
+                semantic_top = [i for i in self._top(semantic[row], candidates) if semantic[row, i] >= min_similarity]
+                for rank, doc in enumerate(semantic_top):
+                    fused[doc] = fused.get(doc, 0.0) + 1.0 / (60 + rank)
+            for doc in fused:
+                fused[doc] += duration_weight * (1 - self.weeks[doc] / max_weeks)
+                if self.providers[doc].lower() in preferred:
+                    fused[doc] += provider_boost
+            # Prefer distinct providers, falling back to repeats when there are not enough
+            chosen, repeats, seen_providers = [], [], set()
+            for doc in sorted(fused, key=fused.get, reverse=True):
+                if diversify and self.providers[doc] in seen_providers:
+                    repeats.append(doc)
+                    continue
+                seen_providers.add(self.providers[doc])
+                chosen.append(doc)
+                if len(chosen) == k:
+                    break
+            chosen = sorted(chosen + repeats[:k - len(chosen)], key=fused.get, reverse=True)
+            results.append([dict(self.records[doc], score=round(float(fused[doc]), 5)) for doc in chosen])
+        return results
+
+    def search(self, query: str, k: int = 2, **kwargs) -> List[Dict]:
+        return self.search_batch([query], k, **kwargs)[0]
+
+_engine = None
+# (mtime, fingerprint) of courses.csv when last read, and (weakref, fingerprint) of the last frame passed in
+_csv_source: Optional[Tuple[float, str]] = None
+_frame_source: Optional[Tuple[weakref.ref, str]] = None
+_engine_lock = threading.Lock()
+
+def get_course_search(courses: Optional[pd.DataFrame] = None, encoder=None) -> CourseSearchEngine:
+    """Process-wide engine over courses.csv (or ``courses``), with bundled course embeddings when they match.
+
+    Both paths resolve to one engine keyed on content, so a frame read from
+    courses.csv shares the engine (and its encoder) with CSV callers. A frame is
+    hashed the first time it is passed (later calls with the same object are
+    assumed unchanged) and the CSV whenever its mtime changes. A rebuilt engine
+    keeps the previous engine's encoder.
+    """
+    global _engine, _csv_source, _frame_source
+    with _engine_lock:
+        frame = courses
+        if courses is None:
+            mtime = os.path.getmtime(COURSES_CSV_PATH)
+            if _csv_source is None or _csv_source[0] != mtime:
+                frame = pd.read_csv(COURSES_CSV_PATH)
+                _csv_source = (mtime, course_fingerprint(frame))
+            fingerprint = _csv_source[1]
+        else:
+            if _frame_source is None or _frame_source[0]() is not courses:
+                _frame_source = (weakref.ref(courses), course_fingerprint(courses))
+            fingerprint = _frame_source[1]
+        if _engine is None or _engine.fingerprint != fingerprint:
+            previous = _engine
+            _engine = CourseSearchEngine(frame if frame is not None else pd.read_csv(COURSES_CSV_PATH))
+            if encoder is None and previous is not None:
+                encoder = previous.encoder
+        if encoder is not None and _engine.encoder is None:
+            from artifact_bundle import get_bundle
+            bundle = get_bundle()
+            embeddings = None
+            if bundle is not None and bundle.has("course_embeddings") and bundle.manifest.get("course_fingerprint") == _engine.fingerprint:
+                embeddings = np.asarray(bundle.array("course_embeddings"))
+            _engine.attach_encoder(encoder, embeddings)
+    return _engine
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the hybrid BM25 + embedding course search")
+    parser.add_argument("queries", nargs="+")
+    parser.add_argument("--k", type=int, default=3)
+    parser.add_argument("--semantic", action="store_true", help="Load the sentence encoder for semantic recall")
+    args = parser.parse_args()
+    encoder = None
+    if args.semantic:
+        from placement_predictor import get_encoder
+        encoder = get_encoder()
+    engine = get_course_search(encoder=encoder)
+    start = time.perf_counter()
+    results = engine.search_batch(args.queries, args.k)
+    print(f"{len(args.queries)} queries in {(time.perf_counter() - start) * 1000:.1f} ms")
+    for query, courses in zip(args.queries, results):
+        print(f"\n{query}:")
+        for course in courses:
+            print(f"  {course['course_name']} ({course['provider']}, {course['duration_weeks']} weeks) score={course['score']}")
@@ -1,11 +1,16 @@
+import argparse
 import pandas as pd
+import numpy as np
 import json
-from typing import List, Dict
+from typing import Callable, Iterator, List, Dict, Optional, Sequence, Tuple
 import os
 from collections import defaultdict
+from artifact_bundle import get_bundle
+from role_model import ROLE_MODEL, squash
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
 SKILLS_CSV_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+COURSES_CSV_PATH = os.path.join(DATA_DIR, "courses.csv")
 
 def load_skills_from_dataset(csv_path=SKILLS_CSV_PATH) -> List[str]:
     try:
@@ -24,18 +29,199 @@ def load_skills_from_dataset(csv_path=SKILLS_CSV_PATH) -> List[str]:
         print("Error loading skills dataset:", str(e))
         return []
 
+def empirical(values: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct values and their observed frequencies"""
+    counts = values.value_counts(sort=False)
+    return counts.index.to_numpy(), counts.to_numpy() / counts.sum()
+
+def parse_skill_list(value) -> List[str]:
+    return [x.strip().lower() for x in value.split(',') if x.strip()] if isinstance(value, str) else []
+
+class SyntheticCorpus:
+    """Seedable, vectorized generator of postings, resumes and courses for load testing.
+
+    Roles (title, category, demand level, description), locations and years
+    are drawn from their frequencies in skills_dataset.csv; each role's skill
+    set is drawn without replacement (Gumbel top-k) from that role's observed
+    skill frequencies mixed with ``skill_noise`` of the global ones, so large
+    corpora are varied rather than copies of the source rows. Resumes target
+    the app's roles (ROLE_MODEL), mapped from each posting role. Courses follow
+    courses.csv. Output comes in DataFrame chunks of ``chunk_size`` rows, each
+    from its own RNG stream, so memory is bounded and a (seed, chunk_size)
+    pair always gives the same corpus.
+    """
+    KINDS = {"postings": 0, "resumes": 1, "courses": 2}
+    # salary is not in the source data: lognormal medians (INR) per experience band, for exercising salary_sketches
+    SALARY_MEDIANS = {"entry": 600_000, "mid": 1_200_000, "senior": 2_200_000}
+
+    def __init__(self, skills_csv: str = SKILLS_CSV_PATH, courses_csv: str = COURSES_CSV_PATH, seed: int = 0,
+                 skill_noise: float = 0.1, years: Optional[Sequence[int]] = None):
+        self.seed = seed
+        postings = pd.read_csv(skills_csv)
+        role_columns = ["title", "category", "demand_level", "description"]
+        role_ids = postings.groupby(role_columns, sort=False, dropna=False).ngroup().to_numpy()
+        self.roles = postings[role_columns].drop_duplicates().reset_index(drop=True)
+        self.role_p = np.bincount(role_ids) / len(role_ids)
+        self.locations, self.location_p = empirical(postings["location"])
+        self.years, self.year_p = (np.asarray(years), np.full(len(years), 1 / len(years))) if years else empirical(postings["year"])
+
+        skill_lists = postings["skills"].map(parse_skill_list)
+        self.skills = np.array(sorted({skill for skills in skill_lists for skill in skills}))
+        skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        sizes = skill_lists.map(len).to_numpy()
+        frequency = np.zeros((len(self.roles), len(self.skills)))
+        np.add.at(frequency, (np.repeat(role_ids, sizes), [skill_index[s] for skills in skill_lists for s in skills]), 1)
+        overall = frequency.sum(axis=0) / frequency.sum()
+        self.skill_p = (1 - skill_noise) * frequency / frequency.sum(axis=1, keepdims=True) + skill_noise * overall
+        self.role_sizes = [sizes[role_ids == r] for r in range(len(self.roles))]
+        self.target_roles = self._target_roles(frequency / np.maximum(frequency.sum(axis=1, keepdims=True), 1))
+
+        courses = pd.read_csv(courses_csv)
+        self.course_skills, self.course_skill_p = empirical(courses["skills"])
+        self.providers, self.provider_p = empirical(courses["provider"])
+        self.durations, self.duration_p = empirical(courses["duration_weeks"])
+
+    def _target_roles(self, skill_share: np.ndarray) -> np.ndarray:
+        """App role (ROLE_MODEL) a student aiming at each posting role would pick: the one with the same
+        name, else the one whose required skills cover most of the role's skills (cosine)"""
+        names = ROLE_MODEL.role_names()
+        by_name = {squash(name): name for name in names}
+        skill_index = {squash(skill): i for i, skill in enumerate(self.skills)}
+        required = np.zeros((len(names), len(self.skills)))
+        for row, name in enumerate(names):
+            skills = ROLE_MODEL.get(name).skills
+            required[row, [skill_index[key] for key in map(squash, skills) if key in skill_index]] = 1 / np.sqrt(max(len(skills), 1))
+        closest = np.asarray(names, dtype=object)[(skill_share @ required.T).argmax(axis=1)]
+        return np.array([by_name.get(squash(title), best) for title, best in zip(self.roles["title"], closest)], dtype=object)
+
+    def _chunks(self, kind: str, n: int, chunk_size: int, make: Callable) -> Iterator[pd.DataFrame]:
+        for chunk_index, start in enumerate(range(0, n, chunk_size)):
+            rng = np.random.default_rng([self.seed, self.KINDS[kind], chunk_index])
+            yield make(rng, start, min(chunk_size, n - start))
+
+    def _skill_sets(self, rng: np.random.Generator, role_idx: np.ndarray, sizes: np.ndarray) -> List[List[str]]:
+        with np.errstate(divide="ignore"):
+            keys = np.log(self.skill_p[role_idx]) + rng.gumbel(size=(len(role_idx), len(self.skills)))
+        top = np.argsort(-keys, axis=1)[:, :max(int(sizes.max(initial=0)), 1)]
+        names = self.skills[top]
+        return [row[:k].tolist() for row, k in zip(names, sizes)]
+
+    def _role_sizes(self, rng: np.random.Generator, role_idx: np.ndarray) -> np.ndarray:
+        sizes = np.empty(len(role_idx), dtype=np.int64)
+        for r, observed in enumerate(self.role_sizes):
+            mask = role_idx == r
+            sizes[mask] = rng.choice(observed, mask.sum())
+        return sizes
+
+    def postings(self, n: int, chunk_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Postings with the skills_dataset.csv columns plus experience_years and salary"""
+        def make(rng, start, size):
+            role_idx = rng.choice(len(self.roles), size, p=self.role_p)
+            roles = self.roles.iloc[role_idx].reset_index(drop=True)
+            experience = np.round(rng.gamma(2.0, 1.8, size), 1)
+            band_median = np.where(experience < 2, self.SALARY_MEDIANS["entry"],
+                                   np.where(experience < 5, self.SALARY_MEDIANS["mid"], self.SALARY_MEDIANS["senior"]))
+            return pd.DataFrame({
+                "id": np.arange(start + 1, start + size + 1),
+                "title": roles["title"], "description": roles["description"],
+                "skills": [",".join(skills) for skills in self._skill_sets(rng, role_idx, self._role_sizes(rng, role_idx))],
+                "demand_level": roles["demand_level"], "category": roles["category"],
+                "location": rng.choice(self.locations, size, p=self.location_p),
+                "year": rng.choice(self.years, size, p=self.year_p),
+                "experience_years": experience,
+                "salary": np.round(band_median * rng.lognormal(0, 0.35, size), -3).astype(np.int64),
+            })
+        return self._chunks("postings", n, chunk_size, make)
+
+    def resumes(self, n: int, chunk_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Student resumes as {student_id, target_role, text} (worker_pool input) plus the skills they list"""
+        def make(rng, start, size):
+            role_idx = rng.choice(len(self.roles), size, p=self.role_p)
+            titles = self.roles["title"].to_numpy()[role_idx]
+            # Target roles are the app's roles, so resumes can go straight through analysis
+            targets = self.target_roles[role_idx]
+            # Students list between a fifth and all of a typical posting's skills
+            sizes = np.maximum(1, np.round(self._role_sizes(rng, role_idx) * rng.uniform(0.2, 1.2, size))).astype(np.int64)
+            skill_sets = self._skill_sets(rng, role_idx, sizes)
+            projects = rng.integers(0, 4, size)
+            has_internship, has_certification, has_achievement = rng.random((3, size)) < np.array([[0.4], [0.5], [0.3]])
+            cgpa = np.round(rng.uniform(6.0, 9.8, size), 1)
+            certifications = rng.choice(self.course_skills, size, p=self.course_skill_p)
+            texts = []
+            for i in range(size):
+                skills = skill_sets[i]
+                parts = [f"SUMMARY\nStudent aiming for a role as {targets[i]}.",
+                         f"EDUCATION\nB.Tech in Computer Science, CGPA {cgpa[i]}",
+                         f"SKILLS\n{', '.join(skills)}"]
+                if projects[i]:
+                    parts.append("PROJECTS\n" + "\n".join(f"- Built a {skills[j % len(skills)]} project" for j in range(projects[i])))
+                if has_internship[i]:
+                    parts.append(f"INTERNSHIPS\n{titles[i]} intern, worked with {skills[0]}")
+                if has_certification[i]:
+                    parts.append(f"CERTIFICATIONS\n{certifications[i]} Fundamentals")
+                if has_achievement[i]:
+                    parts.append("ACHIEVEMENTS\nWinner, college hackathon")
+                texts.append("\n\n".join(parts))
+            return pd.DataFrame({
+                "student_id": [f"syn_student_{i}" for i in range(start, start + size)],
+                "target_role": targets, "text": texts,
+                "skills": [",".join(skills) for skills in skill_sets],
+            })
+        return self._chunks("resumes", n, chunk_size, make)
+
+    def courses(self, n: int, chunk_size: int = 100_000) -> Iterator[pd.DataFrame]:
+        """Courses with the courses.csv columns"""
+        def make(rng, start, size):
+            skills = rng.choice(self.course_skills, size, p=self.course_skill_p)
+            return pd.DataFrame({
+                "course_name": [f"{skill} Fundamentals {i}" for skill, i in zip(skills, range(start + 1, start + size + 1))],
+                "skills": skills,
+                "provider": rng.choice(self.providers, size, p=self.provider_p),
+                "duration_weeks": rng.choice(self.durations, size, p=self.duration_p),
+            })
+        return self._chunks("courses", n, chunk_size, make)
+
+def write_chunks(chunks: Iterator[pd.DataFrame], path: str) -> int:
+    """Stream DataFrame chunks to .jsonl, .csv or .parquet (needs pyarrow); returns the row count"""
+    rows = 0
+    tmp_path = path + ".tmp"
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet output needs pyarrow (pip install pyarrow)") from e
+        writer = None
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            writer = writer or pq.ParquetWriter(tmp_path, table.schema)
+            writer.write_table(table)
+            rows += len(chunk)
+        if writer is not None:
+            writer.close()
+    else:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                if path.endswith(".csv"):
+                    chunk.to_csv(f, index=False, header=rows == 0)
+                else:
+                    chunk.to_json(f, orient="records", lines=True, force_ascii=False)
+                rows += len(chunk)
+    if os.path.exists(tmp_path):
+        os.replace(tmp_path, path)
+    return rows
+
 def generate_synthetic_job_post(skill_set: List[str], num_samples: int = 10) -> List[Dict]:
     synthetic_data = []
     if os.path.exists(SKILLS_CSV_PATH):
-        df = pd.read_csv(SKILLS_CSV_PATH)
-        for i, row in df.head(num_samples).iterrows():
-            skills = row['skills'].split(',') if 'skills' in row else skill_set[:5]
-            synthetic_data.append({
-                "id": f"syn_{i}",
-                "title": row['title'] if 'title' in row else f"Role_{i+1}_India",
-                "description": row['description'] if 'description' in row else "Tech role in India.",
-                "skills": [x.strip() for x in skills]
-            })
+        for chunk in SyntheticCorpus().postings(num_samples):
+            for row in chunk.itertuples(index=False):
+                synthetic_data.append({
+                    "id": f"syn_{row.id - 1}",
+                    "title": row.title,
+                    "description": row.description,
+                    "skills": row.skills.split(',')
+                })
     else:
         synthetic_data = [{
             "id": "syn_fallback",
@@ -60,19 +246,42 @@ def build_skill_graph(jobs_df: pd.DataFrame) -> Dict:
             graph[node] = list(set(graph[node]))
     return dict(graph)
 
-def load_pre_generated_data():
+def load_pre_generated_data(write_graph: bool = False):
+    """Jobs and the job/skill graph; the graph comes from the artifact bundle when one has been built"""
     if not os.path.exists(SKILLS_CSV_PATH):
         raise FileNotFoundError(f"Skills dataset not found at {SKILLS_CSV_PATH}")
     jobs_df = pd.read_csv(SKILLS_CSV_PATH)
     jobs_df['skills'] = jobs_df['skills'].apply(lambda s: [x.strip() for x in s.split(',')] if isinstance(s, str) else [])
     job_list = jobs_df.to_dict("records")
-    graph = build_skill_graph(jobs_df)
-    with open(os.path.join(DATA_DIR, "skill_graph.json"), "w") as f:
-        json.dump(graph, f)
+    bundle = get_bundle()
+    graph = bundle.json("skill_graph") if bundle is not None and bundle.has("skill_graph") else build_skill_graph(jobs_df)
+    if write_graph:
+        with open(os.path.join(DATA_DIR, "skill_graph.json"), "w") as f:
+            json.dump(graph, f)
     return job_list, graph
 
 if __name__ == "__main__":
-    skill_list = load_skills_from_dataset()
-    print("Skills loaded:", skill_list[:10])
-    jobs, graph = load_pre_generated_data()
-    print("Loaded", len(jobs), "jobs and skill graph with", len(graph), "nodes.")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build the skill graph, or generate a synthetic corpus for load testing")
+    parser.add_argument("--postings", type=int, default=0, help="Number of synthetic job postings")
+    parser.add_argument("--resumes", type=int, default=0, help="Number of synthetic student resumes")
+    parser.add_argument("--courses", type=int, default=0, help="Number of synthetic courses")
+    parser.add_argument("--out-dir", default="synthetic")
+    parser.add_argument("--format", choices=["jsonl", "csv", "parquet"], default="jsonl")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--years", type=int, nargs="+", default=None, help="Spread postings over these years instead of the dataset's")
+    args = parser.parse_args()
+
+    if args.postings or args.resumes or args.courses:
+        corpus = SyntheticCorpus(seed=args.seed, years=args.years)
+        os.makedirs(args.out_dir, exist_ok=True)
+        for kind in ("postings", "resumes", "courses"):
+            n = getattr(args, kind)
+            if n:
+                path = os.path.join(args.out_dir, f"{kind}.{args.format}")
+                print(f"Wrote {write_chunks(getattr(corpus, kind)(n, args.chunk_size), path)} {kind} to {path}")
+    else:
+        skill_list = load_skills_from_dataset()
+        print("Skills loaded:", skill_list[:10])
+        jobs, graph = load_pre_generated_data(write_graph=True)
+        print("Loaded", len(jobs), "jobs and skill graph with", len(graph), "nodes.")
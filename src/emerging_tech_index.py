@@ -0,0 +1,300 @@
+import argparse
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from course_search import tokenize
+from role_model import ROLE_MODEL, ROLE_REQUIREMENTS_PATH, squash
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "Models")
+EMERGING_TECH_CSV_PATH = os.path.join(DATA_DIR, "emerging_tech.csv")
+SKILLS_CSV_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+INDEX_PATH = os.path.join(MODELS_DIR, "emerging_tech_index")
+
+LEXICAL_DIMS = 1024
+# Weight of embedding similarity vs. posting co-occurrence in the relevance matrix
+SEMANTIC_WEIGHT = 0.7
+# Similarities below this are treated as unrelated; the rest is rescaled to [0, 1]
+SIMILARITY_FLOOR = 0.25
+# Bump when the persisted arrays change so older indexes are rebuilt
+INDEX_FORMAT = 3
+
+def file_fingerprint(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def load_technologies(path: str = EMERGING_TECH_CSV_PATH) -> List[str]:
+    """Technology names from emerging_tech.csv, case-insensitive duplicates dropped"""
+    seen, techs = set(), []
+    for name in pd.read_csv(path)["Technology"].dropna().astype(str).str.strip():
+        if name and name.lower() not in seen:
+            seen.add(name.lower())
+            techs.append(name)
+    return techs
+
+def lexical_embeddings(texts: Sequence[str], dims: int = LEXICAL_DIMS) -> np.ndarray:
+    """Hashed character-trigram vectors, the encoder-free stand-in for sentence embeddings"""
+    vectors = np.zeros((len(texts), dims), dtype=np.float32)
+    for row, text in enumerate(texts):
+        padded = f" {' '.join(tokenize(text))} "
+        for gram in {padded[i:i + 3] for i in range(len(padded) - 2)}:
+            vectors[row, zlib.crc32(gram.encode()) % dims] += 1
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+def default_kind() -> str:
+    """Sentence-encoder embeddings when the ML stack is installed, lexical trigrams otherwise"""
+    return "encoder" if importlib.util.find_spec("sentence_transformers") is not None else "lexical"
+
+def embed(texts: Sequence[str], kind: str) -> np.ndarray:
+    if kind == "lexical":
+        return lexical_embeddings(texts)
+    from placement_predictor import get_encoder
+    vectors = np.asarray(get_encoder().encode(list(texts)), dtype=np.float32).reshape(len(texts), -1)
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+def similarity(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.clip((a @ b.T - SIMILARITY_FLOOR) / (1 - SIMILARITY_FLOOR), 0, 1)
+
+def role_skill_mask(roles: Sequence[str], skills: Sequence[str]) -> np.ndarray:
+    index = {skill: i for i, skill in enumerate(skills)}
+    mask = np.zeros((len(roles), len(skills)), dtype=bool)
+    for row, role in enumerate(roles):
+        mask[row, [index[skill] for skill in ROLE_MODEL.get(role).skills if skill in index]] = True
+    return mask
+
+def document_matrices(roles: Sequence[str], skills_csv: str = SKILLS_CSV_PATH) -> Tuple[np.ndarray, List[set]]:
+    """(role x document affinity, per-document term sets).
+
+    Documents are the job postings plus every role's requirement list. Postings
+    are not labelled with the app's roles, so each document counts towards a
+    role by the Jaccard overlap of its skills with the role's. A posting's
+    tokens are its skills and category, a role's its skills and name.
+    """
+    role_skills = [{squash(s) for s in ROLE_MODEL.get(role).skills} for role in roles]
+    role_terms = [skills | {squash(role)} for role, skills in zip(roles, role_skills)]
+    posting_skills, posting_terms = [], []
+    if os.path.exists(skills_csv):
+        postings = pd.read_csv(skills_csv)
+        for value, category in zip(postings["skills"], postings["category"]):
+            skills = {squash(s) for s in value.split(",") if s.strip()} if isinstance(value, str) else set()
+            posting_skills.append(skills)
+            # Whole terms only: descriptions and multi-word skills use words like "insights" or "storage" in passing
+            posting_terms.append(skills | ({squash(category)} if isinstance(category, str) else set()))
+    document_skills = posting_skills + role_skills
+    vocabulary = {skill: i for i, skill in enumerate(sorted(set().union(*document_skills)))}
+    def binary(sets):
+        matrix = np.zeros((len(sets), len(vocabulary)), dtype=np.float32)
+        for row, skills in enumerate(sets):
+            matrix[row, [vocabulary[s] for s in skills]] = 1
+        return matrix
+    role_matrix, document_matrix = binary(role_skills), binary(document_skills)
+    overlap = role_matrix @ document_matrix.T
+    union = role_matrix.sum(axis=1, keepdims=True) + document_matrix.sum(axis=1) - overlap
+    affinity = np.divide(overlap, union, out=np.zeros_like(overlap), where=union > 0)
+    return affinity, posting_terms + role_terms
+
+def mention_matrix(terms: List[set], techs: Sequence[str]) -> np.ndarray:
+    """(document x tech) 1 where the technology's squashed name is one of the document's terms"""
+    keys = [squash(tech) for tech in techs]
+    return np.array([[key in document for key in keys] for document in terms], dtype=np.float32).reshape(len(terms), len(techs))
+
+class EmergingTechIndex:
+    """Precomputed role x emerging-technology relevance over Data/emerging_tech.csv.
+
+    ``relevance[r, t]`` blends the embedding similarity of technology ``t``
+    to the closest skill role ``r`` requires with the share of the role's
+    documents (postings and role requirements, weighted by skill overlap)
+    that mention ``t``. ``support[t]`` counts the documents mentioning ``t``.
+    emerging_tech.csv is scraped from news-site tags, so only technologies
+    the documents mention are recommended, plus, with encoder embeddings,
+    ones at least as close to a role skill as the least close mentioned
+    technology. ``skill_tech`` holds the similarity
+    of every role skill to every technology, so a student's gaps shift the
+    ranking with one matrix-vector product. Every column depends only on its
+    technology, so when the CSV changes only added technologies are embedded
+    and scored.
+    """
+    def __init__(self, roles: List[str], techs: List[str], skills: List[str], kind: str,
+                 role_embeddings: np.ndarray, tech_embeddings: np.ndarray, skill_embeddings: np.ndarray,
+                 relevance: np.ndarray, support: np.ndarray, sources: Dict[str, Optional[str]]):
+        self.roles = roles
+        self.techs = techs
+        self.skills = skills
+        self.kind = kind
+        self.role_embeddings = role_embeddings
+        self.tech_embeddings = tech_embeddings
+        self.skill_embeddings = skill_embeddings
+        self.relevance = relevance
+        self.support = support
+        self.sources = sources
+        self.skill_tech = similarity(skill_embeddings, tech_embeddings)
+        self._role_index = {role: i for i, role in enumerate(roles)}
+        self._skill_index = {squash(skill): i for i, skill in enumerate(skills)}
+        self._tech_keys = np.array([squash(tech) for tech in techs])
+        self.eligible = support > 0
+        # Trigram overlap says "photography" is close to "cryptography", so only encoder similarity counts here
+        if kind != "lexical" and self.eligible.any() and len(skills):
+            closest = (tech_embeddings @ skill_embeddings.T).max(axis=1)
+            self.eligible |= closest >= closest[self.eligible].min()
+
+    @staticmethod
+    def current_sources(csv_path: str = EMERGING_TECH_CSV_PATH, kind: str = "lexical") -> Dict[str, Optional[str]]:
+        return {"emerging_tech": file_fingerprint(csv_path), "skills_dataset": file_fingerprint(SKILLS_CSV_PATH),
+                "role_requirements": file_fingerprint(ROLE_REQUIREMENTS_PATH), "embedding": kind,
+                "format": INDEX_FORMAT}
+
+    def _columns(self, techs: List[str], tech_embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Relevance columns and document support for ``techs``"""
+        affinity, terms = document_matrices(self.roles)
+        skill_tech = similarity(self.skill_embeddings, tech_embeddings)
+        closest_skill = np.where(role_skill_mask(self.roles, self.skills)[:, :, None], skill_tech[None], 0).max(axis=1, initial=0)
+        mentions = mention_matrix(terms, techs)
+        weight = np.maximum(affinity.sum(axis=1, keepdims=True), 1e-12)
+        cooccurrence = affinity @ mentions / weight
+        return SEMANTIC_WEIGHT * closest_skill + (1 - SEMANTIC_WEIGHT) * cooccurrence, mentions.sum(axis=0)
+
+    @classmethod
+    def build(cls, csv_path: str = EMERGING_TECH_CSV_PATH, kind: Optional[str] = None) -> "EmergingTechIndex":
+        kind = kind or default_kind()
+        roles = ROLE_MODEL.role_names()
+        techs = load_technologies(csv_path)
+        skills = list(dict.fromkeys(skill for role in roles for skill in ROLE_MODEL.get(role).skills))
+        role_embeddings, tech_embeddings, skill_embeddings = (embed(texts, kind) for texts in (roles, techs, skills))
+        index = cls(roles, techs, skills, kind, role_embeddings, tech_embeddings, skill_embeddings,
+                    np.zeros((len(roles), len(techs)), dtype=np.float32), np.zeros(len(techs), dtype=np.float32),
+                    cls.current_sources(csv_path, kind))
+        relevance, support = index._columns(techs, tech_embeddings)
+        index = cls(roles, techs, skills, kind, role_embeddings, tech_embeddings, skill_embeddings,
+                    relevance, support, index.sources)
+        logger.info(f"Emerging tech index: {len(roles)} roles x {len(techs)} technologies "
+                    f"({int(index.eligible.sum())} recommendable, {kind} embeddings)")
+        return index
+
+    def refresh(self, csv_path: str = EMERGING_TECH_CSV_PATH) -> "EmergingTechIndex":
+        """Index for the current CSV: self when unchanged, new columns only when just the technology list changed"""
+        sources = self.current_sources(csv_path, self.kind)
+        if sources == self.sources:
+            return self
+        if {k: v for k, v in sources.items() if k != "emerging_tech"} != {k: v for k, v in self.sources.items() if k != "emerging_tech"}:
+            return self.build(csv_path, self.kind)
+        techs = load_technologies(csv_path)
+        old = {tech: i for i, tech in enumerate(self.techs)}
+        added = [tech for tech in techs if tech not in old]
+        dims = self.tech_embeddings.shape[1]
+        added_embeddings = embed(added, self.kind) if added else np.zeros((0, dims), dtype=np.float32)
+        added_relevance, added_support = (self._columns(added, added_embeddings)
+                                          if added else (np.zeros((len(self.roles), 0), dtype=np.float32), np.zeros(0, dtype=np.float32)))
+        position = {tech: i for i, tech in enumerate(added)}
+        def assemble(current: np.ndarray, new: np.ndarray, axis: int) -> np.ndarray:
+            parts = [np.take(current, [old[t]], axis=axis) if t in old else np.take(new, [position[t]], axis=axis) for t in techs]
+            return np.concatenate(parts, axis=axis) if parts else np.take(current, [], axis=axis)
+        logger.info(f"Emerging tech index: +{len(added)} / -{len(set(old) - set(techs))} technologies")
+        return EmergingTechIndex(self.roles, techs, self.skills, self.kind, self.role_embeddings,
+                                 assemble(self.tech_embeddings, added_embeddings, 0), self.skill_embeddings,
+                                 assemble(self.relevance, added_relevance, 1), assemble(self.support, added_support, 0), sources)
+
+    def top_k(self, role: str, missing_skills: Sequence[str] = (), found_skills: Sequence[str] = (), k: int = 4,
+              gap_weight: float = 0.5, min_relevance: float = 0.0) -> List[Tuple[str, float]]:
+        """Recommendable technologies relevant to a role (never the role itself), boosted by their
+        similarity to the student's missing skills and excluding ones the student already lists.
+
+        ``min_relevance`` applies to the role relevance, so gaps only reorder technologies
+        that already fit the role.
+        """
+        row = self._role_index.get(role, self._role_index.get(ROLE_MODEL.default_role, 0))
+        gaps = [self._skill_index[key] for key in map(squash, missing_skills) if key in self._skill_index]
+        relevance = self.relevance[row]
+        scores = relevance.copy()
+        if gaps:
+            scores += gap_weight * self.skill_tech[gaps].mean(axis=0)
+        excluded = ~self.eligible | (relevance <= min_relevance) | (self._tech_keys == squash(self.roles[row]))
+        if found_skills:
+            excluded |= np.isin(self._tech_keys, [squash(skill) for skill in found_skills])
+        scores[excluded] = -np.inf
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k] if 0 < k < len(scores) else np.arange(k)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.techs[i], round(float(scores[i]), 4)) for i in top if np.isfinite(scores[i])]
+
+    def save(self, path: str = INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        np.savez_compressed(path + ".tmp.npz", role_embeddings=self.role_embeddings, tech_embeddings=self.tech_embeddings,
+                            skill_embeddings=self.skill_embeddings, relevance=self.relevance, support=self.support)
+        with open(path + ".json.tmp", "w") as f:
+            json.dump({"roles": self.roles, "techs": self.techs, "skills": self.skills, "kind": self.kind, "sources": self.sources}, f)
+        os.replace(path + ".tmp.npz", path + ".npz")
+        os.replace(path + ".json.tmp", path + ".json")
+
+    @classmethod
+    def load(cls, path: str = INDEX_PATH) -> Optional["EmergingTechIndex"]:
+        if not (os.path.exists(path + ".npz") and os.path.exists(path + ".json")):
+            return None
+        with open(path + ".json") as f:
+            meta = json.load(f)
+        if meta["sources"].get("format") != INDEX_FORMAT:
+            return None
+        arrays = np.load(path + ".npz")
+        return cls(meta["roles"], meta["techs"], meta["skills"], meta["kind"], arrays["role_embeddings"],
+                   arrays["tech_embeddings"], arrays["skill_embeddings"], arrays["relevance"], arrays["support"], meta["sources"])
+
+_index = None
+_index_checked = 0.0
+_index_lock = threading.Lock()
+
+def get_emerging_tech_index(check_interval: float = 30.0) -> Optional[EmergingTechIndex]:
+    """Process-wide index from Models/, built on first use (with the sentence encoder when it is
+    installed) and refreshed when the sources change, checked at most every ``check_interval``
+    seconds; None without the CSV"""
+    global _index, _index_checked
+    with _index_lock:
+        if not os.path.exists(EMERGING_TECH_CSV_PATH):
+            return None
+        now = time.monotonic()
+        if _index is None or now - _index_checked >= check_interval:
+            _index_checked = now
+            kind = _index.kind if _index is not None else default_kind()
+            current = _index or EmergingTechIndex.load()
+            if current is not None and current.kind == kind:
+                refreshed = current.refresh()
+            else:
+                try:
+                    refreshed = EmergingTechIndex.build(kind=kind)
+                except Exception as e:
+                    logger.warning(f"Encoder embeddings unavailable ({e}), building the lexical index")
+                    refreshed = EmergingTechIndex.build(kind="lexical")
+            if refreshed is not current:
+                refreshed.save()
+            _index = refreshed
+    return _index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query the role x emerging-technology relevance index")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild from scratch instead of refreshing")
+    parser.add_argument("--lexical", action="store_true", help="Use lexical trigram vectors even when the sentence encoder is installed")
+    parser.add_argument("--role", default=None, help="Show the top technologies for this role")
+    parser.add_argument("--missing", nargs="*", default=[], help="Missing skills to factor in")
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    index = None if args.rebuild else EmergingTechIndex.load()
+    kind = "lexical" if args.lexical else default_kind()
+    index = index.refresh() if index is not None and index.kind == kind else EmergingTechIndex.build(kind=kind)
+    index.save()
+    for role in [args.role] if args.role else index.roles:
+        print(f"{role}: {', '.join(f'{tech} ({score})' for tech, score in index.top_k(role, args.missing, k=args.k))}")
@@ -1,13 +1,17 @@
 import pandas as pd
 from datetime import datetime, timedelta
 from advanced_skill_extractor import IndustrySkillExtractor
-from gnn_skill_predictor import GINXMLC, predict_missing_skills, graph_dict_to_data
+from gnn_skill_predictor import GINXMLC, predict_for_student, predict_missing_skills, graph_dict_to_data
+from cooccurrence_recommender import CooccurrenceRecommender
 from typing import Dict, List
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import json
 import os
+from skill_vocabulary import get_skill_vocabulary
+from artifact_bundle import get_bundle
+from course_search import get_course_search
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
 
@@ -20,10 +24,25 @@ SKILL_DIFFICULTY = {
     "digital marketing": ("medium", 4), "hindi-nlp": ("medium", 4)
 }
 
+def fit_duration_model(n_samples: int = 500, random_state: int = 42) -> RandomForestRegressor:
+    """Days-to-placement regressor over (gaps, match %, difficulty factor), fit once rather than per forecast"""
+    rng = np.random.default_rng(random_state)
+    X = np.column_stack([rng.integers(0, 15, n_samples), rng.uniform(0, 100, n_samples), rng.uniform(0, 10, n_samples)])
+    y = rng.integers(30, 120, n_samples)
+    return RandomForestRegressor(n_estimators=100, random_state=random_state).fit(X, y)
+
+_duration_model = None
+
+def get_duration_model() -> RandomForestRegressor:
+    global _duration_model
+    if _duration_model is None:
+        bundle = get_bundle()
+        _duration_model = bundle.pickle("forecaster") if bundle is not None and bundle.has("forecaster") else fit_duration_model()
+    return _duration_model
+
 def forecast_placement(student_skills: str, job_role: str, extractor: IndustrySkillExtractor, gnn_model: GINXMLC,
                       graph_dict: Dict, ontology: List[str], jobs_df: pd.DataFrame, projects_count: int = 0,
                       project_matches: pd.DataFrame = None) -> Dict:
-    graph_data = graph_dict_to_data(graph_dict, ontology)
     student_skills_list = [s.strip().lower() for s in student_skills.split(",") if s.strip()]
     job_row = jobs_df[jobs_df['title'].str.lower() == job_role.lower()]
     if not job_row.empty:
@@ -31,11 +50,12 @@ def forecast_placement(student_skills: str, job_role: str, extractor: IndustrySk
     else:
         job_skills = ["python", "sql", "machine learning", "aws", "react", "digital marketing"]
 
+    student_skill_set = set(student_skills_list)
     matching_skills = []
     text_emb = extractor.bi_encoder.encode([",".join(student_skills_list)])
     job_emb = extractor.bi_encoder.encode(job_skills)
     for i, job_skill in enumerate(job_skills):
-        if job_skill in student_skills_list:
+        if job_skill in student_skill_set:
             sim = 1.0
             match_type = "exact"
         else:
@@ -45,15 +65,18 @@ def forecast_placement(student_skills: str, job_role: str, extractor: IndustrySk
             matching_skills.append((job_skill, match_type, sim * 100))
 
     match_percentage = (sum([sim for sim in [cosine_similarity(text_emb, [job_emb[i]])[0][0] for i in range(len(job_skills))] if sim > 0.5]) / len(job_skills)) * 100 if job_skills else 0
-    gaps = [s for s in job_skills if s not in student_skills_list]
-    missing = predict_missing_skills(gnn_model, graph_data, student_skills_list, ontology)
+    gaps = get_skill_vocabulary().missing(job_skills, student_skills_list)
+    missing = []
+    if isinstance(gnn_model, CooccurrenceRecommender) or getattr(gnn_model, "skill_index", None) is not None:
+        missing = predict_for_student(gnn_model, student_skills_list)
+    elif gnn_model is not None:
+        missing = predict_missing_skills(gnn_model, graph_dict_to_data(graph_dict, ontology), student_skills_list, ontology)
     gaps = list(set(gaps + missing))
 
     total_days = 0
     roadmap = []
 
-    courses_df = pd.read_csv(os.path.join(DATA_DIR, "courses.csv"))
-    skill_col = next((c for c in courses_df.columns if c.lower() in ["skill", "course", "course_name", "topic"]), "skill")
+    courses = dict(zip(gaps, get_course_search().search_batch(gaps, k=1)))
 
     difficulty_multiplier = 1.2 if len(gaps) > 3 else 1.0
     if "machine learning" in job_role.lower():
@@ -70,19 +93,14 @@ def forecast_placement(student_skills: str, job_role: str, extractor: IndustrySk
         diff_level, base_weeks = SKILL_DIFFICULTY.get(g, ("medium", 4))
         estimated_weeks = base_weeks * difficulty_multiplier
         total_days += estimated_weeks * 7
-        course = courses_df[courses_df[skill_col].str.lower() == g.lower()]
-        resource = (f"{course['provider'].values[0]}: {course['course_name'].values[0]}"
-                   if not course.empty and 'provider' in course.columns and 'course_name' in course.columns
-                   else f"Self-study {g} on SWAYAM")
+        course = courses[g][0] if courses[g] else None
+        resource = f"{course['provider']}: {course['course_name']}" if course else f"Self-study {g} on SWAYAM"
         roadmap.append((g, resource, f"{diff_level} ({estimated_weeks:.1f} weeks)"))
 
     difficulty_factor = sum(1 if level == "hard" else 0.5 if level == "medium" else 0.2
                           for _, level in [SKILL_DIFFICULTY.get(g, ("medium", 4)) for g in gaps])
 
-    X_train = np.array([[len(gaps), match_percentage, difficulty_factor] for _ in range(20)])
-    y_train = np.random.randint(30, 120, 20)
-    rf = RandomForestRegressor(n_estimators=100)
-    rf.fit(X_train, y_train)
+    rf = get_duration_model()
     predicted_days = int(rf.predict([[len(gaps), match_percentage, difficulty_factor]])[0])
 
     predicted_days = max(30, predicted_days + total_days - min(projects_count * 5, 15) - int(project_boost * 10))
@@ -3,18 +3,38 @@ import torch.nn.functional as F
 from torch_geometric.nn import GINConv, global_add_pool
 from torch_geometric.data import Data
 import torch.nn as nn
-from typing import List, Dict
-from sentence_transformers import SentenceTransformer
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 import numpy as np
-from advanced_skill_extractor import IndustrySkillExtractor
+from skill_vocabulary import canonicalize, get_skill_vocabulary
+from cooccurrence_recommender import CooccurrenceRecommender
 import logging
+import os
+import glob
+import re
+import threading
+from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Sentence-transformer model for embedding skills semantically
-bi_encoder = SentenceTransformer('all-MiniLM-L6-v2')
+ENCODER_NAME = 'all-MiniLM-L6-v2'
+
+_bi_encoder = None
+_bi_encoder_lock = threading.Lock()
+
+def get_bi_encoder():
+    """Sentence-transformer for embedding skills semantically, constructed on first use rather than at import"""
+    global _bi_encoder
+    if _bi_encoder is None:
+        with _bi_encoder_lock:
+            if _bi_encoder is None:
+                from sentence_transformers import SentenceTransformer
+                _bi_encoder = SentenceTransformer(ENCODER_NAME)
+    return _bi_encoder
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "Models")
+CHECKPOINT_PREFIX = "gin_xmlc"
 
 class GINXMLC(nn.Module):
     """Advanced GNN for skill prediction with dynamic ontology"""
@@ -38,8 +58,7 @@ def graph_dict_to_data(graph: Dict, ontology: List[str]) -> Data:
         if not nodes:
             raise ValueError("Graph dictionary is empty")
         node_to_idx = {node: idx for idx, node in enumerate(nodes)}
-        extractor = IndustrySkillExtractor()
-        embeddings = extractor.bi_encoder.encode(nodes)
+        embeddings = get_bi_encoder().encode(nodes)
         x = torch.tensor(embeddings, dtype=torch.float)
         edge_index = []
         for node, neighbors in graph.items():
@@ -55,29 +74,155 @@ def graph_dict_to_data(graph: Dict, ontology: List[str]) -> Data:
         logger.error(f"Error converting graph to data: {str(e)}")
         raise
 
-def predict_missing_skills(model: GINXMLC, graph_data: Data, known_skills: List[str], ontology: List[str], confidence_threshold: float = 0.65) -> List[str]:
-    """Predict missing skills with configurable confidence filtering"""
+def build_skill_adjacency(graph: Dict, ontology: List[str]) -> List[np.ndarray]:
+    """Project the bipartite job/skill graph onto skills: two skills are neighbours if they share a job"""
+    skill_to_idx = {skill: i for i, skill in enumerate(ontology)}
+    neighbours = [set() for _ in ontology]
+    for node, linked in graph.items():
+        if str(node) in skill_to_idx:
+            continue
+        ids = sorted({skill_to_idx[str(s).strip().lower()] for s in linked if str(s).strip().lower() in skill_to_idx})
+        for i in ids:
+            neighbours[i].update(ids)
+    for i, linked in enumerate(neighbours):
+        linked.discard(i)
+    return [np.array(sorted(linked), dtype=np.int64) for linked in neighbours]
+
+def sample_skill_subgraph(seeds: Sequence[int], adjacency: List[np.ndarray], fanouts: Sequence[int] = (10, 5),
+                          rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample a multi-hop neighbourhood around seed skills, keeping at most fanout[h] neighbours per node at hop h.
+
+    Returns ontology ids of the sampled nodes (seeds first) and a local edge_index of shape (2, E).
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    nodes = list(dict.fromkeys(int(s) for s in seeds))
+    local = {node: i for i, node in enumerate(nodes)}
+    edges = []
+    frontier = nodes
+    for fanout in fanouts:
+        next_frontier = []
+        for node in frontier:
+            linked = adjacency[node]
+            if len(linked) > fanout:
+                linked = rng.choice(linked, size=fanout, replace=False)
+            for neigh in linked:
+                neigh = int(neigh)
+                if neigh not in local:
+                    local[neigh] = len(nodes)
+                    nodes.append(neigh)
+                    next_frontier.append(neigh)
+                edges.append((local[node], local[neigh]))
+                edges.append((local[neigh], local[node]))
+        frontier = next_frontier
+    edge_index = np.array(edges, dtype=np.int64).T if edges else np.empty((2, 0), dtype=np.int64)
+    return np.array(nodes, dtype=np.int64), edge_index
+
+class SkillGraphIndex:
+    """Ontology, node features and skill adjacency a trained GINXMLC was fitted on"""
+    def __init__(self, ontology: List[str], node_features: torch.Tensor, adjacency: List[np.ndarray], fanouts: Sequence[int] = (10, 5)):
+        self.ontology = ontology
+        self.node_features = node_features
+        self.adjacency = adjacency
+        self.fanouts = tuple(fanouts)
+        self.skill_to_idx = {skill: i for i, skill in enumerate(ontology)}
+
+    def subgraph(self, known_skills: List[str], rng: Optional[np.random.Generator] = None) -> Data:
+        """Build the student's neighbourhood graph; skills outside the ontology are dropped"""
+        seeds = [self.skill_to_idx[s.lower()] for s in known_skills if s.lower() in self.skill_to_idx]
+        if not seeds:
+            return Data(x=torch.zeros((1, self.node_features.size(1))), edge_index=torch.empty((2, 0), dtype=torch.long),
+                        batch=torch.zeros(1, dtype=torch.long))
+        rng = rng if rng is not None else np.random.default_rng(0)
+        nodes, edge_index = sample_skill_subgraph(seeds, self.adjacency, self.fanouts, rng)
+        return Data(x=self.node_features[torch.from_numpy(nodes)], edge_index=torch.from_numpy(edge_index),
+                    batch=torch.zeros(len(nodes), dtype=torch.long))
+
+def save_checkpoint(model: GINXMLC, index: SkillGraphIndex, metadata: Dict, models_dir: str = MODELS_DIR) -> str:
+    """Write the next versioned checkpoint (gin_xmlc-vN.pt) and point LATEST at it"""
+    os.makedirs(models_dir, exist_ok=True)
+    versions = [int(m.group(1)) for p in glob.glob(os.path.join(models_dir, f"{CHECKPOINT_PREFIX}-v*.pt"))
+                if (m := re.search(r"-v(\d+)\.pt$", p))]
+    version = max(versions, default=0) + 1
+    path = os.path.join(models_dir, f"{CHECKPOINT_PREFIX}-v{version}.pt")
+    torch.save({
+        "version": version,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "encoder": ENCODER_NAME,
+        "config": {"input_dim": model.conv1.nn[0].in_features, "hidden_dim": model.classifier.in_features,
+                   "num_skills": model.classifier.out_features},
+        "state_dict": model.state_dict(),
+        "ontology": index.ontology,
+        "node_features": index.node_features,
+        "adjacency": [a.tolist() for a in index.adjacency],
+        "fanouts": list(index.fanouts),
+        "metadata": metadata,
+    }, path)
+    with open(os.path.join(models_dir, "LATEST"), "w") as f:
+        f.write(os.path.basename(path))
+    logger.info(f"Saved GNN checkpoint v{version} to {path}")
+    return path
+
+def load_checkpoint(path: Optional[str] = None, models_dir: str = MODELS_DIR) -> Optional[GINXMLC]:
+    """Load a trained GINXMLC (LATEST by default) in eval mode with its SkillGraphIndex as ``model.skill_index``.
+
+    Returns None when no checkpoint exists so callers can skip the GNN instead of running an untrained model.
+    """
+    if path is None:
+        latest = os.path.join(models_dir, "LATEST")
+        if not os.path.exists(latest):
+            logger.warning(f"No trained GNN checkpoint in {models_dir}; run gnn_trainer.py to create one")
+            return None
+        with open(latest) as f:
+            path = os.path.join(models_dir, f.read().strip())
+    checkpoint = torch.load(path, map_location="cpu", weights_only=False)
+    model = GINXMLC(**checkpoint["config"])
+    model.load_state_dict(checkpoint["state_dict"])
+    model.eval()
+    model.skill_index = SkillGraphIndex(checkpoint["ontology"], checkpoint["node_features"],
+                                        [np.array(a, dtype=np.int64) for a in checkpoint["adjacency"]], checkpoint["fanouts"])
+    model.checkpoint_info = {k: checkpoint[k] for k in ("version", "created_at", "encoder", "metadata")}
+    logger.info(f"Loaded GNN checkpoint v{checkpoint['version']} from {path}")
+    return model
+
+def predict_missing_skills(model: Union[GINXMLC, CooccurrenceRecommender], graph_data: Optional[Data], known_skills: List[str], ontology: List[str], confidence_threshold: float = 0.65) -> List[str]:
+    """Predict missing skills with configurable confidence filtering from the GNN or the co-occurrence recommender"""
     try:
         if not known_skills or not ontology:
             logger.warning("Empty known_skills or ontology provided")
             return []
-        model.eval()
-        with torch.no_grad():
-            out = model(graph_data.x, graph_data.edge_index, graph_data.batch)
-            scores = out[0]
-            top_indices = torch.topk(scores, k=min(10, len(ontology))).indices.tolist()
-            predicted = [ontology[i % len(ontology)] for i in top_indices]
-            skill_confidence = {s: score for s, score in zip(predicted, scores[top_indices].tolist())}
-            missing_skills = [p for p in predicted if p.lower() not in [s.lower() for s in known_skills] and skill_confidence[p] > confidence_threshold]
-            logger.info(f"Predicted {len(missing_skills)} missing skills with confidence > {confidence_threshold}")
-            return missing_skills
+        if isinstance(model, CooccurrenceRecommender):
+            # Sparse PPMI scores; graph_data is not needed and known skills are masked before ranking
+            scores = torch.from_numpy(model.score(known_skills).astype(np.float32))
+            scores[[model.skill_to_idx[s.lower()] for s in known_skills if s.lower() in model.skill_to_idx]] = -1.0
+        else:
+            model.eval()
+            with torch.no_grad():
+                scores = model(graph_data.x, graph_data.edge_index, graph_data.batch)[0]
+        top_indices = torch.topk(scores, k=min(10, len(ontology))).indices.tolist()
+        predicted = [ontology[i % len(ontology)] for i in top_indices]
+        skill_confidence = {s: score for s, score in zip(predicted, scores[top_indices].tolist())}
+        # Query-side lookup: predictions and known skills never grow the shared vocabulary
+        gaps = set(get_skill_vocabulary().missing(predicted, known_skills))
+        missing_skills = [p for p in predicted if canonicalize(p) in gaps and skill_confidence[p] > confidence_threshold]
+        logger.info(f"Predicted {len(missing_skills)} missing skills with confidence > {confidence_threshold}")
+        return missing_skills
     except Exception as e:
         logger.error(f"Error predicting missing skills: {str(e)}")
         return []
 
+def predict_for_student(model: Union[GINXMLC, CooccurrenceRecommender, None], known_skills: List[str],
+                        confidence_threshold: float = 0.65) -> List[str]:
+    """Missing skills from whichever predictor is being served, building the GNN subgraph when needed"""
+    if isinstance(model, CooccurrenceRecommender):
+        return predict_missing_skills(model, None, known_skills, model.ontology, confidence_threshold)
+    skill_index = getattr(model, "skill_index", None)
+    if skill_index is None:
+        return []
+    return predict_missing_skills(model, skill_index.subgraph(known_skills), known_skills, skill_index.ontology, confidence_threshold)
+
 if __name__ == "__main__":
     try:
-        model = GINXMLC(num_skills=100)
-        print("GNN ready with enhanced ontology.")
+        model = load_checkpoint()
+        print("GNN ready with enhanced ontology." if model is not None else "No trained GNN checkpoint found.")
     except Exception as e:
         logger.error(f"Error initializing GNN model: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,121 @@
+import argparse
+import json
+import logging
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from torch_geometric.data import Batch, Data
+
+from gnn_skill_predictor import (GINXMLC, SkillGraphIndex, build_skill_adjacency, get_bi_encoder,
+                                 sample_skill_subgraph, save_checkpoint, MODELS_DIR)
+from skill_postings import load_postings, split_observed
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+SKILL_GRAPH_PATH = os.path.join(DATA_DIR, "skill_graph.json")
+
+def load_adjacency(ontology: List[str], postings: List[np.ndarray], graph_path: str = SKILL_GRAPH_PATH) -> List[np.ndarray]:
+    """Skill adjacency from skill_graph.json, or from posting co-occurrence when the graph file is missing"""
+    if os.path.exists(graph_path):
+        with open(graph_path) as f:
+            graph = json.load(f)
+    else:
+        graph = {f"job_{i}": [ontology[j] for j in ids] for i, ids in enumerate(postings)}
+    return build_skill_adjacency(graph, ontology)
+
+def make_batch(observed: List[np.ndarray], index: SkillGraphIndex, rng: np.random.Generator) -> Batch:
+    graphs = []
+    for seeds in observed:
+        nodes, edge_index = sample_skill_subgraph(seeds, index.adjacency, index.fanouts, rng)
+        graphs.append(Data(x=index.node_features[torch.from_numpy(nodes)], edge_index=torch.from_numpy(edge_index)))
+    return Batch.from_data_list(graphs)
+
+def precision_at_k(model: GINXMLC, index: SkillGraphIndex, postings: List[np.ndarray], k: int,
+                   observed_fraction: float, seed: int) -> float:
+    """Mean fraction of the top-k predicted (unobserved) skills that are hidden skills of the posting"""
+    rng = np.random.default_rng(seed)
+    splits = [split_observed(ids, rng, observed_fraction) for ids in postings if len(ids) > 1]
+    if not splits:
+        return 0.0
+    model.eval()
+    with torch.no_grad():
+        batch = make_batch([obs for obs, _ in splits], index, rng)
+        scores = model(batch.x, batch.edge_index, batch.batch)
+    precisions = []
+    for row, (observed, hidden) in zip(scores, splits):
+        row = row.clone()
+        row[torch.from_numpy(observed)] = -1.0
+        top = set(torch.topk(row, k=min(k, len(row))).indices.tolist())
+        precisions.append(len(top & set(hidden.tolist())) / min(k, len(hidden)))
+    return float(np.mean(precisions))
+
+def train_gnn(epochs: int = 30, batch_size: int = 32, lr: float = 1e-3, hidden_dim: int = 128,
+              fanouts: Tuple[int, ...] = (10, 5), observed_fraction: float = 0.5, k: int = 5,
+              val_fraction: float = 0.2, seed: int = 42, models_dir: str = MODELS_DIR) -> Tuple[GINXMLC, Dict]:
+    """Train GINXMLC on masked posting skill sets with neighbour-sampled mini-batches on CPU and save a checkpoint"""
+    torch.manual_seed(seed)
+    rng = np.random.default_rng(seed)
+    ontology, postings = load_postings()
+    adjacency = load_adjacency(ontology, postings)
+    node_features = torch.tensor(np.asarray(get_bi_encoder().encode(ontology)), dtype=torch.float)
+    index = SkillGraphIndex(ontology, node_features, adjacency, fanouts)
+
+    order = rng.permutation(len(postings))
+    n_val = max(1, int(len(postings) * val_fraction))
+    val = [postings[i] for i in order[:n_val]]
+    train = [postings[i] for i in order[n_val:]]
+    logger.info(f"Training on {len(train)} postings, validating on {len(val)}, ontology of {len(ontology)} skills")
+
+    model = GINXMLC(input_dim=node_features.size(1), hidden_dim=hidden_dim, num_skills=len(ontology))
+    optimizer = torch.optim.Adam(model.parameters(), lr=lr)
+    best_precision, best_state = -1.0, None
+    for epoch in range(1, epochs + 1):
+        model.train()
+        total_loss = 0.0
+        train = [train[i] for i in rng.permutation(len(train))]
+        for start in range(0, len(train), batch_size):
+            chunk = train[start:start + batch_size]
+            observed = [split_observed(ids, rng, observed_fraction)[0] for ids in chunk]
+            batch = make_batch(observed, index, rng)
+            target = torch.zeros((len(chunk), len(ontology)))
+            for row, ids in enumerate(chunk):
+                target[row, torch.from_numpy(ids)] = 1.0
+            optimizer.zero_grad()
+            loss = F.binary_cross_entropy(model(batch.x, batch.edge_index, batch.batch), target)
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item() * len(chunk)
+        precision = precision_at_k(model, index, val, k, observed_fraction, seed)
+        logger.info(f"Epoch {epoch}: loss={total_loss / max(len(train), 1):.4f} precision@{k}={precision:.3f}")
+        if precision > best_precision:
+            best_precision = precision
+            best_state = {name: t.detach().clone() for name, t in model.state_dict().items()}
+
+    model.load_state_dict(best_state)
+    model.eval()
+    metrics = {f"precision_at_{k}": best_precision, "epochs": epochs, "train_postings": len(train),
+               "val_postings": len(val), "fanouts": list(fanouts)}
+    save_checkpoint(model, index, metrics, models_dir)
+    model.skill_index = index
+    return model, metrics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train GINXMLC on job/skill co-occurrence and save a checkpoint")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--lr", type=float, default=1e-3)
+    parser.add_argument("--hidden-dim", type=int, default=128)
+    parser.add_argument("--fanouts", type=int, nargs="+", default=[10, 5])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--models-dir", default=MODELS_DIR)
+    args = parser.parse_args()
+    _, metrics = train_gnn(epochs=args.epochs, batch_size=args.batch_size, lr=args.lr, hidden_dim=args.hidden_dim,
+                           fanouts=tuple(args.fanouts), k=args.k, seed=args.seed, models_dir=args.models_dir)
+    print("Training complete:", metrics)
@@ -0,0 +1,85 @@
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from resume_features import RESUME_FEATURES
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PARAGRAPH_PATTERN = re.compile(r"(?:[^\n]*\S[^\n]*(?:\n|$))+")
+
+def segment_resume(text: str) -> List[Tuple[int, int]]:
+    """Character spans of the resume's sections in order: the text before the first
+    heading, then one span per heading section; blank-line paragraphs when there are no headings"""
+    spans = sorted(span for spans in RESUME_FEATURES.extract(text).sections.values() for span in spans)
+    if not spans:
+        return [match.span() for match in PARAGRAPH_PATTERN.finditer(text)]
+    if text[:spans[0][0]].strip():
+        spans.insert(0, (0, spans[0][0]))
+    return spans
+
+def section_key(text: str, industry: Optional[str]) -> str:
+    # Whitespace-only edits keep the same key
+    return hashlib.sha1(f"{industry}\x00{' '.join(text.split())}".encode()).hexdigest()
+
+class SectionCachedExtractor:
+    """Incremental front end to IndustrySkillExtractor.extract_skills_advanced.
+
+    The resume is split into sections and each one is keyed by a hash of its
+    text. Model outputs (skills, entity spans, embedding) are cached per
+    section, so when a student edits one line and re-analyzes, only the
+    changed section goes through the encoder and NER before the per-section
+    results are merged and the whole-resume scores recomputed.
+    """
+    def __init__(self, extractor, max_sections: int = 4096):
+        self.extractor = extractor
+        self.max_sections = max_sections
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # Anything else (bi_encoder, skill_db, ...) comes from the wrapped extractor
+        if name == "extractor":
+            raise AttributeError(name)
+        return getattr(self.extractor, name)
+
+    def _section_features(self, sections: List[str], industry: Optional[str]) -> Tuple[List[Dict], int]:
+        keys = [section_key(section, industry) for section in sections]
+        with self._lock:
+            features = [self._cache.get(key) for key in keys]
+            for key, feature in zip(keys, features):
+                if feature is not None:
+                    self._cache.move_to_end(key)
+        missing = [i for i, feature in enumerate(features) if feature is None]
+        computed = self.extractor.extract_section_features([sections[i] for i in missing], industry)
+        with self._lock:
+            for i, feature in zip(missing, computed):
+                features[i] = self._cache[keys[i]] = feature
+            while len(self._cache) > self.max_sections:
+                self._cache.popitem(last=False)
+            self.hits += len(sections) - len(missing)
+            self.misses += len(missing)
+        return features, len(missing)
+
+    def extract_skills_advanced(self, text: str, industry: Optional[str] = None) -> Dict:
+        spans = segment_resume(text)
+        features, recomputed = self._section_features([text[start:end] for start, end in spans], industry)
+        report = self.extractor.merge_section_features(features, text, industry)
+        report["entities"] = [(start + offset, end + offset, label)
+                              for (offset, _), feature in zip(spans, features) for start, end, label in feature["entities"]]
+        if features:
+            # Length-weighted mean of the section embeddings stands in for a whole-resume embedding
+            weights = np.array([end - start for start, end in spans], dtype=np.float32)
+            embedding = np.average(np.stack([f["embedding"] for f in features]), axis=0, weights=weights)
+            report["embedding"] = embedding / max(float(np.linalg.norm(embedding)), 1e-12)
+        report["sections"] = {"total": len(spans), "recomputed": recomputed}
+        return report
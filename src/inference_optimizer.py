@@ -0,0 +1,269 @@
+import argparse
+import copy
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from gnn_skill_predictor import GINXMLC, MODELS_DIR, load_checkpoint
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+OPTIMIZED_DIR = os.path.join(MODELS_DIR, "optimized")
+ENCODER_DIR = os.path.join(OPTIMIZED_DIR, "encoder")
+NUM_THREADS_ENV = "JOBBRIDGE_NUM_THREADS"
+# Sequence lengths the encoder is traced at (plus the encoder's max_seq_length) and the traced batch size
+LENGTH_BUCKETS = (16, 32, 64, 128)
+BATCH_SIZE = 8
+# Skill names, a resume line and a long section, so the parity check reaches every bucket
+PARITY_SENTENCES = [
+    "python", "machine learning", "react native", "penetration testing", "cloud computing", "data visualization",
+    "Built a REST API in Flask with PostgreSQL and deployed it on AWS using Docker and GitHub Actions",
+    " ".join(["Led a team of four to design, build and ship a mobile app for campus events with Flutter, Firebase "
+              "authentication, push notifications and an analytics dashboard used by over two thousand students."] * 4),
+]
+
+def configure_threads(num_threads: Optional[int] = None) -> int:
+    """Set torch intra-op threads from the argument or JOBBRIDGE_NUM_THREADS; returns the active count"""
+    if num_threads is None and os.environ.get(NUM_THREADS_ENV):
+        num_threads = int(os.environ[NUM_THREADS_ENV])
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    return torch.get_num_threads()
+
+def quantize_linear_layers(model: nn.Module) -> nn.Module:
+    """Return a copy of the model with every nn.Linear replaced by a dynamic int8 version"""
+    return torch.ao.quantization.quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+
+class ScriptableGIN(nn.Module):
+    """TorchScript-friendly GINXMLC forward pass.
+
+    GINConv's aggregation is rewritten as an ``index_add_`` over edges so the
+    module scripts without PyG and keeps dynamic node/edge counts.
+    """
+    def __init__(self, model: GINXMLC):
+        super().__init__()
+        self.mlp1 = model.conv1.nn
+        self.mlp2 = model.conv2.nn
+        self.classifier = model.classifier
+        self.eps1 = float(model.conv1.eps)
+        self.eps2 = float(model.conv2.eps)
+
+    def forward(self, x: torch.Tensor, edge_index: torch.Tensor, batch: torch.Tensor) -> torch.Tensor:
+        agg = torch.zeros_like(x).index_add_(0, edge_index[1], x[edge_index[0]])
+        x = F.relu(self.mlp1((1.0 + self.eps1) * x + agg))
+        agg = torch.zeros_like(x).index_add_(0, edge_index[1], x[edge_index[0]])
+        x = F.relu(self.mlp2((1.0 + self.eps2) * x + agg))
+        num_graphs = int(batch.max()) + 1 if batch.numel() > 0 else 1
+        pooled = torch.zeros((num_graphs, x.size(1)), dtype=x.dtype).index_add_(0, batch, x)
+        return torch.sigmoid(self.classifier(pooled))
+
+def export_gnn(model: GINXMLC, path: str, quantize: bool = True) -> torch.jit.ScriptModule:
+    """Script (and optionally int8-quantize) a GINXMLC and save it with torch.jit.save"""
+    scripted = torch.jit.script(build_optimized_gnn(model, quantize))
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    torch.jit.save(scripted, path)
+    return scripted
+
+def build_optimized_gnn(model: GINXMLC, quantize: bool = True) -> nn.Module:
+    optimized = ScriptableGIN(copy.deepcopy(model)).eval()
+    return quantize_linear_layers(optimized) if quantize else optimized
+
+class _EncoderCore(nn.Module):
+    """Transformer + masked mean pooling (+ L2 normalization) of a SentenceTransformer as one traceable module"""
+    def __init__(self, encoder, normalize: bool):
+        super().__init__()
+        self.transformer = encoder[0].auto_model
+        self.normalize = normalize
+
+    def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        tokens = self.transformer(input_ids=input_ids, attention_mask=attention_mask)[0]
+        mask = attention_mask.unsqueeze(-1).to(tokens.dtype)
+        pooled = (tokens * mask).sum(1) / mask.sum(1).clamp(min=1e-9)
+        return F.normalize(pooled, p=2, dim=1) if self.normalize else pooled
+
+class TracedSentenceEncoder:
+    """Int8, TorchScript-traced stand-in for SentenceTransformer.encode on CPU hosts.
+
+    Traced graphs keep the shapes they were traced with, so one graph is traced
+    per sequence-length bucket at a fixed batch size. Each sentence goes to the
+    smallest bucket that holds it, and short final batches are padded with
+    empty rows. The largest bucket is the encoder's own ``max_seq_length``, so
+    nothing is truncated beyond what the fp32 encoder does.
+    """
+    def __init__(self, modules: Dict[int, torch.jit.ScriptModule], tokenizer, batch_size: int = BATCH_SIZE):
+        self.modules = dict(sorted(modules.items()))
+        self.buckets = np.array(list(self.modules))
+        self.tokenizer = tokenizer
+        self.batch_size = batch_size
+
+    @classmethod
+    def from_sentence_transformer(cls, encoder, buckets: Sequence[int] = LENGTH_BUCKETS, batch_size: int = BATCH_SIZE,
+                                  quantize: bool = True) -> "TracedSentenceEncoder":
+        max_length = int(encoder.max_seq_length)
+        buckets = sorted({b for b in buckets if b < max_length} | {max_length})
+        normalize = any(type(m).__name__ == "Normalize" for m in encoder)
+        core = _EncoderCore(copy.deepcopy(encoder), normalize).eval()
+        if quantize:
+            core = quantize_linear_layers(core)
+        tokenizer = encoder.tokenizer
+        modules = {}
+        with torch.no_grad():
+            for length in buckets:
+                example = tokenizer(["python"] * batch_size, padding="max_length", truncation=True, max_length=length,
+                                    return_tensors="pt")
+                modules[length] = torch.jit.trace(core, (example["input_ids"], example["attention_mask"]), strict=False)
+        return cls(modules, tokenizer, batch_size)
+
+    def encode(self, sentences, **kwargs) -> np.ndarray:
+        """Embeddings for a sentence or a list of them; SentenceTransformer keyword arguments are ignored"""
+        if isinstance(sentences, str):
+            return self.encode([sentences])[0]
+        sentences = [str(s) for s in sentences]
+        output = np.zeros((len(sentences), self.get_sentence_embedding_dimension()), dtype=np.float32)
+        if not sentences:
+            return output
+        lengths = [len(ids) for ids in self.tokenizer(sentences, truncation=True, max_length=int(self.buckets[-1]))["input_ids"]]
+        bucket_of = np.searchsorted(self.buckets, lengths)
+        with torch.no_grad():
+            for position, length in enumerate(self.buckets):
+                rows = np.flatnonzero(bucket_of == position)
+                for start in range(0, len(rows), self.batch_size):
+                    chunk = rows[start:start + self.batch_size]
+                    batch = [sentences[i] for i in chunk] + [""] * (self.batch_size - len(chunk))
+                    tokens = self.tokenizer(batch, padding="max_length", truncation=True, max_length=int(length), return_tensors="pt")
+                    output[chunk] = self.modules[int(length)](tokens["input_ids"], tokens["attention_mask"])[:len(chunk)].numpy()
+        return output
+
+    def get_sentence_embedding_dimension(self) -> int:
+        if not hasattr(self, "_dimension"):
+            length = int(self.buckets[0])
+            with torch.no_grad():
+                tokens = self.tokenizer([""] * self.batch_size, padding="max_length", max_length=length, return_tensors="pt")
+                self._dimension = int(self.modules[length](tokens["input_ids"], tokens["attention_mask"]).shape[1])
+        return self._dimension
+
+    def save(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        for length, module in self.modules.items():
+            torch.jit.save(module, os.path.join(directory, f"encoder_{length}.pt"))
+        self.tokenizer.save_pretrained(directory)
+        with open(os.path.join(directory, "encoder_config.json"), "w") as f:
+            json.dump({"buckets": [int(b) for b in self.modules], "batch_size": self.batch_size}, f)
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["TracedSentenceEncoder"]:
+        config_path = os.path.join(directory, "encoder_config.json")
+        if not os.path.exists(config_path):
+            return None
+        from transformers import AutoTokenizer
+        with open(config_path) as f:
+            config = json.load(f)
+        modules = {length: torch.jit.load(os.path.join(directory, f"encoder_{length}.pt")) for length in config["buckets"]}
+        return cls(modules, AutoTokenizer.from_pretrained(directory), config["batch_size"])
+
+def gnn_parity(reference: nn.Module, candidate: nn.Module, graphs: List, k: int = 10) -> Dict:
+    """Compare candidate GNN scores to the fp32 reference: max abs error and top-k overlap"""
+    max_error, overlaps = 0.0, []
+    with torch.no_grad():
+        for graph in graphs:
+            expected = reference(graph.x, graph.edge_index, graph.batch)[0]
+            actual = candidate(graph.x, graph.edge_index, graph.batch)[0]
+            max_error = max(max_error, float((expected - actual).abs().max()))
+            top_k = min(k, expected.numel())
+            overlaps.append(len(set(torch.topk(expected, top_k).indices.tolist()) &
+                                set(torch.topk(actual, top_k).indices.tolist())) / top_k)
+    return {"max_abs_error": max_error, "topk_overlap": float(np.mean(overlaps)) if overlaps else 1.0}
+
+def encoder_parity(reference, candidate, sentences: Sequence[str]) -> Dict:
+    """Cosine similarity between fp32 and optimized sentence embeddings"""
+    expected = np.asarray(reference.encode(list(sentences)), dtype=np.float32)
+    actual = np.asarray(candidate.encode(list(sentences)), dtype=np.float32)
+    cosine = (expected * actual).sum(1) / (np.linalg.norm(expected, axis=1) * np.linalg.norm(actual, axis=1) + 1e-12)
+    return {"mean_cosine": float(cosine.mean()), "min_cosine": float(cosine.min())}
+
+def load_optimized_encoder(reference, directory: str = ENCODER_DIR, min_cosine: float = 0.98):
+    """The exported int8 encoder from ``directory`` (traced from ``reference`` when none was exported).
+
+    Falls back to ``reference`` when the optimized encoder disagrees with it on
+    sample sentences that span every length bucket.
+    """
+    try:
+        optimized = TracedSentenceEncoder.load(directory) or TracedSentenceEncoder.from_sentence_transformer(reference)
+        parity = encoder_parity(reference, optimized, PARITY_SENTENCES)
+    except Exception as e:
+        logger.warning(f"Optimized encoder unavailable ({e}); serving fp32 encoder")
+        return reference
+    if parity["min_cosine"] < min_cosine:
+        logger.warning(f"Optimized encoder failed parity check ({parity}); serving fp32 encoder")
+        return reference
+    logger.info(f"Serving int8 TorchScript encoder ({parity})")
+    return optimized
+
+def load_optimized_gnn(models_dir: str = MODELS_DIR, min_topk_overlap: float = 0.9) -> Optional[nn.Module]:
+    """Load the latest checkpoint as a quantized, scripted module.
+
+    Falls back to the fp32 model when the optimized one disagrees with it on
+    sample student graphs. Returns None when no checkpoint exists.
+    """
+    model = load_checkpoint(models_dir=models_dir)
+    if model is None:
+        return None
+    index = model.skill_index
+    optimized = torch.jit.script(build_optimized_gnn(model))
+    samples = [index.subgraph(index.ontology[i:i + 3]) for i in range(0, min(len(index.ontology), 30), 3)]
+    parity = gnn_parity(model, optimized, samples)
+    if parity["topk_overlap"] < min_topk_overlap:
+        logger.warning(f"Optimized GNN failed parity check ({parity}); serving fp32 model")
+        return model
+    logger.info(f"Serving int8 TorchScript GNN ({parity})")
+    optimized.skill_index = index
+    optimized.checkpoint_info = model.checkpoint_info
+    return optimized
+
+def _time_call(fn, repeats: int = 20) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export int8 TorchScript GNN/encoder artifacts and check parity against fp32")
+    parser.add_argument("--output-dir", default=OPTIMIZED_DIR)
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--buckets", type=int, nargs="+", default=list(LENGTH_BUCKETS),
+                        help="Sequence-length buckets to trace the encoder at (its max_seq_length is always added)")
+    args = parser.parse_args()
+    print("torch threads:", configure_threads(args.threads))
+    report = {}
+
+    from gnn_skill_predictor import get_bi_encoder
+    bi_encoder = get_bi_encoder()
+    encoder = TracedSentenceEncoder.from_sentence_transformer(bi_encoder, buckets=args.buckets)
+    encoder.save(os.path.join(args.output_dir, "encoder"))
+    report["encoder"] = encoder_parity(bi_encoder, encoder, PARITY_SENTENCES)
+    report["encoder"]["fp32_ms"] = _time_call(lambda: bi_encoder.encode(PARITY_SENTENCES))
+    report["encoder"]["optimized_ms"] = _time_call(lambda: encoder.encode(PARITY_SENTENCES))
+
+    gnn = load_checkpoint()
+    if gnn is not None:
+        scripted = export_gnn(gnn, os.path.join(args.output_dir, "gin_xmlc_int8.pt"))
+        samples = [gnn.skill_index.subgraph(gnn.skill_index.ontology[i:i + 3]) for i in range(0, len(gnn.skill_index.ontology), 3)]
+        report["gnn"] = gnn_parity(gnn, scripted, samples)
+        graph = samples[0]
+        with torch.no_grad():
+            report["gnn"]["fp32_ms"] = _time_call(lambda: gnn(graph.x, graph.edge_index, graph.batch))
+            report["gnn"]["optimized_ms"] = _time_call(lambda: scripted(graph.x, graph.edge_index, graph.batch))
+
+    with open(os.path.join(args.output_dir, "parity_report.json"), "w") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
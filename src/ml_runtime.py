@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class MLRuntime:
+    """Imports and builds the ML stack (extractor, GNN) on a background thread.
+
+    The UI renders immediately with basic analysis; callers check ``ready`` /
+    ``available`` on each rerun and switch to the ML path once loading is done.
+    """
+    def __init__(self):
+        self.extractor = None
+        self.section_extractor = None
+        self.gnn_model = None
+        self.skill_predictor = None
+        self.error: Optional[BaseException] = None
+        self.load_seconds: Optional[float] = None
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "MLRuntime":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._load, name="ml-runtime", daemon=True)
+            self._thread.start()
+        return self
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            from inference_optimizer import configure_threads, load_optimized_encoder, load_optimized_gnn
+            from advanced_skill_extractor import IndustrySkillExtractor
+            from artifact_bundle import MODELS_DIR, get_bundle
+            configure_threads()
+            bundle = get_bundle()
+            self.gnn_model = load_optimized_gnn(bundle.models_dir("gnn_checkpoint", MODELS_DIR) if bundle is not None else MODELS_DIR)
+            from cooccurrence_recommender import CooccurrenceRecommender, choose_skill_predictor
+            self.skill_predictor = choose_skill_predictor(self.gnn_model, CooccurrenceRecommender.load())
+            self.extractor = IndustrySkillExtractor()
+            # int8 traced encoder for request-time encoding, behind the same kind of parity gate as the GNN
+            self.extractor.bi_encoder = load_optimized_encoder(self.extractor.bi_encoder)
+            from incremental_analysis import SectionCachedExtractor
+            self.section_extractor = SectionCachedExtractor(self.extractor)
+            # Course embeddings for semantic course search (from the bundle when prebuilt)
+            from course_search import get_course_search
+            get_course_search(encoder=self.extractor.bi_encoder)
+        except Exception as e:
+            logger.warning(f"ML modules failed to load: {e}. Running in basic mode.")
+            self.error = e
+        finally:
+            self.load_seconds = time.perf_counter() - start
+            self._done.set()
+            logger.info(f"ML runtime finished loading in {self.load_seconds:.1f}s")
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    @property
+    def available(self) -> bool:
+        return self.ready and self.error is None and self.extractor is not None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until loading finishes; returns whether the ML stack is usable"""
+        self._done.wait(timeout)
+        return self.available
@@ -0,0 +1,65 @@
+import json
+
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from cohort_analytics import CohortAnalytics, READINESS_BANDS
+from role_model import ROLE_MODEL
+
+st.set_page_config(page_title="Job Bridge - Cohort Analytics", page_icon="📊", layout="wide")
+
+if 'cohort' not in st.session_state:
+    st.session_state.cohort = CohortAnalytics()
+cohort = st.session_state.cohort
+
+st.title("Cohort Analytics")
+st.caption("Aggregate skill coverage, gaps, readiness and course demand across a batch of students")
+
+col1, col2 = st.columns(2)
+with col1:
+    results_file = st.file_uploader("Analyzed results (JSON / JSONL)", type=['json', 'jsonl'],
+                                    help="Records with student_id, target_role, found_skills and overall_score")
+    if results_file is not None and st.button("Add results", use_container_width=True):
+        raw = results_file.read().decode("utf-8")
+        records = [json.loads(line) for line in raw.splitlines() if line.strip()] if results_file.name.endswith(".jsonl") else json.loads(raw)
+        cohort.add_results(records)
+        st.success(f"Added {len(records)} records")
+with col2:
+    resume_files = st.file_uploader("Raw resumes (TXT)", type=['txt'], accept_multiple_files=True)
+    role = st.selectbox("Target role for uploaded resumes", ROLE_MODEL.role_names())
+    if resume_files and st.button("Add resumes", use_container_width=True):
+        cohort.add_resumes((f.name, f.read().decode("utf-8", errors="ignore"), role) for f in resume_files)
+        st.success(f"Added {len(resume_files)} resumes")
+
+summary = cohort.summary()
+if not summary['students']:
+    st.info("Upload analyzed results or resumes to build the cohort summary.")
+    st.stop()
+
+metric_cols = st.columns(len(READINESS_BANDS) + 1)
+metric_cols[0].metric("Students", summary['students'])
+for col, (_, label) in zip(metric_cols[1:], READINESS_BANDS):
+    col.metric(label, summary['readiness'][label])
+
+roles, skills, matrix = cohort.coverage_heatmap()
+heatmap = go.Figure(go.Heatmap(z=matrix.round(1), x=skills, y=roles, colorscale="RdYlGn", zmin=0, zmax=100,
+                               hovertemplate='%{y} / %{x}: %{z}%<extra></extra>'))
+heatmap.update_layout(title="Skill Coverage by Role (%)", height=200 + 40 * len(roles), margin=dict(l=160, r=20, t=60, b=120))
+st.plotly_chart(heatmap, use_container_width=True)
+
+col1, col2 = st.columns(2)
+with col1:
+    gaps = pd.DataFrame(summary['top_gaps'])
+    if not gaps.empty:
+        st.plotly_chart(px.bar(gaps, x='students', y='skill', orientation='h', title="Most Common Gaps"), use_container_width=True)
+with col2:
+    readiness = pd.DataFrame({'level': list(summary['readiness']), 'students': list(summary['readiness'].values())})
+    st.plotly_chart(px.pie(readiness, names='level', values='students', title="Readiness Distribution"), use_container_width=True)
+
+st.subheader("Course Demand Forecast")
+st.dataframe(pd.DataFrame(summary['course_demand']), use_container_width=True, hide_index=True)
+
+st.download_button("Download cohort summary (JSON)", data=json.dumps(summary, indent=2),
+                   file_name="cohort_summary.json", mime="application/json", use_container_width=True)
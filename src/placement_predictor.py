@@ -1,54 +1,217 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import os
+import re
+import time
+import threading
+import logging
+from typing import Dict, List, Optional
+from skill_vocabulary import canonicalize, get_skill_vocabulary
+
+logger = logging.getLogger(__name__)
 
-model = SentenceTransformer('all-MiniLM-L6-v2')
 DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
 SKILLS_CSV_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+ENCODER_NAME = 'all-MiniLM-L6-v2'
+
+_encoder = None
+_encoder_lock = threading.Lock()
+
+def get_encoder():
+    """Shared sentence-transformer, constructed on first use so importing this module stays cheap"""
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                from sentence_transformers import SentenceTransformer
+                _encoder = SentenceTransformer(ENCODER_NAME)
+    return _encoder
 
 def normalize_skills(skills_text):
     if not skills_text or pd.isna(skills_text):
         return []
     skills_text = skills_text.lower().replace("|", ",").replace(";", ",")
     skills = [s.strip() for s in skills_text.split(",") if s.strip()]
-    mapping = {"py": "python", "ml": "machine learning", "nlp": "natural language processing"}
-    return [mapping.get(s, s) for s in skills]
+    return [canonicalize(s) for s in skills]
+
+FALLBACK_JOB_SKILLS = ["python", "sql", "machine learning", "aws", "digital marketing"]  # India-specific fallback
+
+# Alternate spellings that should resolve to a title present in skills_dataset.csv
+ROLE_ALIASES = {
+    "ml engineer": "ai/ml engineer",
+    "ai engineer": "ai/ml engineer",
+    "machine learning engineer": "ai/ml engineer",
+    "artificial intelligence": "ai/ml engineer",
+    "data science": "data scientist",
+    "cyber security": "cybersecurity specialist",
+    "cybersecurity analyst": "cybersecurity specialist",
+    "cloud engineer": "cloud architect",
+    "iot engineer": "iot developer",
+    "llm engineer": "prompt engineer",
+}
+
+def normalize_title(title: str) -> str:
+    """Lowercase a job title and collapse punctuation/whitespace so case and spacing variants collide"""
+    title = str(title).lower().replace("&", " and ")
+    return re.sub(r"[^a-z0-9+#]+", " ", title).strip()
+
+class RoleEntry:
+    """Deduplicated skills of one role with their precomputed embeddings"""
+    __slots__ = ("title", "skills", "embeddings")
+
+    def __init__(self, title: str, skills: List[str], embeddings: np.ndarray):
+        self.title = title
+        self.skills = skills
+        self.embeddings = embeddings
+
+class RoleCatalog:
+    """In-memory index of job roles built once from skills_dataset.csv.
+
+    Titles are keyed by their normalized form, a space-free variant and any
+    ROLE_ALIASES, so lookups never touch the CSV. The file's mtime is checked
+    at most every ``check_interval`` seconds and the index is rebuilt when it changes.
+    """
+    def __init__(self, csv_path: str = SKILLS_CSV_PATH, encoder=None, check_interval: float = 5.0):
+        self.csv_path = csv_path
+        self.encoder = encoder
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._last_check = 0.0
+        self._entries: Dict[str, RoleEntry] = {}
+        self._index: Dict[str, str] = {}
+        self.fallback = None
+        self.reload()
+
+    def _encode(self, skills: List[str]) -> np.ndarray:
+        encoder = self.encoder if self.encoder is not None else get_encoder()
+        if not skills:
+            return np.zeros((0, encoder.get_sentence_embedding_dimension()), dtype=np.float32)
+        return np.asarray(encoder.encode(skills), dtype=np.float32)
+
+    def reload(self):
+        """Rebuild the index from disk"""
+        mtime = os.path.getmtime(self.csv_path) if os.path.exists(self.csv_path) else None
+        role_skills: Dict[str, List[str]] = {}
+        if mtime is not None:
+            df = pd.read_csv(self.csv_path)
+            if "title" in df.columns and "skills" in df.columns:
+                for title, skills_text in zip(df["title"], df["skills"]):
+                    if pd.isna(title):
+                        continue
+                    skills = role_skills.setdefault(str(title).strip(), [])
+                    seen = set(skills)
+                    for skill in normalize_skills(skills_text):
+                        if skill not in seen:
+                            seen.add(skill)
+                            skills.append(skill)
+
+        entries = {title: RoleEntry(title, skills, self._encode(skills)) for title, skills in role_skills.items()}
+        index = {}
+        for title in entries:
+            key = normalize_title(title)
+            index[key] = title
+            index[key.replace(" ", "")] = title
+        for alias, target in ROLE_ALIASES.items():
+            title = index.get(normalize_title(target))
+            if title is not None:
+                index.setdefault(normalize_title(alias), title)
+                index.setdefault(normalize_title(alias).replace(" ", ""), title)
+
+        fallback = self.fallback or RoleEntry("fallback", list(FALLBACK_JOB_SKILLS), self._encode(FALLBACK_JOB_SKILLS))
+        with self._lock:
+            self._entries, self._index, self._mtime, self.fallback = entries, index, mtime, fallback
+            self._last_check = time.monotonic()
+        logger.info(f"Role catalog built with {len(entries)} roles and {len(index)} keys")
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+        mtime = os.path.getmtime(self.csv_path) if os.path.exists(self.csv_path) else None
+        if mtime != self._mtime:
+            self.reload()
+
+    def lookup(self, job_role: str) -> Optional[RoleEntry]:
+        """Return the entry for a title, alias or case/spacing variant, or None"""
+        self._maybe_reload()
+        key = normalize_title(job_role)
+        title = self._index.get(key) or self._index.get(key.replace(" ", ""))
+        return self._entries.get(title) if title else None
+
+    def titles(self) -> List[str]:
+        return list(self._entries)
+
+_role_catalog = None
+_role_catalog_lock = threading.Lock()
+
+def get_role_catalog() -> RoleCatalog:
+    """Process-wide role catalog, built on first use"""
+    global _role_catalog
+    if _role_catalog is None:
+        with _role_catalog_lock:
+            if _role_catalog is None:
+                _role_catalog = RoleCatalog()
+    return _role_catalog
 
 def load_job_skills(job_role):
-    if not os.path.exists(SKILLS_CSV_PATH):
-        return []
-    df = pd.read_csv(SKILLS_CSV_PATH)
-    match = df[df["title"].str.lower() == job_role.lower()]
-    if not match.empty and "skills" in match.columns:
-        return [x.strip() for x in match.iloc[0]["skills"].split(",")]
-    return ["python", "sql", "machine learning", "aws", "digital marketing"]  # India-specific fallback
+    entry = get_role_catalog().lookup(job_role)
+    return list(entry.skills) if entry else list(FALLBACK_JOB_SKILLS)
+
+def _normalize_rows(embeddings: np.ndarray) -> np.ndarray:
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+def _match_type(similarity: float) -> str:
+    return "very strong" if similarity >= 0.90 else "good" if similarity >= 0.75 else "partial"
+
+def match_skills_batch(students: List[List[str]], job_skills: List[str], job_embeddings: np.ndarray, encoder=None) -> List[List[tuple]]:
+    """Match many students' skills against one role in a single similarity matrix.
+
+    Every distinct student skill is encoded once and indexed; one normalized
+    (student skill x job skill) product with a row-wise argmax gives each
+    skill's best job match. Returns ``(skill, match_type, similarity)`` tuples per student.
+    """
+    encoder = encoder if encoder is not None else get_encoder()
+    job_index = {skill: i for i, skill in enumerate(job_skills)}
+    vocab = {}
+    for skills in students:
+        for skill in skills:
+            if skill not in job_index and skill not in vocab:
+                vocab[skill] = len(vocab)
+
+    best_sim = np.zeros(len(vocab), dtype=np.float32)
+    if vocab and len(job_skills):
+        student_emb = _normalize_rows(encoder.encode(list(vocab)))
+        similarity = student_emb @ _normalize_rows(job_embeddings).T
+        best_sim = similarity[np.arange(len(vocab)), similarity.argmax(axis=1)]
+
+    results = []
+    for skills in students:
+        matches = []
+        for skill in skills:
+            if skill in job_index:
+                matches.append((skill, "exact", 1.0))
+            else:
+                sim = float(best_sim[vocab[skill]])
+                matches.append((skill, _match_type(sim), sim))
+        results.append(matches)
+    return results
+
+def match_skills(student_skills: List[str], job_skills: List[str], job_embeddings: np.ndarray, encoder=None) -> List[tuple]:
+    """Single-student form of match_skills_batch"""
+    return match_skills_batch([student_skills], job_skills, job_embeddings, encoder)[0]
 
 def predict_placement(known_skills, preferred_job_role, education_level, experience_months, projects_count, matches_df, recommendations_df):
     student_skills = normalize_skills(known_skills)
-    job_role = preferred_job_role.strip().lower()
-    job_skills = set(load_job_skills(job_role))
-    all_skills = list(set(student_skills + list(job_skills)))
-
-    matching_skills = []
-    if all_skills:
-        skill_embeddings = model.encode(all_skills)
-        student_indices = [all_skills.index(s) for s in student_skills if s in all_skills]
-        job_indices = [all_skills.index(s) for s in job_skills if s in all_skills]
-        for s in student_skills:
-            if s in job_skills:
-                matching_skills.append((s, "exact", 1.0))
-            else:
-                s_idx = all_skills.index(s) if s in all_skills else None
-                if s_idx is not None:
-                    similarities = cosine_similarity([skill_embeddings[s_idx]], skill_embeddings[job_indices])[0]
-                    max_sim = max(similarities) if similarities.size > 0 else 0.0
-                    match_type = "very strong" if max_sim >= 0.90 else "good" if max_sim >= 0.75 else "partial"
-                    matching_skills.append((s, match_type, max_sim))
-
-    skill_gaps = [s for s in job_skills if s not in student_skills]
+    entry = get_role_catalog().lookup(preferred_job_role.strip()) or get_role_catalog().fallback
+    job_skills = entry.skills
+    matching_skills = match_skills(student_skills, job_skills, entry.embeddings) if student_skills else []
+
+    skill_gaps = get_skill_vocabulary().missing(job_skills, student_skills)
     top_required_skills = list(job_skills)[:5]
     advantages = [s for s in student_skills if s not in top_required_skills]
     roadmap = [(g, f"Learn {g} on SWAYAM", "medium (4 weeks)") for g in skill_gaps[:3]]
@@ -0,0 +1,484 @@
+import argparse
+import html
+import io
+import json
+import logging
+import re
+import sys
+import threading
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+WIDTH = 100
+
+# Report IR: every writer consumes the same stream of blocks
+class Heading(NamedTuple):
+    text: str
+    level: int = 1  # 0 title, 1 section, 2 underlined sub-heading, 3 plain label
+    subtitle: str = ""
+
+class Paragraph(NamedTuple):
+    text: str
+
+class Fields(NamedTuple):
+    rows: List[Tuple[str, str]]
+    indent: int = 0
+    width: int = 0
+
+class ScoreBar(NamedTuple):
+    number: int
+    label: str
+    percent: float
+    details: List[str]
+
+class Coverage(NamedTuple):
+    rows: List[Tuple[str, int, int, float]]
+
+class Items(NamedTuple):
+    items: List[str]
+    style: str = "bullet"  # bullet, arrow, dash, number, check, cross
+
+class Entries(NamedTuple):
+    entries: List[Tuple[str, List[Tuple[str, str]]]]
+
+class Footer(NamedTuple):
+    lines: List[str]
+
+def bar(percent: float) -> str:
+    return "█" * int(percent / 5)
+
+def report_blocks(results: Dict, target_role: str, generated_at: Optional[datetime] = None) -> Iterator:
+    """The report as IR blocks; sections whose results are missing (e.g. batch records) are skipped"""
+    generated_at = generated_at or datetime.now()
+    yield Heading("JOB BRIDGE - CAREER INTELLIGENCE REPORT", 0, "ML-Powered Resume Analysis & Career Roadmap")
+    yield Fields([("Generated on", generated_at.strftime('%B %d, %Y at %I:%M %p')), ("Target Role", target_role),
+                  ("Analysis Type", "Comprehensive Career Assessment")])
+
+    readiness = results.get('readiness_level')
+    if readiness:
+        yield Heading("EXECUTIVE SUMMARY")
+        yield Fields([("Job Readiness Level", f"{readiness['level']} {readiness['icon']}"),
+                      ("Overall Score", f"{results['overall_score']}/100"),
+                      ("Assessment", readiness['description']), ("Next Step", readiness['next_step'])])
+
+    found, missing = results.get('found_skills', []), results.get('missing_skills', [])
+    present = lambda key: '✓ Present' if results.get(key) else '✗ Missing'
+    yield Heading("DETAILED SCORE BREAKDOWN")
+    yield ScoreBar(1, "Technical Skills Match", results.get('skill_match_score', 0),
+                   [f"Skills Found: {len(found)}", f"Skills to Learn: {len(missing)}"])
+    if 'content_quality_score' in results:
+        yield ScoreBar(2, "Content Quality", results['content_quality_score'],
+                       [f"Word Count: {results['word_count']}", f"Contact Info: {present('has_contact_info')}",
+                        f"Education Details: {present('has_education')}"])
+        yield ScoreBar(3, "Project Experience", results['experience_score'],
+                       [f"Projects: {present('has_projects')} (Count: {results['project_count']})",
+                        f"Internships: {present('has_internship')}", f"Achievements: {present('has_achievements')}"])
+        yield ScoreBar(4, "Presentation Quality", results['presentation_score'], [])
+
+    yield Heading("TECHNICAL SKILLS ANALYSIS")
+    yield Heading("Skills You Have:", 2)
+    yield Items([skill.title() for skill in found], "check")
+    yield Heading("Skills to Learn (Priority Order):", 2)
+    yield Items([f"{skill.title()} [{'HIGH' if i <= 3 else 'MEDIUM' if i <= 6 else 'LOW'} PRIORITY]"
+                 for i, skill in enumerate(missing, 1)], "cross")
+    if results.get('ml_extracted_skills') or results.get('ml_predicted_skills'):
+        yield Heading("Additional Skills Detected by ML:", 2)
+        yield Items([skill.title() for skill in results.get('ml_extracted_skills', [])], "check")
+        yield Heading("Skills Commonly Paired With Yours:", 2)
+        yield Items([skill.title() for skill in results.get('ml_predicted_skills', [])], "arrow")
+
+    if results.get('skill_distribution'):
+        yield Heading("SKILL COVERAGE BY CATEGORY")
+        yield Coverage([(category, data['found'], data['total'], data['percentage'])
+                        for category, data in results['skill_distribution'].items()])
+
+    if 'has_contact_info' in results:
+        yield Heading("RESUME CONTENT ASSESSMENT")
+        content_items = [("Contact Information", 'has_contact_info'), ("Education Details", 'has_education'),
+                         ("Project Portfolio", 'has_projects'), ("Internship Experience", 'has_internship'),
+                         ("Achievements & Awards", 'has_achievements'), ("Leadership Roles", 'has_leadership'),
+                         ("Certifications", 'has_certifications')]
+        yield Fields([(item, "✓ PRESENT" if results.get(key) else "✗ MISSING") for item, key in content_items], indent=2, width=30)
+
+    if 'strengths' in results:
+        yield Heading("YOUR STRENGTHS")
+        yield Items(results['strengths'], "number")
+    if 'weaknesses' in results:
+        yield Heading("AREAS FOR IMPROVEMENT")
+        yield Items(results['weaknesses'], "number")
+    if 'recommendations' in results:
+        yield Heading("ACTIONABLE CAREER ROADMAP")
+        yield Entries([(f"[{rec['priority'].upper()} PRIORITY] {rec['text']}",
+                        [("Action Required", rec['action']), ("Timeline", rec['timeline']), ("Expected Impact", rec['impact'])])
+                       for rec in results['recommendations']])
+    if results.get('course_recommendations'):
+        yield Heading("RECOMMENDED COURSES")
+        yield Entries([(course['course'], [("Skill Focus", course['skill']), ("Provider", course['provider']),
+                                           ("Duration", course['duration']), ("Priority", course.get('priority', 'Medium'))])
+                       for course in results['course_recommendations']])
+    if 'career_suggestions' in results:
+        yield Heading("CAREER PATH SUGGESTIONS")
+        yield Entries([(s['role'], [("Match Percentage", s['match']), ("Reason", s['reason'])])
+                       for s in results['career_suggestions']])
+    if 'job_matches' in results:
+        yield Heading("POTENTIAL JOB OPPORTUNITIES")
+        yield Entries([(job['title'], [("Match Score", f"{job['match_percentage']}%"), ("Description", job['description']),
+                                       ("Target Companies", job['companies'])])
+                       for job in results['job_matches']])
+
+    salary = results.get('salary_info')
+    if salary:
+        yield Heading("SALARY EXPECTATIONS (Annual CTC in INR)")
+        yield Fields([("Entry Level (0-2 years)", f"₹{salary['entry_level']:,}"), ("Mid Level (2-5 years)", f"₹{salary['mid_level']:,}"),
+                      ("Senior Level (5+ years)", f"₹{salary['senior_level']:,}")], indent=2, width=24)
+        yield Paragraph("Note: These are estimated ranges based on your skills and target role.\n"
+                        "Actual salaries may vary based on company, location, and negotiation.")
+
+    emerging = results.get('emerging_tech_analysis')
+    if emerging:
+        yield Heading("EMERGING TECHNOLOGIES TO WATCH")
+        yield Heading("Trending Technologies in Your Field:", 3)
+        yield Items([tech.title() for tech in emerging['trending']], "bullet")
+        yield Heading("Recommended Focus Areas:", 3)
+        yield Items([tech.title() for tech in emerging['recommendations']], "arrow")
+        yield Fields([("Growth Outlook", emerging['growth_rate'])])
+
+    forecast = results.get('placement_forecast')
+    if forecast:
+        yield Heading("PLACEMENT FORECAST")
+        yield Fields([("Placement Probability", f"{forecast['probability']}%"), ("Expected Timeframe", f"{forecast['timeframe']} months"),
+                      ("Confidence Level", forecast['confidence'])])
+        yield Heading("Key Contributing Factors:", 3)
+        yield Items(forecast['key_factors'], "bullet")
+
+    yield Heading("30-DAY ACTION PLAN")
+    yield Heading("Week 1-2: Foundation", 3)
+    yield Items(["Update resume with quantifiable achievements", "Optimize LinkedIn profile with projects and skills",
+                 "Set up GitHub portfolio with existing projects"], "dash")
+    yield Heading("Week 3-4: Skill Development", 3)
+    skill_steps = []
+    if missing:
+        skill_steps.append(f"Start learning {missing[0].title()}")
+    if len(missing) > 1:
+        skill_steps.append(f"Begin online course for {missing[1].title()}")
+    yield Items(skill_steps + ["Work on one new project showcasing learned skills"], "dash")
+    yield Heading("Next Steps (Month 2-3):", 3)
+    yield Items(["Complete 2-3 substantial projects", "Apply for internships or entry-level positions",
+                 "Participate in hackathons or coding competitions", "Network with professionals in your target field"], "dash")
+
+    if readiness:
+        yield Heading("CONCLUSION")
+        yield Paragraph(f"Your current job readiness score of {results['overall_score']:.1f}/100 indicates that you are \n"
+                        f"{readiness['level'].lower()} for the job market. By following the recommendations outlined\n"
+                        "in this report, you can systematically improve your profile and increase your chances\n"
+                        "of landing your dream job.")
+        yield Paragraph("Remember: Career development is a journey, not a destination. Stay consistent,\n"
+                        "keep learning, and don't hesitate to seek guidance from mentors and industry professionals.")
+    yield Footer(["Report Generated by Job Bridge - ML-Powered Career Intelligence Platform",
+                  "For questions or support, visit our website or contact your career counselor"])
+
+class TxtWriter:
+    """Plain-text report in the classic 100-column layout"""
+    extension, mime = "txt", "text/plain"
+
+    def __init__(self, out: BinaryIO):
+        self.out = io.TextIOWrapper(out, encoding="utf-8", newline="\n", write_through=True)
+        self._in_section = False
+
+    def lines(self, block) -> Iterator[str]:
+        if isinstance(block, Heading):
+            if block.level == 0:
+                yield from ["=" * WIDTH, block.text.center(WIDTH), block.subtitle.center(WIDTH), "=" * WIDTH, ""]
+                self._in_section = True
+            elif block.level == 1:
+                if self._in_section:
+                    yield from ["-" * WIDTH, ""]
+                yield from [block.text, "=" * WIDTH, ""]
+                self._in_section = True
+            elif block.level == 2:
+                yield from [block.text, "-" * 50]
+            else:
+                yield block.text
+        elif isinstance(block, Paragraph):
+            yield from block.text.split("\n") + [""]
+        elif isinstance(block, Fields):
+            for label, value in block.rows:
+                yield f"{' ' * block.indent}{label:{block.width}s} : {value}" if block.width else f"{' ' * block.indent}{label}: {value}"
+            yield ""
+        elif isinstance(block, ScoreBar):
+            yield f"  {block.number}. {block.label + ':':28s} {block.percent:.1f}%  {bar(block.percent)}"
+            yield from [f"     - {detail}" for detail in block.details] + [""]
+        elif isinstance(block, Coverage):
+            for category, found, total, percent in block.rows:
+                yield f"  {category:25s} : {found:2d}/{total:2d} ({percent:5.1f}%) {bar(percent)}"
+            yield ""
+        elif isinstance(block, Items):
+            markers = {"bullet": "•", "arrow": "→", "dash": "-"}
+            for i, item in enumerate(block.items, 1):
+                if block.style in markers:
+                    yield f"  {markers[block.style]} {item}"
+                elif block.style == "number":
+                    yield f"  {i}. {item}"
+                else:
+                    yield f"  {i:2d}. {'✓' if block.style == 'check' else '✗'} {item}"
+            yield ""
+        elif isinstance(block, Entries):
+            for i, (title, rows) in enumerate(block.entries, 1):
+                yield f"{i}. {title}"
+                yield from [f"   {label}: {value}" for label, value in rows] + [""]
+        elif isinstance(block, Footer):
+            yield "=" * WIDTH
+            yield from [line.center(WIDTH) for line in block.lines]
+            yield "=" * WIDTH
+
+    def write(self, block):
+        self.out.write("".join(line + "\n" for line in self.lines(block)))
+
+    def close(self):
+        self.out.flush()
+        self.out.detach()
+
+class HtmlWriter:
+    """Standalone HTML report (inline styles, no external assets)"""
+    extension, mime = "html", "text/html"
+    STYLE = ("body{font-family:Inter,Arial,sans-serif;max-width:900px;margin:2rem auto;color:#1e293b;line-height:1.5}"
+             "h1{text-align:center;margin-bottom:0}.subtitle{text-align:center;color:#64748b}"
+             "h2{border-bottom:2px solid #3b82f6;padding-bottom:.25rem;margin-top:2rem}"
+             "table{border-collapse:collapse}td{padding:.2rem .75rem .2rem 0}"
+             ".bar{background:#e2e8f0;border-radius:4px;height:10px;width:300px;display:inline-block}"
+             ".bar span{display:block;height:100%;background:#3b82f6;border-radius:4px}"
+             "footer{margin-top:2rem;text-align:center;color:#64748b;font-size:.9rem}")
+
+    def __init__(self, out: BinaryIO):
+        self.out = io.TextIOWrapper(out, encoding="utf-8", newline="\n", write_through=True)
+
+    def write(self, block):
+        e = lambda text: html.escape(str(text))
+        bar_html = lambda percent: f'<span class="bar"><span style="width:{min(max(percent, 0), 100):.0f}%"></span></span>'
+        if isinstance(block, Heading):
+            if block.level == 0:
+                parts = [f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{e(block.text)}</title>'
+                         f'<style>{self.STYLE}</style></head><body><h1>{e(block.text)}</h1><p class="subtitle">{e(block.subtitle)}</p>']
+            else:
+                tag = f"h{min(block.level + 1, 4)}"
+                parts = [f"<{tag}>{e(block.text)}</{tag}>"]
+        elif isinstance(block, Paragraph):
+            parts = [f"<p>{'<br>'.join(e(line) for line in block.text.split(chr(10)))}</p>"]
+        elif isinstance(block, Fields):
+            parts = ["<table>"] + [f"<tr><td><strong>{e(label)}</strong></td><td>{e(value)}</td></tr>" for label, value in block.rows] + ["</table>"]
+        elif isinstance(block, ScoreBar):
+            parts = [f"<p><strong>{block.number}. {e(block.label)}</strong> {block.percent:.1f}% {bar_html(block.percent)}</p>"]
+            if block.details:
+                parts += ["<ul>"] + [f"<li>{e(detail)}</li>" for detail in block.details] + ["</ul>"]
+        elif isinstance(block, Coverage):
+            parts = ["<table>"] + [f"<tr><td>{e(category)}</td><td>{found}/{total}</td><td>{percent:.1f}%</td><td>{bar_html(percent)}</td></tr>"
+                                   for category, found, total, percent in block.rows] + ["</table>"]
+        elif isinstance(block, Items):
+            tag = "ol" if block.style in ("number", "check", "cross") else "ul"
+            mark = {"check": "✓ ", "cross": "✗ "}.get(block.style, "")
+            parts = [f"<{tag}>"] + [f"<li>{mark}{e(item)}</li>" for item in block.items] + [f"</{tag}>"]
+        elif isinstance(block, Entries):
+            parts = ["<ol>"] + [f"<li><strong>{e(title)}</strong><ul>" + "".join(f"<li>{e(label)}: {e(value)}</li>" for label, value in rows) + "</ul></li>"
+                                for title, rows in block.entries] + ["</ol>"]
+        elif isinstance(block, Footer):
+            parts = ["<footer>" + "<br>".join(e(line) for line in block.lines) + "</footer>"]
+        else:
+            parts = []
+        self.out.write("\n".join(parts) + "\n")
+
+    def close(self):
+        self.out.write("</body></html>\n")
+        self.out.flush()
+        self.out.detach()
+
+class JsonWriter:
+    """The IR itself as JSON, one block per line inside a ``blocks`` array"""
+    extension, mime = "json", "application/json"
+
+    def __init__(self, out: BinaryIO):
+        self.out = io.TextIOWrapper(out, encoding="utf-8", newline="\n", write_through=True)
+        self.out.write('{"format": "job-bridge-report", "version": 1, "blocks": [\n')
+        self._first = True
+
+    def write(self, block):
+        record = {"type": type(block).__name__.lower(), **block._asdict()}
+        self.out.write(("" if self._first else ",\n") + json.dumps(record, ensure_ascii=False))
+        self._first = False
+
+    def close(self):
+        self.out.write("\n]}\n")
+        self.out.flush()
+        self.out.detach()
+
+class PdfWriter:
+    """Minimal PDF (built-in Courier fonts, the TXT layout), written page by page with no PDF library"""
+    extension, mime = "pdf", "application/pdf"
+    PAGE_WIDTH, PAGE_HEIGHT, MARGIN, FONT_SIZE, LEADING = 595, 842, 40, 8, 10
+    # Characters outside WinAnsi that the report uses
+    SUBSTITUTES = {"₹": "Rs.", "✓": "+", "✗": "x", "█": "#", "→": "->"}
+
+    def __init__(self, out: BinaryIO):
+        self.out = out
+        self.offset = 0
+        self.offsets: Dict[int, int] = {}
+        self.pages: List[int] = []
+        self.next_id = 5  # 1 catalog, 2 pages, 3-4 fonts
+        self.lines_per_page = (self.PAGE_HEIGHT - 2 * self.MARGIN) // self.LEADING
+        self._page: List[Tuple[bool, str]] = []
+        self._text = TxtWriter.__new__(TxtWriter)
+        self._text._in_section = False
+        self._emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        for obj_id, font in ((3, "Courier"), (4, "Courier-Bold")):
+            self._object(obj_id, f"<< /Type /Font /Subtype /Type1 /BaseFont /{font} /Encoding /WinAnsiEncoding >>".encode())
+
+    def _emit(self, data: bytes):
+        self.out.write(data)
+        self.offset += len(data)
+
+    def _object(self, obj_id: int, body: bytes):
+        self.offsets[obj_id] = self.offset
+        self._emit(f"{obj_id} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    def _encode(self, text: str) -> bytes:
+        for char, substitute in self.SUBSTITUTES.items():
+            text = text.replace(char, substitute)
+        return re.sub(rb"([\\()])", rb"\\\1", text.encode("cp1252", errors="ignore"))
+
+    def _flush_page(self):
+        if not self._page:
+            return
+        top = self.PAGE_HEIGHT - self.MARGIN
+        content = [f"BT {self.LEADING} TL {self.MARGIN} {top} Td".encode()]
+        for bold, line in self._page:
+            content.append(f"/F{2 if bold else 1} {self.FONT_SIZE} Tf (".encode() + self._encode(line) + b") Tj T*")
+        content.append(b"ET")
+        stream = b"\n".join(content)
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self._object(content_id, f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+        self._object(page_id, (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.PAGE_WIDTH} {self.PAGE_HEIGHT}] "
+                               f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {content_id} 0 R >>").encode())
+        self.pages.append(page_id)
+        self._page = []
+
+    def write(self, block):
+        bold = isinstance(block, (Heading, Footer))
+        for line in TxtWriter.lines(self._text, block):
+            self._page.append((bold, line))
+            if len(self._page) >= self.lines_per_page:
+                self._flush_page()
+
+    def close(self):
+        self._flush_page()
+        kids = " ".join(f"{page} 0 R" for page in self.pages)
+        self._object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.pages)} >>".encode())
+        self._object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        xref_offset = self.offset
+        entries = [b"0000000000 65535 f \n"] + [f"{self.offsets[i]:010d} 00000 n \n".encode() for i in range(1, self.next_id)]
+        self._emit(f"xref\n0 {self.next_id}\n".encode() + b"".join(entries))
+        self._emit(f"trailer\n<< /Size {self.next_id} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        self.out.flush()
+
+REPORT_WRITERS = {writer.extension: writer for writer in (TxtWriter, HtmlWriter, JsonWriter, PdfWriter)}
+
+def write_report(results: Dict, target_role: str, fmt: str, out: BinaryIO, generated_at: Optional[datetime] = None):
+    """Stream one report to a binary file-like object"""
+    writer = REPORT_WRITERS[fmt](out)
+    for block in report_blocks(results, target_role, generated_at):
+        writer.write(block)
+    writer.close()
+
+def render_report(results: Dict, target_role: str, fmt: str = "txt") -> bytes:
+    buffer = io.BytesIO()
+    write_report(results, target_role, fmt, buffer)
+    return buffer.getvalue()
+
+class ReportHandle:
+    """A report being rendered in the background"""
+    def __init__(self, future: Future, fmt: str, filename: str):
+        self.future = future
+        self.format = fmt
+        self.filename = filename
+        self.mime = REPORT_WRITERS[fmt].mime
+
+    @property
+    def ready(self) -> bool:
+        return self.future.done()
+
+    def data(self, timeout: Optional[float] = None) -> bytes:
+        return self.future.result(timeout)
+
+class ReportQueue:
+    """Renders reports on worker threads so the request thread only keeps a handle"""
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="report")
+
+    def submit(self, results: Dict, target_role: str, fmt: str = "txt", stem: Optional[str] = None) -> ReportHandle:
+        stem = stem or f"Job_Bridge_Analysis_{target_role.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        future = self._executor.submit(render_report, results, target_role, fmt)
+        return ReportHandle(future, fmt, f"{stem}.{REPORT_WRITERS[fmt].extension}")
+
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_report_queue() -> ReportQueue:
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ReportQueue()
+    return _queue
+
+def safe_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("_") or "student"
+
+def write_cohort_zip(records: Iterable[Dict], out: BinaryIO, formats: Tuple[str, ...] = ("txt",),
+                     default_role: str = "Software Engineer") -> int:
+    """Stream a zip with one report per student (and format); only one report is in flight at a time.
+
+    Records are analysis results with ``student_id`` and ``target_role``, such as
+    worker_pool output; ``out`` may be unseekable (e.g. an HTTP response).
+    """
+    count = 0
+    used = set()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        for i, record in enumerate(records):
+            base = student_id = safe_name(str(record.get('student_id', f"student_{i}")))
+            # Ids that sanitize alike ("a b" / "a/b") get _2, _3, ...; compared case-insensitively
+            # so the archive also extracts cleanly on case-insensitive filesystems
+            suffix = 1
+            while student_id.lower() in used:
+                suffix += 1
+                student_id = f"{base}_{suffix}"
+            used.add(student_id.lower())
+            role = record.get('target_role') or default_role
+            for fmt in formats:
+                with archive.open(f"{student_id}.{REPORT_WRITERS[fmt].extension}", "w") as member:
+                    write_report(record, role, fmt, member)
+            count += 1
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a zip of per-student reports from analysis results (JSONL)")
+    parser.add_argument("input", help="JSONL of analysis records, e.g. worker_pool.py output")
+    parser.add_argument("--out", default="reports.zip", help="Zip path, or - for stdout")
+    parser.add_argument("--formats", nargs="+", default=["txt"], choices=sorted(REPORT_WRITERS))
+    args = parser.parse_args()
+
+    def read_records(path: str) -> Iterator[Dict]:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    if args.out == "-":
+        count = write_cohort_zip(read_records(args.input), sys.stdout.buffer, tuple(args.formats))
+    else:
+        with open(args.out, "wb") as out:
+            count = write_cohort_zip(read_records(args.input), out, tuple(args.formats))
+    logger.info(f"Wrote {count} student reports ({', '.join(args.formats)}) to {args.out}")
@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "Models")
+SPILL_DIR = os.path.join(MODELS_DIR, "result_store")
+
+SCORE_FIELDS = ("overall_score", "skill_match_score", "content_quality_score", "experience_score", "presentation_score")
+FLAG_FIELDS = ("has_contact_info", "has_education", "has_projects", "has_internship",
+               "has_achievements", "has_leadership", "has_certifications")
+SKILL_FIELDS = ("found_skills", "missing_skills", "ml_extracted_skills", "ml_predicted_skills")
+COUNT_FIELDS = ("word_count", "project_count")
+# Fixed per-record overhead (object, slots, tuples) added to the payload sizes
+RECORD_OVERHEAD = 400
+
+def json_default(value):
+    # numpy scalars and arrays from the ML path
+    return value.tolist() if hasattr(value, "tolist") else str(value)
+
+@dataclass(slots=True, frozen=True)
+class StoredResult:
+    """One analysis in compact form.
+
+    Scores, counts and content flags are plain fields (flags packed into one
+    int); skill names are interned tuples shared across students; the
+    nested, display-only sections (recommendations, courses, forecast, ...)
+    are kept as one zlib-compressed JSON blob.
+    """
+    target_role: str
+    scores: Tuple[Optional[float], ...]
+    counts: Tuple[Optional[int], ...]
+    flags: int
+    flag_mask: int
+    skills: Tuple[Optional[Tuple[str, ...]], ...]
+    extra: bytes
+
+    @classmethod
+    def from_results(cls, results: Dict, target_role: str) -> "StoredResult":
+        flags = flag_mask = 0
+        for bit, name in enumerate(FLAG_FIELDS):
+            if name in results:
+                flag_mask |= 1 << bit
+                flags |= bool(results[name]) << bit
+        known = set(SCORE_FIELDS + COUNT_FIELDS + FLAG_FIELDS + SKILL_FIELDS)
+        extra = {key: value for key, value in results.items() if key not in known}
+        return cls(
+            target_role=sys.intern(target_role),
+            scores=tuple(results.get(name) for name in SCORE_FIELDS),
+            counts=tuple(results.get(name) for name in COUNT_FIELDS),
+            flags=flags,
+            flag_mask=flag_mask,
+            skills=tuple(tuple(sys.intern(str(skill)) for skill in results[name]) if name in results else None
+                         for name in SKILL_FIELDS),
+            extra=zlib.compress(json.dumps(extra, separators=(",", ":"), default=json_default).encode()),
+        )
+
+    def to_results(self) -> Dict:
+        results = json.loads(zlib.decompress(self.extra))
+        for name, value in zip(SCORE_FIELDS + COUNT_FIELDS, self.scores + self.counts):
+            if value is not None:
+                results[name] = value
+        for bit, name in enumerate(FLAG_FIELDS):
+            if self.flag_mask >> bit & 1:
+                results[name] = bool(self.flags >> bit & 1)
+        for name, skills in zip(SKILL_FIELDS, self.skills):
+            if skills is not None:
+                results[name] = list(skills)
+        return results
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by this record (interned strings counted as if not shared)"""
+        return RECORD_OVERHEAD + len(self.extra) + sum(len(skill) + 8 for skills in self.skills if skills for skill in skills)
+
+    def to_bytes(self) -> bytes:
+        return zlib.compress(json.dumps({"target_role": self.target_role, "results": self.to_results()},
+                                        separators=(",", ":"), default=json_default).encode())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "StoredResult":
+        payload = json.loads(zlib.decompress(data))
+        return cls.from_results(payload["results"], payload["target_role"])
+
+class ResultStore:
+    """Server-side analysis results shared by every session.
+
+    Sessions keep only the opaque handle returned by ``put``. Records live in
+    a byte-bounded LRU; the least recently used ones are spilled to disk and
+    read back (and promoted) on the next ``get``, so reruns never recompute.
+    The spill directory is pruned oldest-first beyond ``max_spilled`` files.
+    """
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, spill_dir: str = SPILL_DIR, max_spilled: int = 50_000):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_spilled = max_spilled
+        self.nbytes = 0
+        self._records: "OrderedDict[str, StoredResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _spill_path(self, handle: str) -> str:
+        return os.path.join(self.spill_dir, f"{handle}.json.z")
+
+    def _spill(self, handle: str, record: StoredResult):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = self._spill_path(handle)
+        with open(path + ".tmp", "wb") as f:
+            f.write(record.to_bytes())
+        os.replace(path + ".tmp", path)
+
+    def _prune_spilled(self):
+        entries = [entry for entry in os.scandir(self.spill_dir) if entry.name.endswith(".json.z")]
+        if len(entries) > self.max_spilled:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - self.max_spilled]:
+                os.remove(entry.path)
+
+    def _insert(self, handle: str, record: StoredResult):
+        # Caller holds the lock
+        previous = self._records.pop(handle, None)
+        if previous is not None:
+            self.nbytes -= previous.nbytes
+        self._records[handle] = record
+        self.nbytes += record.nbytes
+        spilled = False
+        while self.nbytes > self.max_bytes and len(self._records) > 1:
+            old_handle, old_record = self._records.popitem(last=False)
+            self.nbytes -= old_record.nbytes
+            self._spill(old_handle, old_record)
+            spilled = True
+        if spilled:
+            self._prune_spilled()
+
+    def put(self, handle: str, results: Dict, target_role: str) -> str:
+        record = StoredResult.from_results(results, target_role)
+        with self._lock:
+            self._insert(handle, record)
+        return handle
+
+    def get(self, handle: Optional[str]) -> Optional[Tuple[Dict, str]]:
+        """(results, target_role) for a handle, or None once it has expired from memory and disk"""
+        if handle is None:
+            return None
+        with self._lock:
+            record = self._records.get(handle)
+            if record is not None:
+                self._records.move_to_end(handle)
+            else:
+                try:
+                    with open(self._spill_path(handle), "rb") as f:
+                        record = StoredResult.from_bytes(f.read())
+                except FileNotFoundError:
+                    return None
+                self._insert(handle, record)
+        return record.to_results(), record.target_role
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"records": len(self._records), "bytes": self.nbytes, "max_bytes": self.max_bytes}
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_result_store() -> ResultStore:
+    """Process-wide store; RESULT_STORE_MB caps its memory (default 64)"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ResultStore(max_bytes=int(float(os.environ.get("RESULT_STORE_MB", 64)) * 1024 * 1024))
+    return _store
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from artifact_bundle import MODELS_DIR
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEDUP_DIR = os.path.join(MODELS_DIR, "dedup")
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+WORD_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+def normalize(text: str) -> List[str]:
+    """Lowercase word tokens, so layout, punctuation and spacing differences do not matter"""
+    return WORD_PATTERN.findall(str(text).lower())
+
+def content_id(text: str) -> str:
+    return hashlib.sha1(" ".join(normalize(text)).encode()).hexdigest()[:16]
+
+def shingle_hashes(text: str, size: int = 5) -> np.ndarray:
+    """32-bit hashes of the distinct word ``size``-grams of a resume"""
+    words = normalize(text)
+    grams = {" ".join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))} if words else set()
+    return np.fromiter((zlib.crc32(g.encode()) for g in grams), dtype=np.uint64, count=len(grams))
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """(bands, rows) minimizing false positive plus false negative area around ``threshold``"""
+    similarities = np.linspace(0, 1, 201)
+    below = similarities < threshold
+    best, best_error = (1, num_perm), float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        candidate = 1 - (1 - similarities ** rows) ** bands
+        error = candidate[below].sum() + (1 - candidate[~below]).sum()
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+class MinHasher:
+    """MinHash signatures from universal hashes ``(a * x + b) mod p`` over shingle hashes"""
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        # a, b < 2**31 and x < 2**32 keep a * x + b inside uint64
+        self.a = rng.randint(1, 1 << 31, num_perm).astype(np.uint64)
+        self.b = rng.randint(0, 1 << 31, num_perm).astype(np.uint64)
+        self.num_perm = num_perm
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        if not len(hashes):
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        return ((np.outer(hashes, self.a) + self.b) % MERSENNE_PRIME & MAX_HASH).min(axis=0)
+
+class DedupMatch(NamedTuple):
+    doc_id: str
+    cluster: str
+    similarity: float
+
+class DedupIndex:
+    """Persistent MinHash LSH index that clusters near-duplicate resumes.
+
+    Signatures are split into bands; resumes sharing any band bucket are
+    candidates, and a candidate joins the cluster of its most similar indexed
+    resume when the estimated Jaccard similarity reaches ``threshold``. Each
+    cluster can hold a cached analysis per (target role, variant), so later
+    copies, in this run or a future one, skip the model pipeline.
+    """
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self.doc_ids: List[str] = []
+        self.clusters: List[str] = []
+        self.signatures: List[np.ndarray] = []
+        self.results: Dict[str, Dict] = {}
+        self._row_of: Dict[str, int] = {}
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _insert(self, doc_id: str, cluster: str, signature: np.ndarray):
+        row = len(self.doc_ids)
+        self.doc_ids.append(doc_id)
+        self.clusters.append(cluster)
+        self.signatures.append(signature)
+        self._row_of[doc_id] = row
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(row)
+
+    def query(self, signature: np.ndarray) -> List[Tuple[int, float]]:
+        """Indexed rows at or above the threshold, most similar first"""
+        candidates = {row for band, key in self._band_keys(signature) for row in self._buckets[band].get(key, ())}
+        scored = [(row, float(np.mean(self.signatures[row] == signature))) for row in candidates]
+        return sorted([(row, s) for row, s in scored if s >= self.threshold], key=lambda item: -item[1])
+
+    def add(self, text: str) -> DedupMatch:
+        """Index a resume and return the cluster it belongs to"""
+        doc_id = content_id(text)
+        if doc_id in self._row_of:
+            return DedupMatch(doc_id, self.clusters[self._row_of[doc_id]], 1.0)
+        signature = self.hasher.signature(shingle_hashes(text, self.shingle_size))
+        matches = self.query(signature)
+        cluster, similarity = (self.clusters[matches[0][0]], matches[0][1]) if matches else (doc_id, 1.0)
+        self._insert(doc_id, cluster, signature)
+        return DedupMatch(doc_id, cluster, similarity)
+
+    @staticmethod
+    def _result_key(cluster: str, role: str, variant: str) -> str:
+        return f"{cluster}|{role}|{variant}"
+
+    def cached(self, cluster: str, role: str, variant: str = "") -> Optional[Dict]:
+        return self.results.get(self._result_key(cluster, role, variant))
+
+    def store(self, cluster: str, role: str, record: Dict, variant: str = ""):
+        self.results[self._result_key(cluster, role, variant)] = record
+
+    def save(self, directory: str = DEDUP_DIR):
+        os.makedirs(directory, exist_ok=True)
+        signatures = np.vstack(self.signatures) if self.signatures else np.empty((0, self.hasher.num_perm), dtype=np.uint64)
+        np.save(os.path.join(directory, "signatures.tmp.npy"), signatures)
+        meta = {
+            "num_perm": self.hasher.num_perm, "shingle_size": self.shingle_size, "seed": self.seed,
+            "doc_ids": self.doc_ids, "clusters": self.clusters, "results": self.results,
+        }
+        with open(os.path.join(directory, "index.json.tmp"), "w") as f:
+            json.dump(meta, f)
+        os.replace(os.path.join(directory, "signatures.tmp.npy"), os.path.join(directory, "signatures.npy"))
+        os.replace(os.path.join(directory, "index.json.tmp"), os.path.join(directory, "index.json"))
+
+    @classmethod
+    def load(cls, directory: str = DEDUP_DIR, threshold: float = 0.8, **kwargs) -> "DedupIndex":
+        """Load a saved index (LSH buckets are rebuilt for ``threshold``); a fresh index when none exists"""
+        meta_path = os.path.join(directory, "index.json")
+        if not os.path.exists(meta_path):
+            return cls(threshold, **kwargs)
+        with open(meta_path) as f:
+            meta = json.load(f)
+        params = {"num_perm": meta["num_perm"], "shingle_size": meta["shingle_size"], "seed": meta["seed"]}
+        if any(kwargs.get(k, v) != v for k, v in params.items()):
+            logger.warning(f"Dedup index in {directory} was built with {params}; starting a fresh index")
+            return cls(threshold, **kwargs)
+        index = cls(threshold, **params)
+        signatures = np.load(os.path.join(directory, "signatures.npy"))
+        for doc_id, cluster, signature in zip(meta["doc_ids"], meta["clusters"], signatures):
+            index._insert(doc_id, cluster, signature)
+        index.results = meta["results"]
+        return index
+
+def dedup_analyze(tasks: Iterable[Tuple[str, str, str]], analyze: Callable[[List[Tuple[str, str, str]]], Iterable[Dict]],
+                  index: DedupIndex, refresh: Optional[Callable[[Tuple[str, str, str]], Dict]] = None,
+                  variant: str = "") -> Iterator[Dict]:
+    """Run ``analyze`` on one resume per near-duplicate cluster and reuse its result for the rest.
+
+    Tasks are ``(student_id, resume_text, target_role)``. A reused record keeps
+    the representative's model outputs, takes the cheap per-resume fields from
+    ``refresh`` and notes ``duplicate_of``, ``similarity`` and the found-skill
+    diff against the representative.
+    """
+    def reuse(task, match: DedupMatch, cached: Dict) -> Dict:
+        record = dict(cached, student_id=task[0])
+        if refresh is not None:
+            record.update(refresh(task))
+        found, base = set(record.get('found_skills', [])), set(cached.get('found_skills', []))
+        record.update(duplicate_of=cached['student_id'], similarity=round(match.similarity, 3), dedup_cluster=match.cluster,
+                      skill_diff={'added': sorted(found - base), 'removed': sorted(base - found)})
+        return record
+
+    # Clusters are assigned up front so every copy in this run waits on a single analysis
+    # A student may submit several versions, so submitted tasks carry a per-submission id
+    # (analyze yields in completion order) that is mapped back to the student and cluster
+    fresh: List[Tuple[str, str, str]] = []
+    owners: Dict[str, Tuple[str, str, str]] = {}
+    waiting: Dict[Tuple[str, str], List[Tuple[Tuple[str, str, str], DedupMatch]]] = {}
+    for task in tasks:
+        match = index.add(task[1])
+        key = (match.cluster, task[2])
+        cached = index.cached(match.cluster, task[2], variant)
+        if cached is not None:
+            yield reuse(task, match, cached)
+        elif key in waiting:
+            waiting[key].append((task, match))
+        else:
+            waiting[key] = []
+            submission = f"dedup-{len(fresh)}"
+            owners[submission] = (task[0], match.cluster, task[2])
+            fresh.append((submission, task[1], task[2]))
+    logger.info(f"Dedup: analyzing {len(fresh)} resumes, reusing results for the rest ({len(index)} indexed)")
+    for record in analyze(fresh):
+        student_id, cluster, role = owners.pop(record['student_id'])
+        record['student_id'] = student_id
+        record['dedup_cluster'] = cluster
+        index.store(cluster, role, record, variant)
+        yield record
+        for task, match in waiting.pop((cluster, role)):
+            yield reuse(task, match, record)
+
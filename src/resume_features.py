@@ -0,0 +1,110 @@
+import re
+from collections import Counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Substring keywords behind each boolean flag in analyze_resume_content
+FLAG_KEYWORDS = {
+    'has_contact_info': ['email', 'phone', '@', '.com', 'linkedin', 'github'],
+    'has_education': ['education', 'university', 'college', 'degree', 'bachelor', 'master', 'cgpa', 'gpa', 'b.tech', 'm.tech'],
+    'has_projects': ['project', 'github', 'repository', 'built', 'developed', 'created', 'implemented'],
+    'has_internship': ['intern', 'training', 'apprentice', 'work experience', 'summer training'],
+    'has_achievements': ['achievement', 'award', 'winner', 'certificate', 'hackathon', 'competition', 'recognition'],
+    'has_leadership': ['lead', 'president', 'head', 'coordinator', 'captain', 'volunteer', 'organizer'],
+    'has_certifications': ['certification', 'certified', 'certificate', 'course completion'],
+}
+
+# Keywords whose occurrences are summed into a count
+COUNT_KEYWORDS = {
+    'project_count': ['project', 'github.com', 'developed', 'built'],
+}
+
+# Heading lines (case-insensitive, optional trailing colon) that open a section
+SECTION_HEADINGS = {
+    'summary': ['summary', 'objective', 'profile', 'about me', 'career objective'],
+    'contact': ['contact', 'contact information', 'personal details'],
+    'education': ['education', 'academic background', 'academics', 'qualifications'],
+    'skills': ['skills', 'technical skills', 'core skills', 'key skills'],
+    'projects': ['projects', 'academic projects', 'personal projects', 'project experience'],
+    'experience': ['experience', 'work experience', 'internships', 'internship', 'professional experience', 'training'],
+    'certifications': ['certifications', 'certificates', 'courses', 'certifications & courses'],
+    'achievements': ['achievements', 'awards', 'honors', 'accomplishments'],
+    'leadership': ['leadership', 'extracurricular activities', 'activities', 'positions of responsibility', 'volunteering'],
+}
+
+class ResumeFeatures(NamedTuple):
+    flags: Dict[str, bool]
+    counts: Dict[str, int]
+    sections: Dict[str, List[Tuple[int, int]]]
+    word_count: int
+    text: str
+
+    def section_text(self, name: str) -> str:
+        """Concatenated text of every span of a section ('' when absent)"""
+        return "\n".join(self.text[start:end] for start, end in self.sections.get(name, []))
+
+class ResumeFeatureExtractor:
+    """Every keyword flag, count and section span from one regex pass over the resume.
+
+    Keywords are matched inside a lookahead, so overlapping occurrences are all
+    seen (matching the substring semantics of ``keyword in text``); a match also
+    credits any shorter keyword that is its prefix. Heading lines are recognized
+    in the same pass and split the text into section spans.
+    """
+    def __init__(self, flag_keywords: Dict[str, List[str]] = FLAG_KEYWORDS,
+                 count_keywords: Dict[str, List[str]] = COUNT_KEYWORDS,
+                 section_headings: Dict[str, List[str]] = SECTION_HEADINGS):
+        self.flag_names = list(flag_keywords)
+        self.count_names = list(count_keywords)
+        keyword_flags: Dict[str, set] = {}
+        keyword_counts: Dict[str, set] = {}
+        for name, keywords in flag_keywords.items():
+            for keyword in keywords:
+                keyword_flags.setdefault(keyword, set()).add(name)
+        for name, keywords in count_keywords.items():
+            for keyword in keywords:
+                keyword_counts.setdefault(keyword, set()).add(name)
+        keywords = sorted(set(keyword_flags) | set(keyword_counts), key=len, reverse=True)
+        # A match at a position implies every keyword that is a prefix of it
+        self._implied = {k: [p for p in keywords if k.startswith(p)] for k in keywords}
+        self._keyword_flags = keyword_flags
+        self._keyword_counts = keyword_counts
+        self._heading_section = {h: name for name, headings in section_headings.items() for h in headings}
+        keyword_alternation = "|".join(re.escape(k) for k in keywords)
+        heading_alternation = "|".join(re.escape(h) for h in sorted(self._heading_section, key=len, reverse=True))
+        self._keyword_at = re.compile(f"(?=(?P<kw>{keyword_alternation}))")
+        self._pattern = re.compile(
+            rf"(?=^[ \t]*(?P<heading>{heading_alternation})[ \t]*:?[ \t]*$)|(?=(?P<kw>{keyword_alternation}))",
+            re.MULTILINE)
+
+    def extract(self, text: str) -> ResumeFeatures:
+        text_lower = text.lower()
+        flags = dict.fromkeys(self.flag_names, False)
+        counts = dict.fromkeys(self.count_names, 0)
+        hits: Counter = Counter()
+        sections: Dict[str, List[Tuple[int, int]]] = {}
+        current, current_start = None, 0
+        for match in self._pattern.finditer(text_lower):
+            keyword = match.group('kw')
+            if match.group('heading') is not None:
+                if current is not None:
+                    sections.setdefault(current, []).append((current_start, match.start()))
+                current, current_start = self._heading_section[match.group('heading')], match.start()
+                # The heading alternative wins at this position; pick up a keyword starting here too
+                keyword_match = self._keyword_at.match(text_lower, match.start())
+                keyword = keyword_match.group('kw') if keyword_match else None
+            if keyword is not None:
+                for implied in self._implied[keyword]:
+                    hits[implied] += 1
+        if current is not None:
+            sections.setdefault(current, []).append((current_start, len(text)))
+        for keyword, n in hits.items():
+            for name in self._keyword_flags.get(keyword, ()):
+                flags[name] = True
+            for name in self._keyword_counts.get(keyword, ()):
+                counts[name] += n
+        return ResumeFeatures(flags, counts, sections, len(text.split()), text)
+
+RESUME_FEATURES = ResumeFeatureExtractor()
+
+def extract_resume_features(text: str, extractor: Optional[ResumeFeatureExtractor] = None) -> ResumeFeatures:
+    return (extractor or RESUME_FEATURES).extract(text)
@@ -0,0 +1,95 @@
+import json
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+ROLE_REQUIREMENTS_PATH = os.path.join(DATA_DIR, "role_requirements.json")
+DEFAULT_ROLE = "Software Engineer"
+
+_SEPARATORS = re.compile(r"[ \-./]")
+
+def squash(text: str) -> str:
+    """Lowercase and drop spaces, hyphens, dots and slashes so 'Node.js', 'nodejs' and 'node js' compare equal"""
+    return _SEPARATORS.sub("", text.lower())
+
+class RoleMatch(NamedTuple):
+    found: np.ndarray
+    found_skills: List[str]
+    missing_skills: List[str]
+    distribution: Dict[str, Dict]
+
+class CompiledRole:
+    """One role's requirements flattened into skill arrays and per-skill category bitmasks"""
+    def __init__(self, name: str, requirements: Dict[str, List[str]]):
+        self.name = name
+        self.requirements = requirements
+        self.categories = [c for c, skills in requirements.items() if isinstance(skills, list)]
+        if len(self.categories) > 64:
+            raise ValueError(f"Role {name} has {len(self.categories)} categories; at most 64 fit in a bitmask")
+        index: Dict[str, int] = {}
+        for category in self.categories:
+            for skill in requirements[category]:
+                index.setdefault(skill, len(index))
+        self.skills = list(index)
+        self.skill_index = index
+        self.category_masks = np.zeros(len(self.skills), dtype=np.uint64)
+        for bit, category in enumerate(self.categories):
+            for skill in requirements[category]:
+                self.category_masks[index[skill]] |= np.uint64(1 << bit)
+        shifts = np.arange(len(self.categories), dtype=np.uint64)
+        self.membership = ((self.category_masks[:, None] >> shifts) & np.uint64(1)).astype(bool)
+        self.category_totals = self.membership.sum(axis=0)
+        self.keys = [squash(skill) for skill in self.skills]
+        self.labels = [category.replace('_', ' ').title() for category in self.categories]
+
+    def match_text(self, text: str) -> RoleMatch:
+        """Find required skills in resume text (separator-insensitive substring match)"""
+        squashed = squash(text)
+        found = np.fromiter((key in squashed for key in self.keys), dtype=bool, count=len(self.keys))
+        return self._result(found)
+
+    def match_skills(self, skills) -> RoleMatch:
+        """Score an already-extracted skill collection against this role"""
+        skills = set(skills)
+        found = np.fromiter((skill in skills for skill in self.skills), dtype=bool, count=len(self.skills))
+        return self._result(found)
+
+    def _result(self, found: np.ndarray) -> RoleMatch:
+        category_found = found.astype(np.int32) @ self.membership.astype(np.int32)
+        distribution = {
+            label: {
+                'found': int(n_found),
+                'total': int(total),
+                'percentage': round((n_found / total) * 100, 1) if total > 0 else 0
+            }
+            for label, n_found, total in zip(self.labels, category_found, self.category_totals)
+        }
+        return RoleMatch(
+            found=found,
+            found_skills=[s for s, hit in zip(self.skills, found) if hit],
+            missing_skills=[s for s, hit in zip(self.skills, found) if not hit],
+            distribution=distribution
+        )
+
+class RoleModel:
+    """All roles from role_requirements.json, compiled once"""
+    def __init__(self, requirements: Dict[str, Dict[str, List[str]]], default_role: str = DEFAULT_ROLE):
+        self.requirements = requirements
+        self.roles = {name: CompiledRole(name, data) for name, data in requirements.items()}
+        self.default_role = default_role if default_role in self.roles else next(iter(self.roles))
+
+    @classmethod
+    def from_file(cls, path: str = ROLE_REQUIREMENTS_PATH) -> "RoleModel":
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def get(self, role: Optional[str]) -> CompiledRole:
+        return self.roles.get(role) or self.roles[self.default_role]
+
+    def role_names(self) -> List[str]:
+        return list(self.roles)
+
+ROLE_MODEL = RoleModel.from_file()
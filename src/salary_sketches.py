@@ -0,0 +1,213 @@
+import argparse
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "Models")
+SKETCHES_PATH = os.path.join(MODELS_DIR, "salary_sketches.json")
+
+# Experience bands used by the salary views: entry (0-2 years), mid (2-5 years), senior (5+ years)
+BANDS = ("entry", "mid", "senior")
+ANY = "*"
+
+def experience_band(years: float) -> str:
+    return "entry" if years < 2 else "mid" if years < 5 else "senior"
+
+class KLLSketch:
+    """Mergeable KLL quantile sketch.
+
+    Level ``h`` holds items of weight ``2**h``; when the sketch is over capacity
+    a full level is sorted and every other item (random offset) is promoted,
+    so memory stays O(k) however many values are added. Two sketches merge by
+    concatenating their levels and compacting.
+    """
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+        self._cdf: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _size(self) -> int:
+        return sum(len(items) for items in self.levels)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        while self._size() >= self._max_size():
+            for h in range(len(self.levels)):
+                if len(self.levels[h]) >= self._capacity(h):
+                    if h + 1 == len(self.levels):
+                        self.levels.append(np.empty(0))
+                    items = np.sort(self.levels[h])
+                    # An odd item out stays at this level
+                    leftover, items = items[:len(items) % 2], items[len(items) % 2:]
+                    self.levels[h + 1] = np.concatenate([self.levels[h + 1], items[self._rng.integers(2)::2]])
+                    self.levels[h] = leftover
+                    if self._size() < self._max_size():
+                        break
+        self._cdf = None
+
+    def update(self, values: Sequence[float]) -> "KLLSketch":
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        for start in range(0, len(values), self.k):
+            chunk = values[start:start + self.k]
+            self.levels[0] = np.concatenate([self.levels[0], chunk])
+            self.n += len(chunk)
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, items in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (rank error about 1.7/k); None for an empty sketch"""
+        if self._cdf is None:
+            values = np.concatenate(self.levels)
+            weights = np.concatenate([np.full(len(items), 2.0 ** h) for h, items in enumerate(self.levels)])
+            order = np.argsort(values, kind="stable")
+            self._cdf = (values[order], np.cumsum(weights[order]))
+        values, cumulative = self._cdf
+        if not len(values):
+            return None
+        return float(values[min(np.searchsorted(cumulative, q * cumulative[-1]), len(values) - 1)])
+
+    def to_dict(self) -> Dict:
+        return {"k": self.k, "n": self.n, "levels": [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "KLLSketch":
+        sketch = cls(data["k"])
+        sketch.n = data["n"]
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in data["levels"]]
+        return sketch
+
+class SalaryIndex:
+    """KLL salary sketches per (role, location, experience band).
+
+    Every posting also updates the role's all-locations sketch, so queries
+    never merge at read time; a slice with fewer than ``min_count`` postings
+    falls back to the wider one.
+    """
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.sketches: Dict[Tuple[str, str, str], KLLSketch] = {}
+
+    def __len__(self) -> int:
+        return sum(s.n for (_, location, _), s in self.sketches.items() if location == ANY)
+
+    def _sketch(self, key: Tuple[str, str, str]) -> KLLSketch:
+        if key not in self.sketches:
+            self.sketches[key] = KLLSketch(self.k, seed=len(self.sketches))
+        return self.sketches[key]
+
+    def ingest(self, postings: pd.DataFrame) -> "SalaryIndex":
+        """Add a chunk of postings with role/title, location, salary and experience_years (or experience_band)"""
+        frame = pd.DataFrame({
+            "role": postings["role" if "role" in postings else "title"].astype(str).str.strip().str.lower(),
+            "location": postings["location"].astype(str).str.strip().str.lower() if "location" in postings else ANY,
+            "band": postings["experience_band"].astype(str).str.lower() if "experience_band" in postings
+                    else pd.to_numeric(postings["experience_years"], errors="coerce").fillna(0).map(experience_band),
+            "salary": pd.to_numeric(postings["salary"], errors="coerce"),
+        }).dropna(subset=["salary"])
+        for (role, location, band), group in frame.groupby(["role", "location", "band"], sort=False):
+            self._sketch((role, location, band)).update(group["salary"].to_numpy())
+            if location != ANY:
+                self._sketch((role, ANY, band)).update(group["salary"].to_numpy())
+        return self
+
+    def merge(self, other: "SalaryIndex") -> "SalaryIndex":
+        for key, sketch in other.sketches.items():
+            self._sketch(key).merge(sketch)
+        return self
+
+    def quantiles(self, role: str, band: str, location: Optional[str] = None, qs: Sequence[float] = (0.25, 0.5, 0.75),
+                  min_count: int = 20) -> Optional[Dict[str, float]]:
+        """{"p25": ..., "p50": ..., "p75": ...} for a slice, or None when there is too little data"""
+        role = role.strip().lower()
+        for key in ([(role, location.strip().lower(), band)] if location else []) + [(role, ANY, band)]:
+            sketch = self.sketches.get(key)
+            if sketch is not None and sketch.n >= min_count:
+                return {f"p{round(q * 100)}": sketch.quantile(q) for q in qs}
+        return None
+
+    def save(self, path: str = SKETCHES_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"k": self.k, "sketches": [[*key, sketch.to_dict()] for key, sketch in self.sketches.items()]}, f)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path: str = SKETCHES_PATH) -> Optional["SalaryIndex"]:
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            data = json.load(f)
+        index = cls(data["k"])
+        index.sketches = {(role, location, band): KLLSketch.from_dict(sketch) for role, location, band, sketch in data["sketches"]}
+        return index
+
+def read_postings(path: str, chunksize: int = 100_000) -> Iterable[pd.DataFrame]:
+    """Stream a CSV or JSONL of salary postings in chunks"""
+    if path.endswith((".jsonl", ".json")):
+        return pd.read_json(path, lines=True, chunksize=chunksize)
+    return pd.read_csv(path, chunksize=chunksize)
+
+def ingest_file(path: str, k: int = 200) -> SalaryIndex:
+    """Sketch one shard; the raw salaries are never held beyond a chunk"""
+    index = SalaryIndex(k)
+    for chunk in read_postings(path):
+        index.ingest(chunk)
+    logger.info(f"Sketched {len(index)} salaries from {path}")
+    return index
+
+_index = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+def get_salary_index() -> Optional[SalaryIndex]:
+    """Process-wide salary sketches from Models/salary_sketches.json; None until postings have been ingested"""
+    global _index, _index_loaded
+    with _index_lock:
+        if not _index_loaded:
+            _index = SalaryIndex.load()
+            _index_loaded = True
+    return _index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest salary postings into mergeable per-role quantile sketches")
+    parser.add_argument("inputs", nargs="+", help="CSV/JSONL shards with role (or title), location, salary, experience_years")
+    parser.add_argument("--out", default=SKETCHES_PATH)
+    parser.add_argument("--k", type=int, default=200, help="Sketch size; rank error is roughly 1.7/k")
+    parser.add_argument("--workers", type=int, default=1, help="Sketch shards in parallel processes")
+    parser.add_argument("--replace", action="store_true", help="Start fresh instead of merging into the existing sketches")
+    args = parser.parse_args()
+
+    index = (None if args.replace else SalaryIndex.load(args.out)) or SalaryIndex(args.k)
+    with ProcessPoolExecutor(args.workers) as pool:
+        for shard in pool.map(ingest_file, args.inputs, [args.k] * len(args.inputs)):
+            index.merge(shard)
+    index.save(args.out)
+    print(f"{len(index)} salaries in {len(index.sketches)} sketches -> {args.out}")
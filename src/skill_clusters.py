@@ -0,0 +1,135 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+MODELS_DIR = os.path.join(os.path.dirname(__file__), "..", "Models")
+SKILLS_CSV_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+CLUSTERS_PATH = os.path.join(MODELS_DIR, "skill_clusters.npz")
+ASSIGNMENTS_PATH = os.path.join(MODELS_DIR, "skill_clusters.json")
+
+def load_skill_vocabulary(taxonomy: Dict, csv_path: str = SKILLS_CSV_PATH) -> List[str]:
+    """Every skill named in the taxonomy or in skills_dataset.csv, lowercased and deduplicated"""
+    vocabulary = {}
+
+    def walk(node):
+        if isinstance(node, dict):
+            for child in node.values():
+                walk(child)
+        elif isinstance(node, list):
+            for skill in node:
+                vocabulary.setdefault(str(skill).strip().lower(), None)
+
+    walk(taxonomy)
+    if os.path.exists(csv_path):
+        df = pd.read_csv(csv_path)
+        if "skills" in df.columns:
+            for skills in df["skills"].dropna():
+                for skill in str(skills).split(","):
+                    if skill.strip():
+                        vocabulary.setdefault(skill.strip().lower(), None)
+    return list(vocabulary)
+
+def vocabulary_fingerprint(vocabulary: List[str]) -> str:
+    return hashlib.sha256("\n".join(vocabulary).encode()).hexdigest()
+
+class SkillClusterIndex:
+    """Skill clusters fitted offline (build_artifacts.py or this module's CLI) over the whole vocabulary.
+
+    Known skills resolve by dictionary lookup; unseen skills are scaled with the
+    persisted scaler and assigned to the nearest centroid with one matmul. The
+    saved index records a fingerprint of its vocabulary so a stale one is not
+    loaded after the taxonomy or skills_dataset.csv change.
+    """
+    def __init__(self, vocabulary: List[str], assignments: np.ndarray, centroids: np.ndarray,
+                 scaler_mean: np.ndarray, scaler_scale: np.ndarray, labels: List[str]):
+        self.vocabulary = vocabulary
+        self.fingerprint = vocabulary_fingerprint(vocabulary)
+        self.assignments = dict(zip(vocabulary, (int(a) for a in assignments)))
+        self.centroids = centroids.astype(np.float32)
+        self.centroid_sq_norms = (self.centroids ** 2).sum(axis=1)
+        self.scaler_mean = scaler_mean.astype(np.float32)
+        self.scaler_scale = scaler_scale.astype(np.float32)
+        self.labels = labels
+
+    @classmethod
+    def build(cls, vocabulary: List[str], encoder, n_clusters: int = 8, random_state: int = 42) -> "SkillClusterIndex":
+        from sklearn.cluster import KMeans
+        from sklearn.preprocessing import StandardScaler
+        embeddings = np.asarray(encoder.encode(vocabulary), dtype=np.float32)
+        scaler = StandardScaler().fit(embeddings)
+        scaled = scaler.transform(embeddings)
+        kmeans = KMeans(n_clusters=min(n_clusters, len(vocabulary)), random_state=random_state, n_init=10).fit(scaled)
+        # Name each cluster after the member closest to its centroid
+        labels = []
+        for cluster, centroid in enumerate(kmeans.cluster_centers_):
+            members = np.where(kmeans.labels_ == cluster)[0]
+            closest = members[np.argmin(((scaled[members] - centroid) ** 2).sum(axis=1))]
+            labels.append(vocabulary[closest])
+        logger.info(f"Clustered {len(vocabulary)} skills into {kmeans.n_clusters} clusters")
+        return cls(vocabulary, kmeans.labels_, kmeans.cluster_centers_, scaler.mean_, scaler.scale_, labels)
+
+    def save(self, centroids_path: str = CLUSTERS_PATH, assignments_path: str = ASSIGNMENTS_PATH):
+        os.makedirs(os.path.dirname(centroids_path), exist_ok=True)
+        np.savez(centroids_path, centroids=self.centroids, scaler_mean=self.scaler_mean, scaler_scale=self.scaler_scale)
+        with open(assignments_path, "w") as f:
+            json.dump({"labels": self.labels, "vocabulary_fingerprint": self.fingerprint, "assignments": self.assignments}, f, indent=1)
+
+    @classmethod
+    def load(cls, centroids_path: str = CLUSTERS_PATH, assignments_path: str = ASSIGNMENTS_PATH,
+             vocabulary: Optional[List[str]] = None) -> Optional["SkillClusterIndex"]:
+        """Saved index, or None when it is missing or was fitted over a different ``vocabulary``"""
+        if not (os.path.exists(centroids_path) and os.path.exists(assignments_path)):
+            return None
+        with open(assignments_path) as f:
+            data = json.load(f)
+        if vocabulary is not None and data.get("vocabulary_fingerprint") != vocabulary_fingerprint(vocabulary):
+            logger.warning(f"Ignoring {assignments_path}: it was fitted over a different skill vocabulary")
+            return None
+        arrays = np.load(centroids_path)
+        skills = list(data["assignments"])
+        return cls(skills, np.array([data["assignments"][s] for s in skills]), arrays["centroids"],
+                   arrays["scaler_mean"], arrays["scaler_scale"], data["labels"])
+
+    def nearest_centroids(self, embeddings: np.ndarray) -> np.ndarray:
+        scaled = (np.asarray(embeddings, dtype=np.float32) - self.scaler_mean) / self.scaler_scale
+        # argmin ||x - c||^2 == argmin (||c||^2 - 2 x.c)
+        return np.argmin(self.centroid_sq_norms[None, :] - 2.0 * scaled @ self.centroids.T, axis=1)
+
+    def assign(self, skills: List[str], encoder=None, embedding_cache: Optional[Dict[str, np.ndarray]] = None) -> Dict[int, List[str]]:
+        """Group skills by their stable cluster id"""
+        clusters: Dict[int, List[str]] = {}
+        unseen = []
+        for skill in skills:
+            cluster = self.assignments.get(skill.lower())
+            if cluster is None:
+                unseen.append(skill)
+            else:
+                clusters.setdefault(cluster, []).append(skill)
+        if unseen:
+            cache = embedding_cache or {}
+            missing = [s for s in unseen if s not in cache]
+            if missing and encoder is None:
+                raise ValueError("An encoder is required to cluster skills outside the vocabulary")
+            encoded = dict(zip(missing, encoder.encode(missing))) if missing else {}
+            embeddings = np.array([cache[s] if s in cache else encoded[s] for s in unseen])
+            for skill, cluster in zip(unseen, self.nearest_centroids(embeddings)):
+                clusters.setdefault(int(cluster), []).append(skill)
+        return clusters
+
+if __name__ == "__main__":
+    from sentence_transformers import SentenceTransformer
+    from advanced_skill_extractor import IndustrySkillDatabase
+    vocabulary = load_skill_vocabulary(IndustrySkillDatabase().skill_taxonomy)
+    index = SkillClusterIndex.build(vocabulary, SentenceTransformer('all-MiniLM-L6-v2'))
+    index.save()
+    print(f"Saved {len(index.labels)} clusters over {len(vocabulary)} skills:", index.labels)
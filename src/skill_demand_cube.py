@@ -0,0 +1,263 @@
+import argparse
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+SKILLS_DATASET_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+
+# Cube dimensions and the skills_dataset.csv column each one comes from
+DIMENSIONS = ("year", "location", "category", "role", "demand_level")
+COLUMNS = {"year": "year", "location": "location", "category": "category", "role": "title", "demand_level": "demand_level"}
+
+def parse_skills(value) -> List[str]:
+    return [s.strip().lower() for s in value.split(",") if s.strip()] if isinstance(value, str) else []
+
+class Rollup(NamedTuple):
+    """Counts grouped by a subset of dimensions.
+
+    ``keys`` rows are (kept label ids..., skill id) in lexicographic order, so
+    ``spans`` maps each label combination to a contiguous row range; ``totals``
+    maps it to its posting count.
+    """
+    keys: np.ndarray
+    counts: np.ndarray
+    spans: Dict[Tuple[int, ...], Tuple[int, int]]
+    totals: Dict[Tuple[int, ...], int]
+
+def group(keys: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Unique rows of ``keys`` in lexicographic order with their counts summed"""
+    if not len(keys):
+        return keys, counts
+    if not keys.shape[1]:
+        return keys[:1], np.array([counts.sum()], dtype=np.int32)
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    return unique, np.bincount(inverse.ravel(), weights=counts, minlength=len(unique)).astype(np.int32)
+
+class SkillDemandCube:
+    """Pre-aggregated posting counts per skill by year, location, category, role and demand level.
+
+    The cube is stored sparsely as coordinate columns: ``cells`` holds one
+    (dimension label ids..., skill id) row per non-empty cell and
+    ``cell_counts`` its posting count, with ``posting_cells`` /
+    ``posting_counts`` the per-label-combination posting totals. Its size
+    grows with the postings, not with the product of the label counts. Roll-ups
+    over any subset of dimensions are grouped on first use, so a filtered slice
+    is a dictionary lookup rather than a groupby over postings. New postings
+    are folded into the cube and every materialized roll-up without rebuilding.
+    """
+    def __init__(self, skills: Optional[List[str]] = None, labels: Optional[Dict[str, List[str]]] = None,
+                 cells: Optional[np.ndarray] = None, cell_counts: Optional[np.ndarray] = None,
+                 posting_cells: Optional[np.ndarray] = None, posting_counts: Optional[np.ndarray] = None):
+        self.skills: List[str] = list(skills or [])
+        self.labels: Dict[str, List[str]] = {dim: list((labels or {}).get(dim, [])) for dim in DIMENSIONS}
+        self.cells = cells if cells is not None else np.zeros((0, len(DIMENSIONS) + 1), dtype=np.int32)
+        self.cell_counts = cell_counts if cell_counts is not None else np.zeros(0, dtype=np.int32)
+        self.posting_cells = posting_cells if posting_cells is not None else np.zeros((0, len(DIMENSIONS)), dtype=np.int32)
+        self.posting_counts = posting_counts if posting_counts is not None else np.zeros(0, dtype=np.int32)
+        self._skill_index = {skill: i for i, skill in enumerate(self.skills)}
+        self._label_index = {dim: {label: i for i, label in enumerate(self.labels[dim])} for dim in DIMENSIONS}
+        self._rollups: Dict[Tuple[str, ...], Rollup] = {}
+        self._tiers: Dict[Tuple, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_csv(cls, path: str = SKILLS_DATASET_PATH) -> "SkillDemandCube":
+        return cls().add_postings(pd.read_csv(path))
+
+    def _intern(self, index: Dict[str, int], labels: List[str], value: str) -> int:
+        if value not in index:
+            index[value] = len(labels)
+            labels.append(value)
+        return index[value]
+
+    @staticmethod
+    def _columns(keep: Tuple[str, ...]) -> List[int]:
+        return [i for i, dim in enumerate(DIMENSIONS) if dim in keep]
+
+    @staticmethod
+    def _index(keys: np.ndarray, counts: np.ndarray, totals_keys: np.ndarray, totals: np.ndarray) -> Rollup:
+        combos = keys[:, :-1]
+        starts = np.flatnonzero(np.r_[True, (combos[1:] != combos[:-1]).any(axis=1)]) if len(keys) else np.zeros(0, dtype=np.int64)
+        ends = np.r_[starts[1:], len(keys)]
+        spans = {tuple(int(v) for v in combos[start]): (int(start), int(end)) for start, end in zip(starts, ends)}
+        return Rollup(keys, counts, spans, {tuple(int(v) for v in key): int(total) for key, total in zip(totals_keys, totals)})
+
+    def add_postings(self, postings: pd.DataFrame) -> "SkillDemandCube":
+        """Fold new postings (skills_dataset.csv columns) into the cube and its roll-ups"""
+        with self._lock:
+            cells = np.array([[self._intern(self._label_index[dim], self.labels[dim], str(value).strip())
+                               for value in postings[COLUMNS[dim]]] for dim in DIMENSIONS], dtype=np.int32).reshape(len(DIMENSIONS), -1).T
+            skill_lists = [parse_skills(value) for value in postings["skills"]]
+            skill_ids = np.array([self._intern(self._skill_index, self.skills, skill) for skills in skill_lists for skill in skills],
+                                 dtype=np.int32)
+            rows = np.repeat(np.arange(len(skill_lists)), [len(skills) for skills in skill_lists])
+            skill_cells = np.column_stack([cells[rows], skill_ids])
+            ones, posting_ones = np.ones(len(skill_cells), dtype=np.int32), np.ones(len(cells), dtype=np.int32)
+            self.cells, self.cell_counts = group(np.concatenate([self.cells, skill_cells]), np.concatenate([self.cell_counts, ones]))
+            self.posting_cells, self.posting_counts = group(np.concatenate([self.posting_cells, cells]),
+                                                            np.concatenate([self.posting_counts, posting_ones]))
+            for keep, rollup in list(self._rollups.items()):
+                kept = self._columns(keep)
+                totals_keys = np.array(list(rollup.totals), dtype=np.int32).reshape(len(rollup.totals), len(kept))
+                keys, counts = group(np.concatenate([rollup.keys, skill_cells[:, kept + [-1]]]), np.concatenate([rollup.counts, ones]))
+                totals_keys, totals = group(np.concatenate([totals_keys, cells[:, kept]]),
+                                            np.concatenate([np.array(list(rollup.totals.values()), dtype=np.int32), posting_ones]))
+                self._rollups[keep] = self._index(keys, counts, totals_keys, totals)
+            self._tiers.clear()
+        logger.info(f"Demand cube: +{len(skill_lists)} postings, {len(self.skills)} skills, {len(self.cells)} non-empty cells")
+        return self
+
+    def _rollup(self, keep: Tuple[str, ...]) -> Rollup:
+        rollup = self._rollups.get(keep)
+        if rollup is None:
+            with self._lock:
+                kept = self._columns(keep)
+                keys, counts = group(self.cells[:, kept + [-1]], self.cell_counts)
+                totals_keys, totals = group(self.posting_cells[:, kept], self.posting_counts)
+                rollup = self._index(keys, counts, totals_keys, totals)
+                self._rollups[keep] = rollup
+        return rollup
+
+    def _row(self, rollup: Rollup, index: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        """(skill ids, counts) of one label combination"""
+        start, end = rollup.spans.get(index, (0, 0))
+        return rollup.keys[start:end, -1], rollup.counts[start:end]
+
+    def slice(self, **filters) -> Tuple[np.ndarray, int]:
+        """(per-skill posting counts, total postings) for e.g. ``slice(year=2025, location="India")``"""
+        keep = tuple(dim for dim in DIMENSIONS if filters.get(dim) is not None)
+        index = tuple(self._label_index[dim].get(str(filters[dim])) for dim in keep)
+        rollup = self._rollup(keep)
+        counts = np.zeros(len(self.skills), dtype=np.int32)
+        if any(i is None for i in index):
+            return counts, 0
+        skill_ids, skill_counts = self._row(rollup, index)
+        counts[skill_ids] = skill_counts
+        return counts, rollup.totals.get(index, 0)
+
+    def skill_count(self, skill: str, **filters) -> int:
+        skill_id = self._skill_index.get(skill.lower())
+        return 0 if skill_id is None else int(self.slice(**filters)[0][skill_id])
+
+    def demand_share(self, skill: str, **filters) -> float:
+        """Fraction of matching postings that ask for ``skill``"""
+        counts, total = self.slice(**filters)
+        skill_id = self._skill_index.get(skill.lower())
+        return float(counts[skill_id]) / total if skill_id is not None and total else 0.0
+
+    def top_skills(self, n: int = 10, **filters) -> List[Tuple[str, int]]:
+        counts, _ = self.slice(**filters)
+        top = np.argsort(-counts, kind="stable")[:n]
+        return [(self.skills[i], int(counts[i])) for i in top if counts[i] > 0]
+
+    def breakdown(self, skill: str, by: str, **filters) -> Dict[str, int]:
+        """Counts of ``skill`` along one dimension, e.g. ``breakdown("python", "location")``"""
+        skill_id = self._skill_index.get(skill.lower())
+        keep = tuple(dim for dim in DIMENSIONS if dim == by or filters.get(dim) is not None)
+        rollup = self._rollup(keep)
+        if skill_id is None:
+            return {}
+        index = [None if dim == by else self._label_index[dim].get(str(filters[dim])) for dim in keep]
+        if any(i is None for dim, i in zip(keep, index) if dim != by):
+            return {}
+        position = keep.index(by)
+        breakdown = {}
+        for label_id, label in sorted(enumerate(self.labels[by]), key=lambda item: item[1]):
+            index[position] = label_id
+            skill_ids, counts = self._row(rollup, tuple(index))
+            # Skill ids are sorted within a label combination
+            at = np.searchsorted(skill_ids, skill_id)
+            breakdown[label] = int(counts[at]) if at < len(skill_ids) and skill_ids[at] == skill_id else 0
+        return breakdown
+
+    def growth_rate(self, skill: str, **filters) -> Optional[float]:
+        """Year-over-year change in demand share between the last two years; None with a single year"""
+        years = sorted(self.labels["year"])
+        if len(years) < 2:
+            return None
+        previous = self.demand_share(skill, **dict(filters, year=years[-2]))
+        current = self.demand_share(skill, **dict(filters, year=years[-1]))
+        return round((current - previous) / previous, 3) if previous else None
+
+    def demand_tiers(self, **filters) -> Dict[str, str]:
+        """high/medium/low demand per skill from its posting share (top quartile / middle half / rest)"""
+        key = tuple(sorted((k, str(v)) for k, v in filters.items() if v is not None))
+        tiers = self._tiers.get(key)
+        if tiers is None:
+            counts, _ = self.slice(**filters)
+            present = counts[counts > 0]
+            high, low = (np.percentile(present, 75), np.percentile(present, 25)) if present.size else (0, 0)
+            tiers = {skill: "high" if c >= high else "medium" if c >= low else "low"
+                     for skill, c in zip(self.skills, counts) if c > 0}
+            self._tiers[key] = tiers
+        return tiers
+
+    def emerging_skills(self, min_share: float = 0.5, **filters) -> List[str]:
+        """Skills most of whose postings are marked as emerging demand"""
+        emerging_counts, _ = self.slice(**dict(filters, demand_level="emerging"))
+        counts, _ = self.slice(**filters)
+        share = np.divide(emerging_counts, counts, out=np.zeros(len(self.skills)), where=counts > 0)
+        return [self.skills[i] for i in np.argsort(-counts, kind="stable") if share[i] >= min_share and counts[i] > 0]
+
+    def save(self, arrays_path: str, labels_path: str):
+        np.savez_compressed(arrays_path, cells=self.cells, cell_counts=self.cell_counts,
+                            posting_cells=self.posting_cells, posting_counts=self.posting_counts)
+        with open(labels_path, "w") as f:
+            json.dump({"skills": self.skills, "labels": self.labels}, f)
+
+    @classmethod
+    def load(cls, arrays_path: str, labels_path: str) -> "SkillDemandCube":
+        arrays = np.load(arrays_path)
+        with open(labels_path) as f:
+            meta = json.load(f)
+        return cls(meta["skills"], meta["labels"], arrays["cells"], arrays["cell_counts"],
+                   arrays["posting_cells"], arrays["posting_counts"])
+
+_cube = None
+_cube_lock = threading.Lock()
+
+def get_demand_cube() -> Optional[SkillDemandCube]:
+    """Process-wide cube from the artifact bundle, else built from skills_dataset.csv; None when neither exists"""
+    global _cube
+    with _cube_lock:
+        if _cube is None:
+            from artifact_bundle import get_bundle
+            bundle = get_bundle()
+            if bundle is not None and bundle.has("demand_cube"):
+                try:
+                    _cube = SkillDemandCube.load(bundle.path_of("demand_cube"), bundle.path_of("demand_cube_labels"))
+                except KeyError:
+                    logger.warning("Bundle holds a dense demand cube from an older build; rebuild it with build_artifacts.py")
+            if _cube is None and os.path.exists(SKILLS_DATASET_PATH):
+                _cube = SkillDemandCube.from_csv()
+    return _cube
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the pre-aggregated skill demand cube")
+    parser.add_argument("--skill", default=None, help="Show this skill's breakdown along every dimension")
+    parser.add_argument("--top", type=int, default=10)
+    for dim in DIMENSIONS:
+        parser.add_argument(f"--{dim.replace('_', '-')}", dest=dim, default=None, help=f"Filter on {dim}")
+    args = parser.parse_args()
+    cube = get_demand_cube()
+    if cube is None:
+        raise SystemExit(f"No bundle and no {SKILLS_DATASET_PATH}")
+    filters = {dim: getattr(args, dim) for dim in DIMENSIONS}
+    if args.skill:
+        print(f"{args.skill}: {cube.skill_count(args.skill, **filters)} postings, share {cube.demand_share(args.skill, **filters):.1%}")
+        for dim in DIMENSIONS:
+            if filters[dim] is None:
+                print(f"  by {dim}: {cube.breakdown(args.skill, dim, **filters)}")
+    else:
+        for skill, count in cube.top_skills(args.top, **filters):
+            print(f"{skill}: {count}")
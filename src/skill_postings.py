@@ -0,0 +1,23 @@
+import os
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+SKILLS_CSV_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+
+def load_postings(csv_path: str = SKILLS_CSV_PATH) -> Tuple[List[str], List[np.ndarray]]:
+    """Read postings and return the skill ontology plus each posting's skill ids"""
+    df = pd.read_csv(csv_path)
+    posting_skills = [[s.strip().lower() for s in str(skills).split(",") if s.strip()] for skills in df["skills"].dropna()]
+    ontology = sorted({s for skills in posting_skills for s in skills})
+    skill_to_idx = {skill: i for i, skill in enumerate(ontology)}
+    postings = [np.array(sorted({skill_to_idx[s] for s in skills}), dtype=np.int64) for skills in posting_skills if skills]
+    return ontology, postings
+
+def split_observed(skill_ids: np.ndarray, rng: np.random.Generator, observed_fraction: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Hide part of a posting's skills; the model sees the rest and must recover the whole set"""
+    shuffled = rng.permutation(skill_ids)
+    n_observed = min(max(1, int(round(len(shuffled) * observed_fraction))), max(1, len(shuffled) - 1))
+    return shuffled[:n_observed], shuffled[n_observed:]
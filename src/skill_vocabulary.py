@@ -0,0 +1,172 @@
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "Data")
+SKILLS_CSV_PATH = os.path.join(DATA_DIR, "skills_dataset.csv")
+
+SKILL_ALIASES = {
+    "py": "python",
+    "ml": "machine learning",
+    "nlp": "natural language processing",
+    "dl": "deep learning",
+    "js": "javascript",
+    "ts": "typescript",
+    "k8s": "kubernetes",
+    "gcp": "google cloud",
+    "sklearn": "scikit-learn",
+    "reactjs": "react",
+    "react.js": "react",
+    "nodejs": "node.js",
+    "postgres": "postgresql",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+def canonicalize(skill: str) -> str:
+    """Lowercase, collapse whitespace and resolve aliases such as 'py' -> 'python'"""
+    skill = _WHITESPACE.sub(" ", str(skill).strip().lower())
+    return SKILL_ALIASES.get(skill, skill)
+
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Number of set bits per row of a uint64 bitset array (last axis = words)"""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNT_TABLE[words.view(np.uint8)].reshape(*words.shape[:-1], -1).sum(axis=-1, dtype=np.int64)
+
+class SkillVocabulary:
+    """Interns canonical skill names into dense integer ids and packs skill sets into uint64 bitsets"""
+    def __init__(self, skills: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+        for skill in skills:
+            self.intern(skill)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def n_words(self) -> int:
+        return max(1, (len(self._names) + 63) // 64)
+
+    def intern(self, skill: str) -> int:
+        name = canonicalize(skill)
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(name)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = skill_id
+        return skill_id
+
+    def id_of(self, skill: str) -> Optional[int]:
+        return self._ids.get(canonicalize(skill))
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def names(self, ids: Iterable[int]) -> List[str]:
+        return [self._names[int(i)] for i in ids]
+
+    def ids(self, skills: Iterable[str], add: bool = False) -> np.ndarray:
+        """Sorted unique ids; unknown skills are dropped, or interned with add=True"""
+        if add:
+            found = {self.intern(s) for s in skills}
+        else:
+            found = {i for i in (self.id_of(s) for s in skills) if i is not None}
+        return np.array(sorted(found), dtype=np.int64)
+
+    def bitset(self, skills: Iterable[str], add: bool = False, n_words: Optional[int] = None) -> np.ndarray:
+        return self.ids_to_bitset(self.ids(skills, add), n_words)
+
+    def ids_to_bitset(self, ids: np.ndarray, n_words: Optional[int] = None) -> np.ndarray:
+        words = np.zeros(n_words or self.n_words, dtype=np.uint64)
+        ids = np.asarray(ids, dtype=np.int64)
+        np.bitwise_or.at(words, ids >> 6, np.left_shift(np.uint64(1), (ids & 63).astype(np.uint64)))
+        return words
+
+    def bitset_to_ids(self, words: np.ndarray) -> np.ndarray:
+        bits = np.unpackbits(np.ascontiguousarray(words, dtype=np.uint64).view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits[:len(self._names)])
+
+    def bitset_matrix(self, skill_sets: Iterable[Iterable[str]], add: bool = False) -> np.ndarray:
+        """Stack many skill sets into an (N, n_words) bitset matrix"""
+        id_sets = [self.ids(skills, add) for skills in skill_sets]
+        matrix = np.zeros((len(id_sets), self.n_words), dtype=np.uint64)
+        for row, ids in enumerate(id_sets):
+            matrix[row] = self.ids_to_bitset(ids, self.n_words)
+        return matrix
+
+    def contains(self, words: np.ndarray, ids: np.ndarray) -> np.ndarray:
+        """Vectorized membership test of ids against one bitset"""
+        ids = np.asarray(ids, dtype=np.int64)
+        words = _pad(words, int(ids.max() >> 6) + 1 if ids.size else 1)
+        return ((words[ids >> 6] >> (ids & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+    def missing(self, required: Iterable[str], have: Iterable[str]) -> List[str]:
+        """Required skills absent from ``have``, in the order they were required.
+
+        Neither side grows the vocabulary; skills it does not know are compared by name.
+        """
+        required = list(dict.fromkeys(canonicalize(s) for s in required))
+        have = {canonicalize(s) for s in have}
+        ids = np.array([self._ids.get(s, -1) for s in required], dtype=np.int64)
+        known = ids >= 0
+        present = np.zeros(len(required), dtype=bool)
+        present[known] = self.contains(self.bitset(have, add=False), ids[known])
+        present[~known] = [s in have for s, is_known in zip(required, known) if not is_known]
+        return [s for s, hit in zip(required, present) if not hit]
+
+def _pad(words: np.ndarray, n_words: int) -> np.ndarray:
+    if words.shape[-1] >= n_words:
+        return words
+    pad = [(0, 0)] * (words.ndim - 1) + [(0, n_words - words.shape[-1])]
+    return np.pad(words, pad)
+
+def coverage_counts(student_bits: np.ndarray, role_bits: np.ndarray, chunk_size: int = 2048) -> Tuple[np.ndarray, np.ndarray]:
+    """Matched and missing skill counts for every (student, role) pair.
+
+    ``student_bits`` is (N, W) and ``role_bits`` is (R, W); both are padded to a
+    common width. Work is chunked over students so memory stays O(chunk x R x W).
+    """
+    n_words = max(student_bits.shape[-1], role_bits.shape[-1])
+    student_bits, role_bits = _pad(student_bits, n_words), _pad(role_bits, n_words)
+    matched = np.empty((len(student_bits), len(role_bits)), dtype=np.int32)
+    missing = np.empty_like(matched)
+    for start in range(0, len(student_bits), chunk_size):
+        chunk = student_bits[start:start + chunk_size, None, :]
+        matched[start:start + chunk_size] = popcount(chunk & role_bits[None, :, :])
+        missing[start:start + chunk_size] = popcount(role_bits[None, :, :] & ~chunk)
+    return matched, missing
+
+_vocabulary = None
+_vocabulary_lock = threading.Lock()
+
+def get_skill_vocabulary() -> SkillVocabulary:
+    """Process-wide vocabulary, seeded with role requirements and skills_dataset.csv on first use"""
+    global _vocabulary
+    if _vocabulary is None:
+        with _vocabulary_lock:
+            if _vocabulary is None:
+                vocabulary = SkillVocabulary()
+                from role_model import ROLE_MODEL
+                for role in ROLE_MODEL.roles.values():
+                    for skill in role.skills:
+                        vocabulary.intern(skill)
+                if os.path.exists(SKILLS_CSV_PATH):
+                    import pandas as pd
+                    for skills in pd.read_csv(SKILLS_CSV_PATH, usecols=["skills"])["skills"].dropna().unique():
+                        for skill in str(skills).split(","):
+                            if skill.strip():
+                                vocabulary.intern(skill)
+                _vocabulary = vocabulary
+    return _vocabulary
@@ -0,0 +1,107 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+class StageError(RuntimeError):
+    """Raised when a stage fails; carries the stage name and the original exception"""
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"Stage '{stage}' failed: {error}")
+        self.stage = stage
+        self.error = error
+
+class StageGraph:
+    """Small DAG of named analysis stages.
+
+    Each stage is called with the results of its dependencies as keyword
+    arguments. Stages added with ``inline=True`` (cheap, pure-Python work) run
+    on the calling thread; the rest go to a thread pool that is only started
+    when such stages exist. Stages become runnable as soon as their
+    dependencies finish, and pooled stages are submitted before inline ones
+    run, so model inference overlaps the cheap work and wall time follows the
+    critical path. numpy and torch release the GIL in their kernels, so
+    independent model stages overlap too.
+    """
+    def __init__(self):
+        self._stages: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...], bool]] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], deps: Iterable[str] = (), inline: bool = False) -> "StageGraph":
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already defined")
+        self._stages[name] = (fn, tuple(deps), inline)
+        return self
+
+    def _check(self, inputs: Dict[str, Any]):
+        known = set(inputs) | set(self._stages)
+        for name, (_, deps, _) in self._stages.items():
+            unknown = [d for d in deps if d not in known]
+            if unknown:
+                raise ValueError(f"Stage '{name}' depends on unknown stages {unknown}")
+        visiting, done = set(), set(inputs)
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dep in self._stages[name][1]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._stages:
+            visit(name)
+
+    def run(self, inputs: Optional[Dict[str, Any]] = None, max_workers: Optional[int] = None,
+            on_result: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+        """Execute every stage and return inputs plus all stage results.
+
+        ``on_result(name, value)`` is called from the calling thread as each stage
+        completes, so callers can surface partial results early.
+        """
+        results: Dict[str, Any] = dict(inputs or {})
+        self._check(results)
+        pending = dict(self._stages)
+        running: Dict[Future, str] = {}
+        pooled = sum(not inline for _, _, inline in pending.values())
+        pool = ThreadPoolExecutor(max_workers=max_workers or min(8, pooled), thread_name_prefix="stage") if pooled else None
+
+        def finish(name: str, value: Any):
+            results[name] = value
+            if on_result is not None:
+                on_result(name, value)
+
+        try:
+            while pending or running:
+                ready = [n for n, (_, deps, _) in pending.items() if all(d in results for d in deps)]
+                ran_inline = False
+                # Pooled stages first (False sorts before True) so they overlap the inline ones
+                for name in sorted(ready, key=lambda n: pending[n][2]):
+                    fn, deps, inline = pending.pop(name)
+                    kwargs = {d: results[d] for d in deps}
+                    if not inline:
+                        running[pool.submit(fn, **kwargs)] = name
+                        continue
+                    try:
+                        value = fn(**kwargs)
+                    except Exception as error:
+                        raise StageError(name, error) from error
+                    finish(name, value)
+                    ran_inline = True
+                if ran_inline:
+                    continue
+                if not running:
+                    raise ValueError(f"Stages {list(pending)} can never run")
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        raise StageError(name, error) from error
+                    finish(name, future.result())
+        finally:
+            if pool is not None:
+                for future in running:
+                    future.cancel()
+                pool.shutdown(wait=True)
+        return results
@@ -0,0 +1,69 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+def profile_imports(module: str, python: str = sys.executable) -> Dict:
+    """Import ``module`` in a fresh interpreter under ``-X importtime`` and parse the breakdown"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])))
+    start = time.perf_counter()
+    proc = subprocess.run([python, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, env=env, cwd=os.path.dirname(SRC_DIR))
+    wall = time.perf_counter() - start
+    timings = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            timings.append(ImportTiming(name, int(self_us) / 1000, int(cumulative_us) / 1000, (len(indent) - 1) // 2))
+    errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+    return {"module": module, "wall_seconds": wall, "returncode": proc.returncode, "timings": timings, "errors": errors}
+
+def by_package(timings: List[ImportTiming], top: int = 15) -> List[ImportTiming]:
+    """Import time per top-level package: summed self time, and the cumulative time of its outermost import"""
+    packages: Dict[str, ImportTiming] = {}
+    for timing in timings:
+        root = timing.module.split(".")[0]
+        previous = packages.get(root)
+        if previous is None:
+            packages[root] = ImportTiming(root, timing.self_ms, timing.cumulative_ms, timing.depth)
+        else:
+            packages[root] = ImportTiming(root, previous.self_ms + timing.self_ms,
+                                          max(previous.cumulative_ms, timing.cumulative_ms), min(previous.depth, timing.depth))
+    return sorted(packages.values(), key=lambda t: -t.self_ms)[:top]
+
+def format_report(report: Dict, top: int = 15) -> str:
+    lines = [f"{report['module']}: {report['wall_seconds']:.2f}s wall (interpreter start + imports)",
+             f"{'self ms':>9} {'cumulative ms':>14}  package"]
+    for timing in by_package(report["timings"], top):
+        lines.append(f"{timing.self_ms:>9.1f} {timing.cumulative_ms:>14.1f}  {timing.module}")
+    if report["returncode"] != 0:
+        lines.append("import failed:")
+        lines.extend("  " + line for line in report["errors"][-5:])
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report the cold-start import cost of app modules")
+    parser.add_argument("modules", nargs="*", default=["app_enhanced"])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=2.0, help="Fail when a module takes longer than this many seconds")
+    args = parser.parse_args()
+    over_budget = False
+    for module in args.modules:
+        report = profile_imports(module)
+        print(format_report(report, args.top))
+        print()
+        over_budget |= report["returncode"] != 0 or report["wall_seconds"] > args.budget
+    sys.exit(1 if over_budget else 0)
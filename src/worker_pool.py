@@ -0,0 +1,226 @@
+import argparse
+import gc
+import glob
+import json
+import logging
+import multiprocessing as mp
+import os
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import torch
+import torch.multiprocessing as torch_mp
+
+from artifact_bundle import MODELS_DIR, get_bundle
+from role_model import ROLE_MODEL
+from skill_vocabulary import get_skill_vocabulary
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Models shared by every worker; filled in the parent before fork, or by the initializer under spawn
+_SHARED: Dict = {}
+
+def freeze_module(module: torch.nn.Module) -> torch.nn.Module:
+    """Eval mode and no grad so inference never writes to (and un-shares) the weight pages"""
+    module.eval()
+    for param in module.parameters():
+        param.requires_grad_(False)
+    return module
+
+def load_shared_models(with_extractor: bool = True, with_gnn: bool = True) -> Dict:
+    """Load models and read-only artifacts once so workers can share them"""
+    models = {}
+    if with_extractor:
+        from advanced_skill_extractor import IndustrySkillExtractor
+        extractor = IndustrySkillExtractor()
+        freeze_module(extractor.model)
+        freeze_module(extractor.bi_encoder)
+        models['extractor'] = extractor
+    if with_gnn:
+        from inference_optimizer import load_optimized_gnn
+        bundle = get_bundle()
+        gnn = load_optimized_gnn(bundle.models_dir("gnn_checkpoint", MODELS_DIR) if bundle is not None else MODELS_DIR)
+        from cooccurrence_recommender import CooccurrenceRecommender, choose_skill_predictor
+        predictor = choose_skill_predictor(gnn, CooccurrenceRecommender.load())
+        models['skill_predictor'] = freeze_module(predictor) if isinstance(predictor, torch.nn.Module) else predictor
+    # Warm the lazily built lookup tables too, otherwise every worker builds its own copy
+    models['vocabulary'] = get_skill_vocabulary()
+    return models
+
+def share_models_memory(models: Dict) -> Dict:
+    """Move tensors into shared memory so spawn-started workers map them instead of copying"""
+    for value in models.values():
+        modules = [value] if isinstance(value, torch.nn.Module) else []
+        if hasattr(value, 'model') and isinstance(value.model, torch.nn.Module):
+            modules += [value.model, value.bi_encoder]
+        for module in modules:
+            module.share_memory()
+        skill_index = getattr(value, 'skill_index', None)
+        if skill_index is not None and isinstance(skill_index.node_features, torch.Tensor):
+            skill_index.node_features.share_memory_()
+    return models
+
+def private_memory_mb() -> Optional[float]:
+    """Private (unshared) memory of this process from /proc/self/smaps_rollup; None off Linux"""
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        return None
+    kb = sum(int(fields[k].split()[0]) for k in ("Private_Clean", "Private_Dirty") if k in fields)
+    return round(kb / 1024, 1)
+
+def _init_worker(models: Optional[Dict], threads_per_worker: int):
+    if models is not None:
+        _SHARED.update(models)
+    torch.set_num_threads(threads_per_worker)
+
+def role_match_record(task: Tuple[str, str, str]) -> Dict:
+    """The cheap, model-free part of a result: role skill match for one task"""
+    student_id, text, target_role = task
+    role = ROLE_MODEL.get(target_role)
+    role_match = role.match_text(text)
+    return {
+        'student_id': student_id,
+        'target_role': role.name,
+        'found_skills': role_match.found_skills,
+        'missing_skills': role_match.missing_skills,
+        'skill_match_score': round(len(role_match.found_skills) / max(len(role.skills), 1) * 100, 1),
+    }
+
+def analyze_resume(task: Tuple[str, str, str]) -> Dict:
+    """Analyze one ``(student_id, resume_text, target_role)`` with the shared models"""
+    text = task[1]
+    record = role_match_record(task)
+    extractor = _SHARED.get('extractor')
+    if extractor is not None:
+        with torch.inference_mode():
+            record['ml_extracted_skills'] = extractor.extract_skills_advanced(text).get('extracted_skills', [])
+    predictor = _SHARED.get('skill_predictor')
+    if predictor is not None:
+        from gnn_skill_predictor import predict_for_student
+        known = list(dict.fromkeys(record['found_skills'] + record.get('ml_extracted_skills', [])))
+        record['ml_predicted_skills'] = predict_for_student(predictor, known)
+    return record
+
+def _memory_probe(_) -> Tuple[int, Optional[float]]:
+    return os.getpid(), private_memory_mb()
+
+class WorkerPool:
+    """Preload-then-fork process pool for batch analysis.
+
+    Models are loaded once in the parent and frozen; with the ``fork`` start
+    method workers inherit them copy-on-write, and ``gc.freeze()`` keeps the
+    cyclic collector from touching (and so copying) the inherited objects.
+    Where fork is unavailable, ``share_memory`` puts the weight tensors in
+    shared memory and hands workers handles to them instead of copies.
+    """
+    def __init__(self, n_workers: Optional[int] = None, start_method: Optional[str] = None,
+                 share_memory: Optional[bool] = None, threads_per_worker: int = 1,
+                 loader: Callable[[], Dict] = load_shared_models):
+        self.n_workers = n_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.start_method = start_method or ('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+        self.share_memory = self.start_method != 'fork' if share_memory is None else share_memory
+        self.threads_per_worker = threads_per_worker
+        self.loader = loader
+        self._pool = None
+
+    def start(self) -> "WorkerPool":
+        if self._pool is not None:
+            return self
+        if self.start_method == 'fork':
+            # Keep the parent single-threaded so no intra-op thread pool exists at fork time
+            torch.set_num_threads(1)
+        models = self.loader()
+        if self.share_memory:
+            share_models_memory(models)
+        context = torch_mp.get_context(self.start_method)
+        if self.start_method == 'fork':
+            _SHARED.clear()
+            _SHARED.update(models)
+            gc.collect()
+            gc.freeze()
+            init_models = None
+        else:
+            init_models = models
+        self._pool = context.Pool(self.n_workers, initializer=_init_worker, initargs=(init_models, self.threads_per_worker))
+        logger.info(f"Started {self.n_workers} workers ({self.start_method}, shared memory={self.share_memory}); "
+                    f"parent private memory {private_memory_mb()} MB")
+        return self
+
+    def map(self, tasks: Iterable[Tuple[str, str, str]], chunksize: int = 4) -> Iterator[Dict]:
+        """Analyze tasks across workers, yielding results in completion order"""
+        self.start()
+        return self._pool.imap_unordered(analyze_resume, tasks, chunksize=chunksize)
+
+    def memory_report(self, probes_per_worker: int = 4) -> Dict[int, Optional[float]]:
+        """Private memory in MB per worker pid, i.e. what each extra worker actually costs"""
+        self.start()
+        return dict(self._pool.map(_memory_probe, range(self.n_workers * probes_per_worker), chunksize=1))
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            if self.start_method == 'fork':
+                gc.unfreeze()
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+def read_tasks(path: str, default_role: str) -> Iterator[Tuple[str, str, str]]:
+    """Tasks from a directory of .txt resumes or a JSONL of {student_id, text, target_role}"""
+    if os.path.isdir(path):
+        for file_path in sorted(glob.glob(os.path.join(path, "*.txt"))):
+            with open(file_path, encoding="utf-8", errors="ignore") as f:
+                yield os.path.splitext(os.path.basename(file_path))[0], f.read(), default_role
+        return
+    with open(path) as f:
+        for i, line in enumerate(f):
+            if line.strip():
+                record = json.loads(line)
+                yield str(record.get('student_id', f"student_{i}")), record['text'], record.get('target_role', default_role)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch-analyze resumes on a preloaded, forked worker pool")
+    parser.add_argument("input", help="Directory of .txt resumes or JSONL of {student_id, text, target_role}")
+    parser.add_argument("--out", default="batch_results.jsonl")
+    parser.add_argument("--role", default=ROLE_MODEL.default_role)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--start-method", choices=["fork", "forkserver", "spawn"], default=None)
+    parser.add_argument("--share-memory", action="store_true", default=None)
+    parser.add_argument("--no-extractor", action="store_true")
+    parser.add_argument("--no-gnn", action="store_true", help="Skip missing-skill prediction")
+    parser.add_argument("--memory-report", action="store_true")
+    parser.add_argument("--dedup", action="store_true", help="Analyze one resume per near-duplicate cluster and reuse its result")
+    parser.add_argument("--dedup-threshold", type=float, default=0.8, help="Estimated Jaccard similarity for near-duplicates")
+    parser.add_argument("--dedup-index", default=None, help="Persisted dedup index directory (default Models/dedup)")
+    args = parser.parse_args()
+
+    loader = lambda: load_shared_models(with_extractor=not args.no_extractor, with_gnn=not args.no_gnn)
+    with WorkerPool(args.workers, args.start_method, args.share_memory, loader=loader) as pool:
+        count = 0
+        tasks = read_tasks(args.input, args.role)
+        if args.dedup:
+            from resume_dedup import DEDUP_DIR, DedupIndex, dedup_analyze
+            index_dir = args.dedup_index or DEDUP_DIR
+            index = DedupIndex.load(index_dir, args.dedup_threshold)
+            variant = f"extractor={not args.no_extractor},gnn={not args.no_gnn}"
+            records = dedup_analyze(tasks, pool.map, index, refresh=role_match_record, variant=variant)
+        else:
+            records = pool.map(tasks)
+        with open(args.out, "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        if args.dedup:
+            index.save(index_dir)
+        print(f"Wrote {count} results to {args.out}")
+        if args.memory_report:
+            for pid, mb in sorted(pool.memory_report().items()):
+                print(f"worker {pid}: {mb} MB private")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app's modules import each other script-style from src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,25 @@
+import json
+import logging
+
+import artifact_bundle
+from artifact_bundle import MANIFEST_NAME, ArtifactBundle, file_sha256
+
+def write_bundle(path, sources):
+    path.mkdir()
+    (path / MANIFEST_NAME).write_text(json.dumps({"version": 3, "artifacts": {}, "sources": sources}))
+    return str(path)
+
+def test_stale_sources_flags_changed_files(tmp_path):
+    fresh = {"Data/courses.csv": file_sha256(f"{artifact_bundle.REPO_ROOT}/Data/courses.csv")}
+    assert ArtifactBundle(write_bundle(tmp_path / "fresh", fresh)).stale_sources() == []
+    stale = ArtifactBundle(write_bundle(tmp_path / "stale", {"Data/courses.csv": "0" * 64}))
+    assert stale.stale_sources() == ["Data/courses.csv"]
+
+def test_get_bundle_warns_when_stale(tmp_path, monkeypatch, caplog):
+    monkeypatch.setenv("JOBBRIDGE_BUNDLE", write_bundle(tmp_path / "stale", {"Data/courses.csv": "0" * 64}))
+    monkeypatch.setattr(artifact_bundle, "_bundle", None)
+    monkeypatch.setattr(artifact_bundle, "_bundle_loaded", False)
+    with caplog.at_level(logging.WARNING, logger="artifact_bundle"):
+        bundle = artifact_bundle.get_bundle()
+    assert bundle is not None and bundle.version == 3
+    assert "Data/courses.csv" in caplog.text
@@ -0,0 +1,22 @@
+from cohort_analytics import CohortAnalytics
+
+def test_duplicate_student_in_batch_keeps_last_record():
+    cohort = CohortAnalytics()
+    cohort.add_results([
+        {'student_id': 'a', 'target_role': 'Data Scientist', 'found_skills': ['python'], 'overall_score': 40},
+        {'student_id': 'a', 'target_role': 'Data Scientist', 'found_skills': ['python', 'sql'], 'overall_score': 90},
+    ])
+    summary = cohort.summary()
+    assert len(cohort) == 1
+    assert summary['roles']['Data Scientist']['students'] == 1
+    assert summary['readiness']['Job Ready'] == 1 and summary['readiness']['Beginning'] == 0
+    cohort.remove('a')
+    assert cohort.summary()['roles'] == {}
+    assert sum(cohort.summary()['readiness'].values()) == 0
+
+def test_default_ids_stay_unique_after_removal():
+    cohort = CohortAnalytics()
+    cohort.add_results([{'target_role': 'Data Scientist', 'found_skills': []}] * 2)
+    cohort.remove('student_0')
+    cohort.add_results([{'target_role': 'Data Scientist', 'found_skills': []}])
+    assert len(cohort) == 2
@@ -0,0 +1,16 @@
+import sys
+
+from cooccurrence_recommender import CooccurrenceRecommender, train_recommender
+from skill_postings import load_postings
+
+def test_ubiquitous_skill_implies_nothing_confidently():
+    ontology, postings = load_postings()
+    recommender = CooccurrenceRecommender.build(ontology, postings)
+    scores = recommender.score(["python"])
+    # python is in nearly every posting, so it is weak evidence for any particular neighbour
+    assert (scores > 0.65).sum() == 0
+
+def test_builds_without_the_gnn_stack():
+    recommender = train_recommender()
+    assert "precision_at_5" in recommender.metrics
+    assert "torch" not in sys.modules
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import course_search
+from course_search import COURSES_CSV_PATH, CourseSearchEngine, get_course_search, tokenize
+
+COURSES = pd.DataFrame({
+    "course_name": ["Docker Deep Dive", "Docker Basics", "Intro to SQL"],
+    "skills": ["docker,containers", "docker", "sql"],
+    "provider": ["Udemy", "Coursera", "edX"],
+    "duration_weeks": [12, 2, 4],
+})
+
+class FakeEncoder:
+    def encode(self, texts):
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+@pytest.fixture
+def fresh_engine(monkeypatch):
+    monkeypatch.setattr(course_search, "_engine", None)
+    monkeypatch.setattr(course_search, "_csv_source", None)
+    monkeypatch.setattr(course_search, "_frame_source", None)
+    monkeypatch.setattr("artifact_bundle.get_bundle", lambda: None)
+
+def test_engine_is_rebuilt_when_content_changes(fresh_engine):
+    engine = get_course_search(COURSES)
+    assert get_course_search(COURSES) is engine
+    assert get_course_search(COURSES.copy()) is engine
+    renamed = COURSES.assign(course_name=["Docker Deep Dive", "Docker Basics", "Intro to PostgreSQL"])
+    rebuilt = get_course_search(renamed)
+    assert rebuilt is not engine and len(rebuilt.courses) == len(engine.courses)
+    assert rebuilt.records[2]["course_name"] == "Intro to PostgreSQL"
+
+def test_csv_and_frame_callers_share_one_engine_and_its_encoder(fresh_engine):
+    encoder = FakeEncoder()
+    engine = get_course_search(encoder=encoder)
+    assert get_course_search(pd.read_csv(COURSES_CSV_PATH)) is engine
+    assert get_course_search() is engine and engine.encoder is encoder
+    # A different catalogue gets a new engine that keeps semantic recall
+    other = get_course_search(COURSES)
+    assert other is not engine and other.encoder is encoder and other.embeddings.shape == (3, 2)
+
+def test_a_frame_is_hashed_once(fresh_engine, monkeypatch):
+    calls = []
+    fingerprint = course_search.course_fingerprint
+    monkeypatch.setattr(course_search, "course_fingerprint", lambda frame: calls.append(1) or fingerprint(frame))
+    for _ in range(5):
+        get_course_search(COURSES)
+    assert len(calls) == 2  # once for the frame, once inside the engine it builds
+
+def test_split_and_joined_spellings_match():
+    assert "mlops" in tokenize("ml ops") and "mlops" in tokenize("ML Ops")
+    assert "machine" in tokenize("ml ops")
+    engine = CourseSearchEngine(pd.DataFrame({
+        "course_name": ["Machine Learning 101", "MLOps in Production"],
+        "skills": ["machine learning", "mlops"],
+        "provider": ["Coursera", "Udemy"],
+        "duration_weeks": [6, 6],
+    }))
+    assert {c["course_name"] for c in engine.search("ml ops", k=2)} == {"Machine Learning 101", "MLOps in Production"}
+    assert engine.search("mlops", k=1)[0]["course_name"] == "MLOps in Production"
+
+def test_duration_only_breaks_ties():
+    engine = CourseSearchEngine(COURSES)
+    # The 12-week course is the better BM25 match (skills weighted twice, plus "containers")
+    lexical = engine.bm25_scores(["docker containers"])[0]
+    assert lexical[0] > lexical[1]
+    ranked = engine.search("docker containers", k=2, diversify=False)
+    assert [c["course_name"] for c in ranked] == ["Docker Deep Dive", "Docker Basics"]
+    # The old default (0.004) exceeded the gap between adjacent RRF ranks and flipped this
+    flipped = engine.search("docker containers", k=2, diversify=False, duration_weight=0.004)
+    assert flipped[0]["course_name"] == "Docker Basics"
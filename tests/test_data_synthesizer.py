@@ -0,0 +1,19 @@
+import pandas as pd
+
+from data_synthesizer import SyntheticCorpus
+from role_model import ROLE_MODEL
+
+def test_resume_target_roles_are_app_roles():
+    corpus = SyntheticCorpus(seed=3)
+    resumes = pd.concat(corpus.resumes(500, chunk_size=200))
+    assert set(resumes["target_role"]) <= set(ROLE_MODEL.role_names())
+    assert all(text.startswith(f"SUMMARY\nStudent aiming for a role as {role}.")
+               for role, text in zip(resumes["target_role"], resumes["text"]))
+    # A posting title that is also an app role maps to itself
+    titles = list(corpus.roles["title"])
+    assert corpus.target_roles[titles.index("Data Scientist")] == "Data Scientist"
+
+def test_resumes_are_reproducible():
+    first = pd.concat(SyntheticCorpus(seed=5).resumes(50, chunk_size=20))
+    second = pd.concat(SyntheticCorpus(seed=5).resumes(50, chunk_size=20))
+    assert first.equals(second)
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from emerging_tech_index import EmergingTechIndex
+from role_model import ROLE_MODEL, squash
+
+JUNK = {"Photography", "Geography", "Storage", "Home Security", "Insights", "Microsoft", "Deals", "Privacy policy"}
+
+@pytest.fixture(scope="module")
+def index():
+    return EmergingTechIndex.build(kind="lexical")
+
+def test_only_supported_technologies_are_recommendable(index):
+    recommendable = {tech for tech, eligible in zip(index.techs, index.eligible) if eligible}
+    assert recommendable and not recommendable & JUNK
+    assert np.all(index.support[index.eligible] > 0)
+    for role in index.roles:
+        for tech, _ in index.top_k(role, ROLE_MODEL.get(role).skills, k=10):
+            assert tech in recommendable
+
+def test_every_app_role_gets_technologies(index):
+    for role in ROLE_MODEL.role_names():
+        assert index.top_k(role, k=4), role
+        assert index.top_k(role, ROLE_MODEL.get(role).skills[:3], k=3), role
+
+def test_role_never_recommends_itself(index):
+    for role in index.roles:
+        assert squash(role) not in {squash(tech) for tech, _ in index.top_k(role, k=len(index.techs))}
+
+def test_rankings_fit_the_role(index):
+    assert {"Android", "iOS"} == {tech for tech, _ in index.top_k("Mobile App Developer", k=2)}
+    assert index.top_k("Data Scientist", k=1)[0][0] == "Big Data"
+    assert index.top_k("Blockchain", k=1)[0][0] == "Cyber Security"
+
+def test_found_skills_and_relevance_floor_are_excluded(index):
+    assert "Android" not in {tech for tech, _ in index.top_k("Mobile App Developer", found_skills=["android"])}
+    assert all(index.relevance[index.roles.index("Software Engineer"), index.techs.index(tech)] > 0.05
+               for tech, _ in index.top_k("Software Engineer", ["kubernetes"], min_relevance=0.05))
+
+def test_encoder_similarity_extends_eligibility_to_close_technologies():
+    skills = np.eye(3, dtype=np.float32)
+    # The mentioned technology sits at cosine 0.7 from its closest skill; "close" at 0.8, "far" at 0.6
+    techs = np.array([[0.7, 0.7, 0], [0.8, 0.6, 0], [0.6, 0.5, 0.6], [0, 0, 0]], dtype=np.float32)
+    args = (["Role"], ["mentioned", "close", "far", "unrelated"], ["a", "b", "c"])
+    arrays = (np.ones((1, 3), dtype=np.float32), techs, skills, np.ones((1, 4), dtype=np.float32),
+              np.array([1, 0, 0, 0], dtype=np.float32), {})
+    assert EmergingTechIndex(*args, "lexical", *arrays).eligible.tolist() == [True, False, False, False]
+    assert EmergingTechIndex(*args, "encoder", *arrays).eligible.tolist() == [True, True, False, False]
@@ -0,0 +1,13 @@
+import pytest
+
+HeadNounPhraseDetector = pytest.importorskip("advanced_skill_extractor").HeadNounPhraseDetector
+
+def test_dotted_names_stay_whole():
+    detector = HeadNounPhraseDetector()
+    assert detector.detect("Built dashboards with the React.js framework.") == ["react.js framework"]
+    assert detector.detect("ASP.NET Core framework and Vue.js tools") == ["asp.net core framework", "vue.js tools"]
+
+def test_sentence_dots_still_break_phrases():
+    detector = HeadNounPhraseDetector()
+    assert detector.detect("I know Django. Testing tools") == ["testing tools"]
+    assert detector.detect("Python. Framework") == []
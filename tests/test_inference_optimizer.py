@@ -0,0 +1,33 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+inference_optimizer = pytest.importorskip("inference_optimizer")
+TracedSentenceEncoder = inference_optimizer.TracedSentenceEncoder
+
+class WordTokenizer:
+    """One id per word plus [CLS]/[SEP], like a BERT tokenizer"""
+    def __call__(self, sentences, padding=None, truncation=False, max_length=None, return_tensors=None):
+        ids = [[1] + [2] * len(s.split()) + [3] for s in sentences]
+        if truncation:
+            ids = [row[:max_length] for row in ids]
+        if padding != "max_length":
+            return {"input_ids": ids}
+        mask = [[1] * len(row) + [0] * (max_length - len(row)) for row in ids]
+        ids = [row + [0] * (max_length - len(row)) for row in ids]
+        return {"input_ids": torch.tensor(ids), "attention_mask": torch.tensor(mask)}
+
+def bucket_module(length):
+    def forward(input_ids, attention_mask):
+        assert input_ids.shape == (4, length)  # traced shapes never change
+        return torch.stack([torch.full((4,), float(length)), attention_mask.sum(1).float()], dim=1)
+    return forward
+
+def test_sentences_route_to_the_smallest_bucket_that_fits():
+    encoder = TracedSentenceEncoder({length: bucket_module(length) for length in (8, 4, 16)}, WordTokenizer(), batch_size=4)
+    sentences = ["python", "a b c d e", "one two", "w " * 30, "x y z", "p q", "r", "s"]
+    embeddings = encoder.encode(sentences)
+    assert embeddings[:, 0].tolist() == [4, 8, 4, 16, 8, 4, 4, 4]
+    # Real tokens only (padding rows are dropped); the longest sentence is truncated at the largest bucket
+    assert embeddings[:, 1].tolist() == [3, 7, 4, 16, 5, 4, 3, 3]
+    assert encoder.encode("python").tolist() == [4, 3]
+    assert encoder.encode([]).shape == (0, 2)
@@ -0,0 +1,38 @@
+import io
+import json
+import re
+import zipfile
+
+from report_builder import render_report, write_cohort_zip
+
+RESULTS = {
+    "overall_score": 72.5, "skill_match_score": 64.0, "content_quality_score": 70.0,
+    "experience_score": 55.0, "presentation_score": 80.0,
+    "found_skills": ["python", "sql"], "missing_skills": ["docker", "kubernetes"],
+    "word_count": 420, "project_count": 2, "has_projects": True, "has_internship": False,
+}
+
+def test_json_report_parses():
+    report = json.loads(render_report(RESULTS, "Software Engineer", "json"))
+    assert report["format"] == "job-bridge-report"
+    assert report["blocks"] and all("type" in block for block in report["blocks"])
+
+def test_pdf_xref_points_at_objects():
+    pdf = render_report(RESULTS, "Software Engineer", "pdf")
+    assert pdf.startswith(b"%PDF-1.4") and pdf.rstrip().endswith(b"%%EOF")
+    xref_offset = int(re.search(rb"startxref\n(\d+)\n", pdf).group(1))
+    assert pdf[xref_offset:].startswith(b"xref\n")
+    count = int(re.match(rb"xref\n0 (\d+)\n", pdf[xref_offset:]).group(1))
+    entries = re.findall(rb"(\d{10}) 00000 n \n", pdf[xref_offset:])
+    assert len(entries) == count - 1
+    for obj_id, offset in enumerate(entries, start=1):
+        assert pdf[int(offset):].startswith(f"{obj_id} 0 obj\n".encode())
+
+def test_cohort_zip_has_one_member_per_student():
+    records = [dict(RESULTS, student_id=student_id) for student_id in ("a b", "a/b", "A_B", "a_b_2", "c")]
+    records.append(dict(RESULTS))
+    buffer = io.BytesIO()
+    assert write_cohort_zip(records, buffer, formats=("txt", "json")) == len(records)
+    names = zipfile.ZipFile(buffer).namelist()
+    assert len(names) == len(set(names)) == 2 * len(records)
+    assert {name.rsplit(".", 1)[0] for name in names} == {"a_b", "a_b_2", "A_B_3", "a_b_2_2", "c", "student_5"}
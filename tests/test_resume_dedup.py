@@ -0,0 +1,25 @@
+from resume_dedup import DedupIndex, dedup_analyze
+
+RESUME_A = "python developer with django flask rest apis postgres docker and aws experience building web services " * 3
+RESUME_B = "embedded engineer working on iot firmware in c with rtos can bus and edge computing deployments " * 3
+
+def fake_analyze(tasks):
+    # Completion order differs from submission order, as with the worker pool
+    for student_id, text, role in reversed(tasks):
+        yield {"student_id": student_id, "target_role": role, "found_skills": sorted(set(text.split()))[:3]}
+
+def test_duplicate_student_ids_across_clusters():
+    tasks = [("s1", RESUME_A, "Software Engineer"), ("s1", RESUME_B, "Software Engineer"),
+             ("s2", RESUME_A + " extra", "Software Engineer")]
+    records = list(dedup_analyze(tasks, fake_analyze, DedupIndex(0.8)))
+    assert len(records) == 3
+    assert sorted(r["student_id"] for r in records) == ["s1", "s1", "s2"]
+    by_cluster = {}
+    for record in records:
+        by_cluster.setdefault(record["dedup_cluster"], []).append(record)
+    assert len(by_cluster) == 2
+    reused = [r for r in records if "duplicate_of" in r]
+    assert len(reused) == 1 and reused[0]["student_id"] == "s2" and reused[0]["duplicate_of"] == "s1"
+    # The reused record shares the cluster of s1's first resume, not the second one
+    original = next(r for r in records if r["student_id"] == "s1" and r["dedup_cluster"] == reused[0]["dedup_cluster"])
+    assert "duplicate_of" not in original
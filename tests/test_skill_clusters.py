@@ -0,0 +1,15 @@
+import numpy as np
+
+from skill_clusters import SkillClusterIndex
+
+def make_index(vocabulary):
+    return SkillClusterIndex(vocabulary, np.array([0, 1, 0]), np.eye(2, 3, dtype=np.float32),
+                             np.zeros(3, dtype=np.float32), np.ones(3, dtype=np.float32), ["python", "docker"])
+
+def test_load_rejects_an_index_fitted_over_another_vocabulary(tmp_path):
+    paths = str(tmp_path / "clusters.npz"), str(tmp_path / "clusters.json")
+    make_index(["python", "docker", "sql"]).save(*paths)
+    loaded = SkillClusterIndex.load(*paths, vocabulary=["python", "docker", "sql"])
+    assert loaded.assign(["python", "sql", "docker"]) == {0: ["python", "sql"], 1: ["docker"]}
+    assert SkillClusterIndex.load(*paths, vocabulary=["python", "docker", "sql", "rust"]) is None
+    assert SkillClusterIndex.load(str(tmp_path / "missing.npz"), paths[1]) is None
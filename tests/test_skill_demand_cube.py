@@ -0,0 +1,68 @@
+import pandas as pd
+
+from skill_demand_cube import DIMENSIONS, SkillDemandCube
+
+def postings(rows):
+    return pd.DataFrame(rows, columns=["title", "skills", "demand_level", "category", "location", "year"])
+
+FIRST = postings([
+    ("Data Scientist", "python,sql", "high", "AI/ML", "India", 2024),
+    ("Data Scientist", "python,statistics", "emerging", "AI/ML", "Remote", 2025),
+    ("DevOps Engineer", "docker,python", "high", "Cloud", "India", 2025),
+])
+SECOND = postings([
+    ("Data Scientist", "python,pandas", "emerging", "AI/ML", "India", 2025),
+    ("DevOps Engineer", "docker,kubernetes", "high", "Cloud", "Remote", 2025),
+])
+
+def test_incremental_rollups_match_a_rebuild():
+    cube = SkillDemandCube().add_postings(FIRST)
+    # Materialize roll-ups over no, one and several dimensions before the update
+    keeps = [(), ("year",), ("year", "location"), ("location", "role", "demand_level")]
+    for keep in keeps:
+        cube._rollup(keep)
+    # Only existing labels, so the materialized roll-ups are updated in place
+    extra = postings([("Data Scientist", "python", "high", "AI/ML", "India", 2024)])
+    cube.add_postings(extra)
+    assert set(cube._rollups) == set(keeps)
+    rebuilt = SkillDemandCube().add_postings(pd.concat([FIRST, extra]))
+    for keep in keeps:
+        rollup, expected = cube._rollup(keep), rebuilt._rollup(keep)
+        assert (rollup.keys == expected.keys).all() and (rollup.counts == expected.counts).all()
+        assert rollup.spans == expected.spans and rollup.totals == expected.totals
+
+def test_slices_after_new_labels():
+    cube = SkillDemandCube().add_postings(FIRST)
+    assert cube.slice(year=2025)[1] == 2
+    cube.add_postings(SECOND)
+    assert cube.slice(year=2025)[1] == 4
+    assert cube.skill_count("python") == 4
+    assert cube.skill_count("docker", location="Remote") == 1
+    assert cube.top_skills(1, role="Data Scientist") == [("python", 3)]
+    assert cube.breakdown("docker", "location") == {"India": 1, "Remote": 1}
+    # One row per non-empty (labels..., skill) cell; repeated postings only raise counts
+    assert cube.cells.shape == (10, len(DIMENSIONS) + 1)
+    cube.add_postings(SECOND)
+    assert cube.cells.shape == (10, len(DIMENSIONS) + 1) and cube.cell_counts.sum() == 14
+
+def test_demand_tiers_and_emerging_skills():
+    cube = SkillDemandCube().add_postings(pd.concat([FIRST, SECOND]))
+    # python 4, docker 2, the rest 1: quartiles of [4, 2, 1, 1, 1, 1] are 1.75 and 1
+    assert cube.demand_tiers() == {"python": "high", "docker": "high", "sql": "medium", "statistics": "medium",
+                                   "pandas": "medium", "kubernetes": "medium"}
+    assert cube.demand_tiers(location="Remote") == {"python": "high", "statistics": "high", "docker": "high",
+                                                    "kubernetes": "high"}
+    assert cube.demand_tiers(location="Mars") == {}
+    # python is emerging in 2 of its 4 postings, statistics and pandas in their only one
+    assert cube.emerging_skills() == ["python", "statistics", "pandas"]
+    assert cube.emerging_skills(min_share=0.6) == ["statistics", "pandas"]
+    assert cube.emerging_skills(role="DevOps Engineer") == []
+
+def test_save_and_load_round_trip(tmp_path):
+    cube = SkillDemandCube().add_postings(pd.concat([FIRST, SECOND]))
+    paths = str(tmp_path / "cube.npz"), str(tmp_path / "cube.json")
+    cube.save(*paths)
+    loaded = SkillDemandCube.load(*paths)
+    for filters in ({}, {"year": 2025}, {"role": "Data Scientist", "location": "India"}):
+        assert (loaded.slice(**filters)[0] == cube.slice(**filters)[0]).all()
+        assert loaded.slice(**filters)[1] == cube.slice(**filters)[1]
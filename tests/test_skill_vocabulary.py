@@ -0,0 +1,17 @@
+import numpy as np
+
+from skill_vocabulary import SkillVocabulary
+
+def test_missing_does_not_grow_the_vocabulary():
+    vocabulary = SkillVocabulary(["python", "sql", "docker"])
+    assert vocabulary.missing(["Python", "docker", "rust", "ml"], ["py", "rust", "excel", "cobol"]) == ["docker", "machine learning"]
+    assert len(vocabulary) == 3
+
+def test_query_bitsets_ignore_unknown_skills():
+    vocabulary = SkillVocabulary(["python", "sql"])
+    bits = vocabulary.bitset(["sql", "haskell"])
+    assert vocabulary.names(vocabulary.bitset_to_ids(bits)) == ["sql"]
+    matrix = vocabulary.bitset_matrix([["python", "go"], ["elixir"]])
+    assert matrix.shape == (2, 1) and matrix[1].sum() == 0
+    assert len(vocabulary) == 2
+    assert vocabulary.contains(bits, np.array([0, 1])).tolist() == [False, True]
@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+import stage_executor
+from stage_executor import StageError, StageGraph
+
+def test_inline_only_graph_runs_serially_without_a_pool(monkeypatch):
+    monkeypatch.setattr(stage_executor, "ThreadPoolExecutor", None)
+    caller = threading.current_thread()
+    graph = StageGraph()
+    graph.add("a", lambda: threading.current_thread(), inline=True)
+    graph.add("b", lambda a: (a, threading.current_thread()), ["a"], inline=True)
+    seen = []
+    results = graph.run({"x": 1}, on_result=lambda name, _: seen.append(name))
+    assert results["a"] is caller and results["b"] == (caller, caller)
+    assert results["x"] == 1 and seen == ["a", "b"]
+
+def test_pooled_stage_overlaps_inline_work():
+    started = threading.Event()
+    graph = StageGraph()
+    graph.add("model", lambda: started.set() or threading.current_thread().name)
+    # Only returns once the pooled stage has started, i.e. the two overlap
+    graph.add("keywords", lambda: started.wait(5), inline=True)
+    graph.add("combined", lambda model, keywords: (model, keywords), ["model", "keywords"], inline=True)
+    model_thread, overlapped = graph.run()["combined"]
+    assert model_thread.startswith("stage") and overlapped
+
+def test_inline_failure_is_reported_as_stage_error():
+    graph = StageGraph()
+    graph.add("ok", lambda: 1)
+    graph.add("bad", lambda: 1 / 0, inline=True)
+    with pytest.raises(StageError) as info:
+        graph.run()
+    assert info.value.stage == "bad" and isinstance(info.value.error, ZeroDivisionError)
+
+def test_cycles_are_rejected():
+    graph = StageGraph().add("a", lambda b: b, ["b"], inline=True).add("b", lambda a: a, ["a"])
+    with pytest.raises(ValueError):
+        graph.run()